@@ -12,10 +12,8 @@ RED='\033[0;31m'
 BLUE='\033[0;34m'
 NC='\033[0m' # No Color
 
-# main_md.py를 main.py로 복사 (Material Design 버전 사용)
-echo -e "${BLUE}📝 Material Design 버전으로 빌드합니다...${NC}"
-cp main_md.py main.py
-echo -e "${GREEN}✅ main_md.py -> main.py 복사 완료${NC}"
+# UI는 main.py 하나만 유지 (main_md.py는 main.py를 실행하는 런처)
+echo -e "${BLUE}📝 Material Design 버전(main.py)으로 빌드합니다...${NC}"
 echo ""
 
 # Buildozer 설치 확인
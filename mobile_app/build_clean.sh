@@ -24,13 +24,10 @@ export CMAKE_ARGS="-DCMAKE_POLICY_VERSION_MINIMUM=3.5"
 echo "✅ CMAKE_ARGS: $CMAKE_ARGS"
 echo ""
 
-# Material Design 버전을 main.py로 복사
-echo "📋 Material Design 버전으로 설정 중..."
-if [ -f "main_md.py" ]; then
-    cp main_md.py main.py
-    echo "✅ main_md.py -> main.py 복사 완료"
-else
-    echo "❌ main_md.py 파일을 찾을 수 없습니다"
+# UI는 main.py 하나만 유지 (main_md.py는 main.py를 실행하는 런처)
+echo "📋 Material Design 버전(main.py) 확인 중..."
+if [ ! -f "main.py" ]; then
+    echo "❌ main.py 파일을 찾을 수 없습니다"
     exit 1
 fi
 echo ""
@@ -25,7 +25,7 @@ source.include_exts = py,png,jpg,kv,atlas
 version = 1.0.1
 
 # Requirements (Android-compatible packages only)
-requirements = python3,kivy==2.3.0,kivymd==1.1.1,requests,pillow
+requirements = python3,kivy==2.3.0,kivymd==1.1.1,requests,pillow,sqlite3
 
 # Orientation (landscape, portrait, all)
 orientation = portrait
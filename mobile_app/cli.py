@@ -0,0 +1,142 @@
+"""
+SDK Auto Tester - Headless command-line runner.
+Drives core.test_runner.TestRunner without Kivy. Progress is streamed to
+stdout as NDJSON (one JSON object per line); the final result is written
+as JSON to --output, or emitted as a last {"event": "result"} line.
+
+Examples:
+    python cli.py --device AA:BB:CC:DD:EE:FF --read --notify
+    python cli.py --simulate --read --output result.json
+    time python cli.py --simulate --packet-monitoring --target-packets 600
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from core.test_runner import TestRunner
+
+SUITES = ['read', 'writeget', 'notify', 'packet_monitoring', 'stress']
+DEFAULT_SUITES = ['read', 'writeget', 'notify']
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Run SDK Auto Tester BLE suites without the Kivy UI.")
+    parser.add_argument('--device', help="BLE MAC address (AA:BB:CC:DD:EE:FF)")
+    parser.add_argument('--name', help="Human-readable device name")
+    parser.add_argument('--simulate', action='store_true',
+                        help="Use the in-process simulated BLE backend "
+                             "(implies --no-history; latency stats are not saved)")
+
+    suites = parser.add_argument_group('suites (default: read, writeget, notify)')
+    for suite in SUITES:
+        suites.add_argument(f"--{suite.replace('_', '-')}", dest=suite,
+                            action='store_true')
+
+    parser.add_argument('--target-packets', type=int, default=60)
+    parser.add_argument('--stress-iterations', type=int,
+                        help="Stress cycles (default: 100, or no limit with "
+                             "--stress-minutes)")
+    parser.add_argument('--stress-minutes', type=float, default=0)
+    parser.add_argument('--stress-interval', type=float, default=0)
+    parser.add_argument('--sample-interval', type=float, default=5,
+                        help="RSSI/battery sampling period during packet "
+                             "monitoring in seconds (0 disables)")
+    parser.add_argument('--no-adaptive-timeouts', action='store_true',
+                        help="Use the fixed default timeouts")
+    parser.add_argument('--no-history', action='store_true',
+                        help="Don't store this run in the SQLite run history")
+    parser.add_argument('--serve', type=int, metavar='PORT',
+                        help="Also broadcast progress over HTTP/WebSocket on PORT")
+    parser.add_argument('--output', '-o',
+                        help="Write the final result JSON to this file")
+    parser.add_argument('--jsonl',
+                        help="Stream test records to this JSON-lines file "
+                             "(default: results/<run_id>.jsonl in the app dir)")
+    args = parser.parse_args(argv)
+
+    if args.simulate and not args.device:
+        args.device = 'SI:MU:LA:TE:D0:01'
+    if not args.device:
+        parser.error("--device is required unless --simulate is given")
+    return args
+
+
+def build_config(args):
+    """Translate CLI flags into the TestRunner config dict."""
+    selected = [s for s in SUITES if getattr(args, s)] or DEFAULT_SUITES
+    config = {
+        'device_address': args.device,
+        'device_name': args.name or args.device,
+        'target_packets': args.target_packets,
+        'stress_iterations': args.stress_iterations,
+        'stress_minutes': args.stress_minutes,
+        'stress_interval': args.stress_interval,
+        'sample_interval': args.sample_interval,
+        'adaptive_timeouts': not args.no_adaptive_timeouts,
+        'simulate': args.simulate,
+        'results_path': args.jsonl,
+        'save_history': not (args.no_history or args.simulate),
+    }
+    for suite in SUITES:
+        config[suite] = suite in selected
+    return config
+
+
+def _emit(obj):
+    sys.stdout.write(json.dumps(obj, separators=(',', ':')) + '\n')
+    sys.stdout.flush()
+
+
+def main(argv=None):
+    """Run the suites; exit 0 if all passed, 1 on failures, 2 on error."""
+    args = parse_args(argv)
+    started = time.monotonic()
+
+    server = None
+    if args.serve:
+        from core.progress_server import ProgressServer   # asyncio: only with --serve
+        server = ProgressServer(port=args.serve)
+        server.start()
+        sys.stderr.write(f"Serving progress on {server.url}\n")
+
+    def on_progress(status, progress, log):
+        _emit({'event': 'progress',
+               't': round(time.monotonic() - started, 3),
+               'status': status, 'progress': progress, 'log': log})
+        if server:
+            server.progress(status, progress, log)
+
+    runner = TestRunner(build_config(args), on_progress)
+    if server:
+        server.attach(runner)
+    thread = threading.Thread(target=runner.run, daemon=True)
+    thread.start()
+    try:
+        while thread.is_alive():
+            thread.join(0.2)
+    except KeyboardInterrupt:
+        runner.cancel()
+        thread.join()
+
+    result = runner.get_result()
+    if server:
+        server.stop()
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(result.to_dict(), f, indent=2)
+    else:
+        _emit({'event': 'result', 'result': result.to_dict()})
+
+    if result.error:
+        return 2
+    return 1 if result.failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
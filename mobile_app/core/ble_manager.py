@@ -4,6 +4,7 @@ Uses Android BluetoothGatt API via jnius (no dependency on external apps).
 GATT callbacks are handled by a pure-Java GattCallbackHelper (no PythonJavaClass)
 to avoid Android background-thread ClassLoader issues.
 """
+import functools
 import os
 import time
 import threading
@@ -46,60 +47,178 @@ CMD_STOP    = bytes([0x04])
 CMD_RESET   = bytes([0x05])
 
 # ─── Android BLE setup ───────────────────────────────────────────────────────
-HAS_BLE = False
+# jnius class lookups are deferred to the first BLE use (see _load_android) so
+# importing this module costs nothing at app startup.
 _BLE_INIT_ERROR = "BLE is only available on Android"
+_jni = None             # namespace of resolved Java classes once loaded
+_jni_lock = threading.Lock()
 
-if IS_ANDROID:
+
+class _JavaClasses:
+    pass
+
+
+def _load_android():
+    """Resolve the jnius classes once; return the namespace or None."""
+    global _jni, _BLE_INIT_ERROR
+    if _jni is not None or not IS_ANDROID:
+        return _jni
+    with _jni_lock:
+        if _jni is not None:
+            return _jni
+        started = time.perf_counter()
+        try:
+            from jnius import autoclass, PythonJavaClass, java_method
+
+            j = _JavaClasses()
+            j.BluetoothAdapter = autoclass('android.bluetooth.BluetoothAdapter')
+            j.BluetoothDevice  = autoclass('android.bluetooth.BluetoothDevice')
+            j.BluetoothGattCharacteristic = autoclass(
+                'android.bluetooth.BluetoothGattCharacteristic')
+            # Pure-Java callback helper — no PythonJavaClass needed
+            j.GattCallbackHelper = autoclass(
+                'com.wellysis.sdkautotester.GattCallbackHelper')
+            j.UUID            = autoclass('java.util.UUID')
+            j.PythonActivity  = autoclass('org.kivy.android.PythonActivity')
+
+            class _LeScanCallback(PythonJavaClass):
+                """Java BluetoothAdapter.LeScanCallback for BLE device discovery."""
+                __javainterfaces__ = ['android/bluetooth/BluetoothAdapter$LeScanCallback']
+                __javacontext__ = 'app'
+
+                def __init__(self, on_device):
+                    super().__init__()
+                    self._on_device = on_device
+
+                @java_method('(Landroid/bluetooth/BluetoothDevice;I[B)V')
+                def onLeScan(self, device, rssi, scanRecord):
+                    name = device.getName() or ""
+                    address = device.getAddress() or ""
+                    if address:
+                        self._on_device(name, address, rssi)
+
+            j.LeScanCallback = _LeScanCallback
+            _jni = j
+            _dbg(f"jnius classes loaded in {(time.perf_counter() - started) * 1000:.0f} ms")
+        except Exception as e:
+            _BLE_INIT_ERROR = str(e)
+    return _jni
+
+
+def has_ble():
+    """Return True if the Android BLE classes are available (loads them)."""
+    return _load_android() is not None
+
+
+def detach_thread():
+    """Detach the calling worker thread from the JVM before it exits.
+
+    pyjnius attaches every thread that makes a Java call; a plain
+    threading.Thread that ends still attached can abort the app on Android.
+    Call from a finally block at the end of the thread's target.
+    """
+    if not IS_ANDROID:
+        return
     try:
-        from jnius import autoclass, PythonJavaClass, java_method
-
-        _BluetoothAdapter = autoclass('android.bluetooth.BluetoothAdapter')
-        _BluetoothDevice  = autoclass('android.bluetooth.BluetoothDevice')
-        _BluetoothGattCharacteristic = autoclass(
-            'android.bluetooth.BluetoothGattCharacteristic')
-        # Pure-Java callback helper — no PythonJavaClass needed
-        _GattCallbackHelper = autoclass(
-            'com.wellysis.sdkautotester.GattCallbackHelper')
-        _UUID            = autoclass('java.util.UUID')
-        _PythonActivity  = autoclass('org.kivy.android.PythonActivity')
-        HAS_BLE = True
-    except Exception as _e:
-        _BLE_INIT_ERROR = str(_e)
-
-
-if HAS_BLE:
-    class _LeScanCallback(PythonJavaClass):
-        """Java BluetoothAdapter.LeScanCallback for BLE device discovery."""
-        __javainterfaces__ = ['android/bluetooth/BluetoothAdapter$LeScanCallback']
-        __javacontext__ = 'app'
-
-        def __init__(self, on_device):
-            super().__init__()
-            self._on_device = on_device
-
-        @java_method('(Landroid/bluetooth/BluetoothDevice;I[B)V')
-        def onLeScan(self, device, rssi, scanRecord):
-            name = device.getName() or ""
-            address = device.getAddress() or ""
-            if address:
-                self._on_device(name, address)
+        import jnius
+        jnius.detach()
+    except Exception as e:
+        _dbg(f"jnius.detach failed: {e}")
 
 
-class BLEManager:
-    """Android BLE GATT manager. Call connect() before any read/write."""
+def __getattr__(name):
+    # Keep `from core.ble_manager import HAS_BLE` working, resolved lazily.
+    if name == 'HAS_BLE':
+        return has_ble()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class Cancelled(RuntimeError):
+    """Raised from a BLEManager wait when its cancel token has been set."""
+
+
+class CancelToken:
+    """Thread-safe cancellation flag observed by every blocking BLEManager wait.
+
+    cancel() may be called from any thread; waits return within milliseconds.
+    Hooks registered with on_cancel() run on the cancelling thread and are used
+    to wake waits that block inside Java (notification polling).
+    """
 
     def __init__(self):
+        self._event = threading.Event()
+        self._hooks = []
+        self.cancelled_at = None
+
+    def cancel(self):
+        if self._event.is_set():
+            return
+        self.cancelled_at = time.monotonic()
+        self._event.set()
+        for hook in list(self._hooks):
+            try:
+                hook()
+            except Exception:
+                pass
+
+    def is_set(self):
+        return self._event.is_set()
+
+    def wait(self, timeout):
+        """Sleep up to timeout seconds; return True early if cancelled."""
+        return self._event.wait(timeout)
+
+    def on_cancel(self, hook):
+        self._hooks.append(hook)
+
+    def raise_if_cancelled(self):
+        if self._event.is_set():
+            raise Cancelled("Cancelled")
+
+
+def _gatt_op(method):
+    """Serialize a GATT operation: Android allows one outstanding at a time."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._gatt_lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+class BLEManager:
+    """Android BLE GATT manager. Call connect() before any read/write.
+
+    If a latency recorder (LatencyStats) is given, the duration of every
+    successful connect/read/write/RSSI read is recorded into it, plus the
+    time from a notification subscribe to its first packet. All
+    blocking waits observe cancel_token and raise Cancelled once it is set;
+    teardown (disconnect) is left to the thread that owns the manager.
+
+    Reads, writes, RSSI reads and notification (un)subscribes share one
+    lock, so a background sampler thread can issue them safely alongside
+    the runner; read_notify only polls the notification queue and never
+    waits on it.
+    """
+
+    def __init__(self, latency=None, cancel_token=None):
         self._gatt = None
         self._cb   = None      # GattCallbackHelper (Java) — stores all GATT state
         self._scan_cb = None
-        self._adapter = _BluetoothAdapter.getDefaultAdapter() if HAS_BLE else None
+        self._subscribed_at = None   # enable_notify time until the first packet
+        self._gatt_lock = threading.RLock()
+        self._jni = _load_android()
+        self._adapter = (self._jni.BluetoothAdapter.getDefaultAdapter()
+                         if self._jni else None)
+        self.latency = latency
+        self.cancel_token = cancel_token or CancelToken()
+        self.cancel_token.on_cancel(self._wake_notify)
 
     # ── Device discovery ─────────────────────────────────────────────────────
 
     def scan_for_device(self, serial_keyword, timeout=10):
         """Scan for nearby BLE devices; return first (name, address) whose name
         contains serial_keyword, or None. Does NOT require pre-pairing."""
-        if not HAS_BLE or not self._adapter:
+        if not self._adapter:
             return None
         if not self._adapter.isEnabled():
             raise RuntimeError("Bluetooth is not enabled")
@@ -107,12 +226,12 @@ class BLEManager:
         found = threading.Event()
         result = [None]
 
-        def on_device(name, address):
+        def on_device(name, address, rssi):
             if serial_keyword.lower() in name.lower():
                 result[0] = (name, address)
                 found.set()
 
-        cb = _LeScanCallback(on_device)
+        cb = self._jni.LeScanCallback(on_device)
         self._scan_cb = cb
         self._adapter.startLeScan(cb)
         try:
@@ -123,49 +242,71 @@ class BLEManager:
 
         return result[0]
 
-    def get_bonded_devices(self):
-        """Return paired Bluetooth devices as list of (name, address) tuples."""
-        if not HAS_BLE or not self._adapter:
-            return []
+    def start_scan(self, on_advert):
+        """Start a continuous scan; on_advert(name, address, rssi) is called
+        from the Binder thread for every advertisement until stop_scan()."""
+        if not self._adapter:
+            raise RuntimeError(_BLE_INIT_ERROR)
+        if not self._adapter.isEnabled():
+            raise RuntimeError("Bluetooth is not enabled")
+        self.stop_scan()
+        self._scan_cb = self._jni.LeScanCallback(on_advert)
+        if not self._adapter.startLeScan(self._scan_cb):
+            self._scan_cb = None
+            raise RuntimeError("Could not start BLE scan")
+
+    def stop_scan(self):
+        if self._scan_cb is not None:
+            self._adapter.stopLeScan(self._scan_cb)
+            self._scan_cb = None
+
+    def iter_bonded_devices(self):
+        """Yield paired Bluetooth devices as (name, address) as they are read."""
+        if not self._adapter:
+            return
         bonded = self._adapter.getBondedDevices()
         if not bonded:
-            return []
-        result = []
+            return
         it = bonded.iterator()
         while it.hasNext():
             d = it.next()
-            result.append((d.getName() or "Unknown", d.getAddress()))
-        return result
+            yield (d.getName() or "Unknown", d.getAddress())
+
+    def get_bonded_devices(self):
+        """Return paired Bluetooth devices as list of (name, address) tuples."""
+        return list(self.iter_bonded_devices())
 
     def is_enabled(self):
         """Return True if Bluetooth is enabled."""
-        return bool(HAS_BLE and self._adapter and self._adapter.isEnabled())
+        return bool(self._adapter and self._adapter.isEnabled())
 
     # ── Connection ───────────────────────────────────────────────────────────
 
     def connect(self, address, timeout=15):
         """Connect to BLE device by MAC address (AA:BB:CC:DD:EE:FF)."""
-        if not HAS_BLE:
+        if not self._jni:
             raise RuntimeError(_BLE_INIT_ERROR)
         if not self._adapter.isEnabled():
             raise RuntimeError("Bluetooth is not enabled")
+        self.cancel_token.raise_if_cancelled()
 
-        activity = _PythonActivity.mActivity
+        started  = time.monotonic()
+        activity = self._jni.PythonActivity.mActivity
         device   = self._adapter.getRemoteDevice(address)
 
         # GattCallbackHelper extends BluetoothGattCallback directly in Java —
         # no PythonJavaClass / no classloader issues.
-        self._cb = _GattCallbackHelper()
+        self._cb = self._jni.GattCallbackHelper()
 
         _dbg(f"connectGatt → {address}")
         self._gatt = device.connectGatt(
-            activity, False, self._cb, _BluetoothDevice.TRANSPORT_LE)
+            activity, False, self._cb, self._jni.BluetoothDevice.TRANSPORT_LE)
         _dbg(f"connectGatt returned: {self._gatt}")
 
         # Wait for connection (state == 2 = STATE_CONNECTED)
         deadline = time.time() + timeout
         while self._cb.getConnectionState() != 2 and time.time() < deadline:
-            time.sleep(0.1)
+            self._sleep(0.1)
         _dbg(f"connectionState after wait: {self._cb.getConnectionState()}")
         if self._cb.getConnectionState() != 2:
             raise RuntimeError(f"Connection timeout ({address})")
@@ -173,10 +314,11 @@ class BLEManager:
         # Wait for service discovery
         deadline = time.time() + timeout
         while not self._cb.isServicesDiscovered() and time.time() < deadline:
-            time.sleep(0.1)
+            self._sleep(0.1)
         _dbg(f"servicesDiscovered: {self._cb.isServicesDiscovered()}")
         if not self._cb.isServicesDiscovered():
             raise RuntimeError("Service discovery timeout")
+        self._record('connect', started)
 
     def disconnect(self):
         """Disconnect and release GATT resources."""
@@ -192,27 +334,35 @@ class BLEManager:
                 self._cb is not None and
                 self._cb.getConnectionState() == 2)
 
+    def provides(self, svc_uuid):
+        """True if svc_uuid is configured (not a TODO placeholder) for this backend."""
+        return not svc_uuid.startswith('TODO_')
+
     # ── GATT read ────────────────────────────────────────────────────────────
 
+    @_gatt_op
     def read(self, svc_uuid, char_uuid, timeout=5):
         """Read a characteristic. Returns raw bytes."""
+        self.cancel_token.raise_if_cancelled()
         if not self.is_connected:
             raise RuntimeError("Not connected")
-        svc = self._gatt.getService(_UUID.fromString(svc_uuid))
+        svc = self._gatt.getService(self._jni.UUID.fromString(svc_uuid))
         if not svc:
             raise RuntimeError(f"Service not found: {svc_uuid}")
-        ch = svc.getCharacteristic(_UUID.fromString(char_uuid))
+        ch = svc.getCharacteristic(self._jni.UUID.fromString(char_uuid))
         if not ch:
             raise RuntimeError(f"Characteristic not found: {char_uuid}")
 
         self._cb.clearRead()
+        started = time.monotonic()
         self._gatt.readCharacteristic(ch)
 
         deadline = time.time() + timeout
         while not self._cb.isReadDone() and time.time() < deadline:
-            time.sleep(0.05)
+            self._sleep(0.05)
         if not self._cb.isReadDone():
             raise RuntimeError("Read timeout")
+        self._record('read', started)
 
         raw = self._cb.getReadValue()
         return bytes(raw) if raw else b''
@@ -226,68 +376,131 @@ class BLEManager:
         raw = self.read(svc_uuid, char_uuid, timeout)
         return raw[0] if raw else 0
 
+    @_gatt_op
+    def read_rssi(self, timeout=5):
+        """Read the link RSSI (dBm) via BluetoothGatt.readRemoteRssi."""
+        self.cancel_token.raise_if_cancelled()
+        if not self.is_connected:
+            raise RuntimeError("Not connected")
+        self._cb.clearRssi()
+        started = time.monotonic()
+        if not self._gatt.readRemoteRssi():
+            raise RuntimeError("readRemoteRssi rejected")
+
+        deadline = time.time() + timeout
+        while not self._cb.isRssiDone() and time.time() < deadline:
+            self._sleep(0.05)
+        if not self._cb.isRssiDone():
+            raise RuntimeError("RSSI read timeout")
+        if not self._cb.isRssiOk():
+            raise RuntimeError("RSSI read failed (GATT error)")
+        self._record('rssi', started)
+        return self._cb.getRssi()
+
     # ── GATT write ───────────────────────────────────────────────────────────
 
+    @_gatt_op
     def write(self, svc_uuid, char_uuid, value, timeout=5):
         """Write bytes to a characteristic."""
+        self.cancel_token.raise_if_cancelled()
         if not self.is_connected:
             raise RuntimeError("Not connected")
-        svc = self._gatt.getService(_UUID.fromString(svc_uuid))
+        svc = self._gatt.getService(self._jni.UUID.fromString(svc_uuid))
         if not svc:
             raise RuntimeError(f"Service not found: {svc_uuid}")
-        ch = svc.getCharacteristic(_UUID.fromString(char_uuid))
+        ch = svc.getCharacteristic(self._jni.UUID.fromString(char_uuid))
         if not ch:
             raise RuntimeError(f"Characteristic not found: {char_uuid}")
 
         ch.setValue(list(value))
         self._cb.clearWrite()
+        started = time.monotonic()
         self._gatt.writeCharacteristic(ch)
 
         deadline = time.time() + timeout
         while not self._cb.isWriteDone() and time.time() < deadline:
-            time.sleep(0.05)
+            self._sleep(0.05)
         if not self._cb.isWriteDone():
             raise RuntimeError("Write timeout")
         if not self._cb.isWriteOk():
             raise RuntimeError("Write failed (GATT error)")
+        self._record('write', started)
 
     # ── Notifications ────────────────────────────────────────────────────────
 
+    @_gatt_op
     def enable_notify(self, svc_uuid, char_uuid, callback=None):
         """Enable BLE notifications. callback is ignored (use read_notify to poll)."""
         if not self.is_connected:
             raise RuntimeError("Not connected")
-        svc = self._gatt.getService(_UUID.fromString(svc_uuid))
-        ch  = svc.getCharacteristic(_UUID.fromString(char_uuid))
+        svc = self._gatt.getService(self._jni.UUID.fromString(svc_uuid))
+        ch  = svc.getCharacteristic(self._jni.UUID.fromString(char_uuid))
         self._gatt.setCharacteristicNotification(ch, True)
         self._cb.clearNotify()
 
         CCCD = "00002902-0000-1000-8000-00805f9b34fb"
-        desc = ch.getDescriptor(_UUID.fromString(CCCD))
+        desc = ch.getDescriptor(self._jni.UUID.fromString(CCCD))
         if desc:
             desc.setValue([0x01, 0x00])
             self._gatt.writeDescriptor(desc)
-        time.sleep(0.2)
+        self._subscribed_at = time.monotonic()
+        self._sleep(0.2)
 
     def read_notify(self, timeout=5):
-        """Block up to timeout seconds for the next notification packet."""
+        """Block up to timeout seconds for the next notification packet.
+
+        Cancelling the token wakes the Java poll with an empty packet. Only
+        the first packet after enable_notify is recorded as 'notify'
+        latency; later waits are stream cadence, not link latency.
+        """
+        self.cancel_token.raise_if_cancelled()
         if not self.is_connected:
             raise RuntimeError("Not connected")
         raw = self._cb.pollNotify(int(timeout * 1000))
+        self.cancel_token.raise_if_cancelled()
+        if raw and self._subscribed_at is not None:
+            self._record('notify', self._subscribed_at)
+            self._subscribed_at = None
         return bytes(raw) if raw else b''
 
+    def clear_notify(self):
+        """Drop any notification packets queued but not yet read.
+
+        Also stops timing the first packet after subscribe: the caller is
+        restarting the stream on purpose (e.g. stress Start/Restart).
+        """
+        self._subscribed_at = None
+        if self._cb:
+            self._cb.clearNotify()
+
+    @_gatt_op
     def disable_notify(self, svc_uuid, char_uuid):
         """Disable BLE notifications."""
+        self._subscribed_at = None
         if not self.is_connected:
             return
-        svc = self._gatt.getService(_UUID.fromString(svc_uuid))
+        svc = self._gatt.getService(self._jni.UUID.fromString(svc_uuid))
         if svc:
-            ch = svc.getCharacteristic(_UUID.fromString(char_uuid))
+            ch = svc.getCharacteristic(self._jni.UUID.fromString(char_uuid))
             if ch:
                 self._gatt.setCharacteristicNotification(ch, False)
 
     # ── Helpers ──────────────────────────────────────────────────────────────
 
+    def _sleep(self, seconds):
+        """Cancellable sleep used by all polling loops."""
+        if self.cancel_token.wait(seconds):
+            raise Cancelled("Cancelled")
+
+    def _wake_notify(self):
+        cb = self._cb
+        if cb is not None:
+            cb.wakeNotify()
+
+    def _record(self, op, started):
+        if self.latency is not None:
+            self.latency.record(op, time.monotonic() - started)
+
     @staticmethod
     def _decode_str(raw):
         if not raw:
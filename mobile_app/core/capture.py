@@ -0,0 +1,63 @@
+"""
+Raw notification packet capture.
+
+Packets are appended to a binary file as they arrive, through a buffered
+writer, so a multi-hour capture never sits in memory.
+
+File layout:
+    MAGIC (8 bytes)
+    repeated records: <d H> (seconds since capture start, payload length)
+                      followed by the payload bytes
+"""
+import struct
+import time
+
+from .paths import app_file
+
+MAGIC = b'ECGCAP1\n'
+RECORD = struct.Struct('<dH')
+FORMAT = ("ECGCAP1: 8-byte magic, then records of little-endian float64 "
+          "seconds since capture start, uint16 payload length, payload bytes")
+
+
+class PacketCapture:
+    """Append-only capture file for one run."""
+
+    def __init__(self, path, buffering=64 * 1024):
+        self.path = path
+        self.packets = 0
+        self._start = time.monotonic()
+        self._f = open(path, 'wb', buffering=buffering)
+        self._f.write(MAGIC)
+
+    @classmethod
+    def for_run(cls, result, path=None):
+        """Open results/<run_id>.ecgcap (or path) and register it as an artifact."""
+        capture = cls(path or app_file('results', f'{result.run_id}.ecgcap'))
+        result.artifacts['capture'] = capture.path
+        return capture
+
+    def write(self, packet):
+        f = self._f
+        if f:
+            f.write(RECORD.pack(time.monotonic() - self._start, len(packet)))
+            f.write(packet)
+            self.packets += 1
+
+    def close(self):
+        if self._f:
+            self._f.close()
+            self._f = None
+
+
+def read_capture(path):
+    """Yield (seconds, payload) records from a capture file."""
+    with open(path, 'rb') as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"Not a packet capture: {path}")
+        while True:
+            head = f.read(RECORD.size)
+            if len(head) < RECORD.size:
+                return
+            t, size = RECORD.unpack(head)
+            yield t, f.read(size)
@@ -0,0 +1,107 @@
+"""
+Cached bonded-device list for HomeScreen.
+Enumeration runs on a worker thread and streams devices to the caller as they
+are read; the cached list is reused until a Bluetooth adapter-state or
+bond-state broadcast invalidates it.
+"""
+import threading
+
+from .ble_manager import BLEManager, IS_ANDROID, _dbg, detach_thread
+
+ACTION_STATE_CHANGED      = 'android.bluetooth.adapter.action.STATE_CHANGED'
+ACTION_BOND_STATE_CHANGED = 'android.bluetooth.device.action.BOND_STATE_CHANGED'
+
+
+class BondedDeviceCache:
+    """Bonded (name, address) list, refreshed off the calling thread.
+
+    refresh() returns immediately. on_device(name, address) is called for
+    every device and on_done(devices, error) once at the end — from the
+    worker thread, so UI callers must hop back to the main thread themselves.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._devices = None        # None = not loaded / invalidated
+        self._generation = 0
+        self._worker = None
+        self._receiver = None
+
+    @property
+    def devices(self):
+        with self._lock:
+            return list(self._devices or [])
+
+    @property
+    def is_valid(self):
+        return self._devices is not None
+
+    def invalidate(self):
+        with self._lock:
+            self._devices = None
+            self._generation += 1
+
+    def refresh(self, on_device, on_done, force=False):
+        """Deliver the bonded list, enumerating it on a worker if needed."""
+        if force:
+            self.invalidate()
+        with self._lock:
+            cached = self._devices
+            generation = self._generation
+        if cached is not None:
+            for name, address in cached:
+                on_device(name, address)
+            on_done(list(cached), None)
+            return
+
+        def work():
+            try:
+                found, error = [], None
+                try:
+                    for name, address in BLEManager().iter_bonded_devices():
+                        found.append((name, address))
+                        on_device(name, address)
+                except Exception as e:
+                    error = str(e)
+                with self._lock:
+                    # Don't cache a list that a broadcast invalidated mid-walk
+                    if error is None and generation == self._generation:
+                        self._devices = found
+                on_done(found, error)
+            finally:
+                detach_thread()
+
+        self._worker = threading.Thread(target=work, daemon=True)
+        self._worker.start()
+
+    # ── Invalidation on Bluetooth broadcasts ────────────────────────────────
+
+    def watch(self, on_change=None):
+        """Invalidate on adapter/bond state broadcasts (Android only).
+
+        on_change(action) is called after invalidation, from the receiver
+        thread. Returns True if the receiver was registered.
+        """
+        if not IS_ANDROID or self._receiver is not None:
+            return self._receiver is not None
+        try:
+            from android.broadcast import BroadcastReceiver
+        except Exception as e:
+            _dbg(f"BroadcastReceiver unavailable: {e}")
+            return False
+
+        def on_broadcast(context, intent):
+            action = intent.getAction()
+            self.invalidate()
+            if on_change:
+                on_change(action)
+
+        self._receiver = BroadcastReceiver(
+            on_broadcast, actions=[ACTION_STATE_CHANGED, ACTION_BOND_STATE_CHANGED])
+        self._receiver.start()
+        return True
+
+    def unwatch(self):
+        if self._receiver is not None:
+            self._receiver.stop()
+            self._receiver = None
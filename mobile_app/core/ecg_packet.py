@@ -0,0 +1,130 @@
+"""
+ECG notification packet layout, sample decoding and loss accounting.
+"""
+import sys
+from array import array
+from collections import deque
+
+# ─── Packet layout ───────────────────────────────────────────────────────────
+# Same header as parse_packet_number() in notebooks/remove_duplicate_packet:
+# every packet starts with its packet number as a little-endian uint32.
+SEQ_OFFSET     = 0
+SEQ_SIZE       = 4
+SEQ_MODULO     = 1 << (8 * SEQ_SIZE)
+SAMPLES_OFFSET = SEQ_OFFSET + SEQ_SIZE   # little-endian int16 ECG samples follow
+
+
+def sequence(packet):
+    """Return the packet counter, or None if the packet is too short."""
+    end = SEQ_OFFSET + SEQ_SIZE
+    if len(packet) < end:
+        return None
+    return int.from_bytes(packet[SEQ_OFFSET:end], 'little')
+
+
+def decode_samples(packet):
+    """Decode the ECG samples of one packet as an array of signed 16-bit ints."""
+    body = packet[SAMPLES_OFFSET:]
+    samples = array('h')
+    samples.frombytes(body[:len(body) - len(body) % 2])
+    if sys.byteorder == 'big':
+        samples.byteswap()
+    return samples
+
+
+class WaveformBuffer:
+    """Most recent raw ECG packets, decoded only when a preview is drawn.
+
+    push() is a single deque append so it adds nothing measurable to packet
+    intake on the runner thread; samples() runs on the UI thread.
+    """
+
+    def __init__(self, max_packets=256):
+        self._packets = deque(maxlen=max_packets)
+        self.pushed = 0
+
+    def push(self, packet):
+        self._packets.append(packet)
+        self.pushed += 1
+
+    def clear(self):
+        self._packets.clear()
+        self.pushed = 0
+
+    def samples(self, count):
+        """Return up to the newest count samples, oldest first."""
+        newest = []
+        total = 0
+        for packet in reversed(tuple(self._packets)):
+            chunk = decode_samples(packet)
+            newest.append(chunk)
+            total += len(chunk)
+            if total >= count:
+                break
+        out = array('h')
+        for chunk in reversed(newest):
+            out.extend(chunk)
+        return out[-count:] if len(out) > count else out
+
+
+def minmax_downsample(samples, columns):
+    """Reduce samples to at most `columns` (min, max) pairs, keeping peaks."""
+    n = len(samples)
+    if n == 0 or columns <= 0:
+        return []
+    if n <= columns:
+        return [(v, v) for v in samples]
+    out = []
+    step = n / columns
+    for c in range(columns):
+        chunk = samples[int(c * step):int((c + 1) * step)] or samples[int(c * step):int(c * step) + 1]
+        out.append((min(chunk), max(chunk)))
+    return out
+
+
+class LossCounter:
+    """Counts received vs. expected packets from sequence-number gaps.
+
+    A packet whose number is at or behind the newest one seen (a modular
+    gap of half the counter range or more) is a duplicate or a late,
+    reordered packet: it is counted in `duplicates` and changes neither
+    `received`, `lost` nor the newest number.
+    """
+
+    __slots__ = ('received', 'lost', 'duplicates', '_last')
+
+    def __init__(self):
+        self.received = 0
+        self.lost = 0
+        self.duplicates = 0
+        self._last = None
+
+    def feed(self, packet):
+        """Account for one packet.
+
+        Returns the number of packets missed before it, or None if it was a
+        duplicate / out-of-order packet.
+        """
+        seq = sequence(packet)
+        if seq is None:
+            self.received += 1
+            return 0
+        gap = 0
+        if self._last is not None:
+            gap = (seq - self._last - 1) % SEQ_MODULO
+            if gap >= SEQ_MODULO // 2:
+                self.duplicates += 1
+                return None
+            self.lost += gap
+        self.received += 1
+        self._last = seq
+        return gap
+
+    @property
+    def expected(self):
+        return self.received + self.lost
+
+    @property
+    def loss_rate(self):
+        """Fraction of expected packets that never arrived (0.0 - 1.0)."""
+        return self.lost / self.expected if self.expected else 0.0
@@ -0,0 +1,47 @@
+"""
+Run artifact export.
+
+Bundles one run's result JSON, metrics, packet capture, JSON-lines stream
+and log into a single deflate-compressed ZIP. Files already on disk are
+streamed into the archive in chunks by zipfile, so the archive is never
+built in memory regardless of capture length.
+"""
+import json
+import os
+import time
+import zipfile
+
+from .capture import FORMAT as CAPTURE_FORMAT
+from .paths import app_file
+
+# Archive names for RunResult.artifacts keys
+ARTIFACT_NAMES = {
+    'capture': 'packets.ecgcap',
+    'metrics': 'metrics.json',
+    'results_jsonl': 'results.jsonl',
+    'log': 'log.txt',
+}
+
+
+def export_run(result, path=None, compresslevel=6):
+    """Write the export archive for a RunResult; return its path."""
+    path = path or app_file('exports', f'sdkautotester_{result.run_id}.zip')
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = path + '.tmp'
+    manifest = {
+        'run_id': result.run_id,
+        'exported_at': time.time(),
+        'files': {'result.json': 'RunResult.to_dict()'},
+    }
+    with zipfile.ZipFile(tmp, 'w', zipfile.ZIP_DEFLATED,
+                         compresslevel=compresslevel) as zf:
+        zf.writestr('result.json', json.dumps(result.to_dict(), indent=1))
+        for key, src in result.artifacts.items():
+            if not src or not os.path.exists(src):
+                continue
+            name = ARTIFACT_NAMES.get(key, os.path.basename(src))
+            zf.write(src, name)
+            manifest['files'][name] = CAPTURE_FORMAT if key == 'capture' else key
+        zf.writestr('manifest.json', json.dumps(manifest, indent=1))
+    os.replace(tmp, path)
+    return path
@@ -0,0 +1,142 @@
+"""
+On-device run history in SQLite.
+
+Every finished TestRunner result is stored as one row in `runs` (summary
+columns plus the full result JSON). Queries never load the whole table:
+run lists are keyset-paged by (started_at, id) and per-firmware trends are
+aggregated in SQL.
+"""
+import json
+import sqlite3
+import threading
+
+from .paths import app_file
+
+HISTORY_FILE = 'history.db'
+PAGE_SIZE = 20
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id             INTEGER PRIMARY KEY,
+    run_id         TEXT UNIQUE NOT NULL,
+    started_at     REAL NOT NULL,
+    serial         TEXT,
+    device_address TEXT,
+    device_name    TEXT,
+    fw_version     TEXT,
+    passed         INTEGER NOT NULL,
+    failed         INTEGER NOT NULL,
+    error          TEXT,
+    duration_s     REAL,
+    packets        INTEGER,
+    lost           INTEGER,
+    throughput     REAL,
+    result_json    TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_runs_started ON runs (started_at, id);
+CREATE INDEX IF NOT EXISTS idx_runs_serial  ON runs (serial, started_at, id);
+CREATE INDEX IF NOT EXISTS idx_runs_fw      ON runs (fw_version, started_at, id);
+"""
+
+# Columns returned by page(); result_json is only read by get()
+_LIST_COLUMNS = ('id, run_id, started_at, serial, device_name, fw_version, '
+                 'passed, failed, error, duration_s, packets, lost, throughput')
+
+
+def _throughput(result):
+    """(packets, lost, packets/s) from the Packet Monitoring record, if any."""
+    record = result.get('Packet Monitoring')
+    if record is None:
+        return None, None, None
+    packets = record.values.get('packets')
+    rate = packets / record.duration if packets and record.duration else None
+    return packets, record.values.get('lost'), rate
+
+
+class RunHistory:
+    """SQLite store of past runs, safe to share between the runner and UI threads."""
+
+    def __init__(self, path=None):
+        self.path = path or app_file(HISTORY_FILE)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self._db.row_factory = sqlite3.Row
+        with self._lock, self._db:
+            self._db.execute('PRAGMA journal_mode=WAL')
+            self._db.executescript(_SCHEMA)
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+    def add(self, result):
+        """Store a finished RunResult (replacing a row with the same run_id)."""
+        packets, lost, rate = _throughput(result)
+        row = (
+            result.run_id, result.started_at, result.serial,
+            result.device_address, result.device_name, result.fw_version,
+            result.passed, result.failed, result.error,
+            round(result.duration, 3), packets, lost, rate,
+            json.dumps(result.to_dict(), separators=(',', ':')),
+        )
+        with self._lock, self._db:
+            self._db.execute(
+                'INSERT OR REPLACE INTO runs (run_id, started_at, serial, '
+                'device_address, device_name, fw_version, passed, failed, '
+                'error, duration_s, packets, lost, throughput, result_json) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)', row)
+
+    def page(self, cursor=None, limit=PAGE_SIZE, serial=None, fw_version=None):
+        """Return (rows, next_cursor), newest first.
+
+        cursor is the opaque value returned by the previous call (None for
+        the first page); next_cursor is None when there are no more rows.
+        """
+        where, args = [], []
+        if serial is not None:
+            where.append('serial = ?')
+            args.append(serial)
+        if fw_version is not None:
+            where.append('fw_version = ?')
+            args.append(fw_version)
+        if cursor is not None:
+            where.append('(started_at, id) < (?, ?)')
+            args.extend(cursor)
+        sql = f'SELECT {_LIST_COLUMNS} FROM runs'
+        if where:
+            sql += ' WHERE ' + ' AND '.join(where)
+        sql += ' ORDER BY started_at DESC, id DESC LIMIT ?'
+        args.append(limit + 1)
+
+        with self._lock:
+            rows = [dict(r) for r in self._db.execute(sql, args)]
+        more = len(rows) > limit
+        rows = rows[:limit]
+        next_cursor = (rows[-1]['started_at'], rows[-1]['id']) if more else None
+        return rows, next_cursor
+
+    def get(self, run_id):
+        """Return the full stored result dict for run_id, or None."""
+        with self._lock:
+            row = self._db.execute(
+                'SELECT result_json FROM runs WHERE run_id = ?', (run_id,)).fetchone()
+        return json.loads(row['result_json']) if row else None
+
+    def fw_trends(self, serial=None, limit=20):
+        """Per-firmware aggregates, most recently tested firmware first.
+
+        Each row: fw_version, runs, pass_rate (0..1 over all tests),
+        throughput (mean packets/s of runs that measured it), last_run.
+        """
+        sql = ('SELECT fw_version, COUNT(*) AS runs, '
+               'CAST(SUM(passed) AS REAL) / MAX(SUM(passed + failed), 1) AS pass_rate, '
+               'AVG(throughput) AS throughput, MAX(started_at) AS last_run '
+               'FROM runs')
+        args = []
+        if serial is not None:
+            sql += ' WHERE serial = ?'
+            args.append(serial)
+        sql += ' GROUP BY fw_version ORDER BY last_run DESC LIMIT ?'
+        args.append(limit)
+        with self._lock:
+            return [dict(r) for r in self._db.execute(sql, args)]
@@ -0,0 +1,108 @@
+"""
+Historical GATT latency per device and firmware, persisted as JSON.
+
+BLEManager records how long each operation took; TestRunner asks for a
+timeout derived from the history (p99 x safety factor, clamped) instead of
+the fixed defaults once enough samples have been collected.
+"""
+import json
+import os
+import threading
+
+from .paths import app_file
+from .stats import percentile
+
+STATS_FILE = 'latency_stats.json'
+
+MAX_SAMPLES = 200      # kept per (device, firmware, operation)
+MIN_SAMPLES = 20       # below this the caller's default timeout is used
+SAFETY_FACTOR = 3.0
+
+# (lower, upper) bound in seconds for each adaptive timeout
+BOUNDS = {
+    'connect': (3.0, 30.0),
+    'read':    (0.5, 10.0),
+    'rssi':    (0.5, 10.0),
+    'write':   (0.5, 10.0),
+    'notify':  (0.5, 10.0),
+}
+
+_UNKNOWN_FW = 'unknown'
+
+
+class LatencyStats:
+    """Per-device / per-firmware latency samples with adaptive timeouts."""
+
+    def __init__(self, path=None, safety_factor=SAFETY_FACTOR, persist=True):
+        """persist=False keeps samples in memory only (simulated runs)."""
+        self.persist = persist
+        self.path = path or (app_file(STATS_FILE) if persist else None)
+        self.safety_factor = safety_factor
+        self._lock = threading.Lock()
+        self._devices = {}
+        self._address = None
+        self._fw = _UNKNOWN_FW
+        if persist:
+            self.load()
+
+    # ── Persistence ──────────────────────────────────────────────────────────
+
+    def load(self):
+        """Load history from disk; a missing or corrupt file starts empty."""
+        try:
+            with open(self.path) as f:
+                self._devices = json.load(f).get('devices', {})
+        except (OSError, ValueError):
+            self._devices = {}
+
+    def save(self):
+        """Write history to disk atomically."""
+        if not self.persist:
+            return
+        with self._lock:
+            data = json.dumps({'version': 1, 'devices': self._devices})
+        tmp = self.path + '.tmp'
+        with open(tmp, 'w') as f:
+            f.write(data)
+        os.replace(tmp, self.path)
+
+    # ── Recording ────────────────────────────────────────────────────────────
+
+    def select(self, address, fw_version=None):
+        """Set the device (and firmware, once known) that samples belong to."""
+        self._address = address
+        self._fw = fw_version or _UNKNOWN_FW
+
+    def record(self, op, seconds):
+        """Record one successful operation latency for the selected device."""
+        if not self._address:
+            return
+        with self._lock:
+            ops = (self._devices.setdefault(self._address, {})
+                                .setdefault(self._fw, {}))
+            samples = ops.setdefault(op, [])
+            samples.append(round(seconds, 4))
+            if len(samples) > MAX_SAMPLES:
+                del samples[:len(samples) - MAX_SAMPLES]
+
+    # ── Timeouts ─────────────────────────────────────────────────────────────
+
+    def samples(self, op):
+        """Samples for the selected firmware, or for the whole device if too few."""
+        with self._lock:
+            by_fw = self._devices.get(self._address, {})
+            own = list(by_fw.get(self._fw, {}).get(op, []))
+            if len(own) >= MIN_SAMPLES:
+                return own
+            merged = []
+            for ops in by_fw.values():
+                merged.extend(ops.get(op, []))
+            return merged
+
+    def timeout(self, op, default):
+        """Return p99 x safety factor clamped to BOUNDS, or default if unlearned."""
+        samples = self.samples(op)
+        if len(samples) < MIN_SAMPLES:
+            return default
+        lo, hi = BOUNDS.get(op, (0.0, float('inf')))
+        return min(max(percentile(samples, 99) * self.safety_factor, lo), hi)
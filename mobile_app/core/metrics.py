@@ -0,0 +1,127 @@
+"""
+Live packet metrics for long runs.
+
+ThroughputMeter is fed once per notification packet by the runner thread and
+read by the UI at its own redraw rate. Per-second packet rate and loss rate
+go into BucketSeries, which keep a fixed number of min/max buckets: when full,
+neighbouring buckets are merged, so memory and drawing cost stay flat no
+matter how long the run is.
+"""
+import threading
+import time
+
+
+class BucketSeries:
+    """Fixed-size min/max downsampled time series."""
+
+    __slots__ = ('capacity', '_per_bucket', '_buckets')
+
+    def __init__(self, capacity=240):
+        self.capacity = capacity
+        self._per_bucket = 1
+        self._buckets = []      # [t_first, t_last, vmin, vmax, vsum, n]
+
+    def append(self, t, value):
+        last = self._buckets[-1] if self._buckets else None
+        if last is not None and last[5] < self._per_bucket:
+            last[1] = t
+            last[2] = min(last[2], value)
+            last[3] = max(last[3], value)
+            last[4] += value
+            last[5] += 1
+        else:
+            self._buckets.append([t, t, value, value, value, 1])
+            if len(self._buckets) > self.capacity:
+                self._compact()
+
+    def _compact(self):
+        merged = []
+        for i in range(0, len(self._buckets) - 1, 2):
+            a, b = self._buckets[i], self._buckets[i + 1]
+            merged.append([a[0], b[1], min(a[2], b[2]), max(a[3], b[3]),
+                           a[4] + b[4], a[5] + b[5]])
+        if len(self._buckets) % 2:
+            merged.append(self._buckets[-1])
+        self._buckets = merged
+        self._per_bucket *= 2
+
+    def points(self):
+        """Return [(t_mid, vmin, vmax, mean), ...] oldest first."""
+        return [((b[0] + b[1]) / 2, b[2], b[3], b[4] / b[5]) for b in self._buckets]
+
+    def clear(self):
+        self._per_bucket = 1
+        self._buckets = []
+
+    def __len__(self):
+        return len(self._buckets)
+
+
+class ThroughputMeter:
+    """Thread-safe packets/s and loss-rate meter with 1 s windows."""
+
+    def __init__(self, window=1.0, capacity=240):
+        self.window = window
+        self.rate = BucketSeries(capacity)
+        self.loss = BucketSeries(capacity)
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._start = time.monotonic()
+            self._win_start = self._start
+            self._win_received = 0
+            self._win_lost = 0
+            self._last_rate = 0.0
+            self._last_loss = 0.0
+            self.received = 0
+            self.lost = 0
+            self.rate.clear()
+            self.loss.clear()
+
+    def feed(self, lost=0):
+        """Account for one received packet and the packets missed before it."""
+        now = time.monotonic()
+        with self._lock:
+            if now - self._win_start >= self.window:
+                self._roll(now)
+            self._win_received += 1
+            self._win_lost += lost
+            self.received += 1
+            self.lost += lost
+
+    def snapshot(self):
+        """Close elapsed windows and return (rate points, loss points, totals)."""
+        with self._lock:
+            self._roll(time.monotonic())
+            totals = {
+                'received': self.received,
+                'lost': self.lost,
+                'elapsed': self._win_start - self._start,
+                'rate': self._last_rate,
+                'loss_rate': self._last_loss,
+            }
+            return self.rate.points(), self.loss.points(), totals
+
+    def _roll(self, now):
+        elapsed = now - self._win_start
+        if elapsed < self.window:
+            return
+        t = self._win_start - self._start
+        expected = self._win_received + self._win_lost
+        self._last_rate = self._win_received / self.window
+        self._last_loss = self._win_lost / expected if expected else 0.0
+        self.rate.append(t, self._last_rate)
+        self.loss.append(t, self._last_loss)
+
+        # Windows without any packet are recorded as a single zero point
+        # at the end of the gap instead of one point per second.
+        idle = int(elapsed // self.window) - 1
+        if idle > 0:
+            self.rate.append(t + idle * self.window, 0.0)
+            self.loss.append(t + idle * self.window, 0.0)
+            self._last_rate = 0.0
+        self._win_start += (idle + 1) * self.window
+        self._win_received = 0
+        self._win_lost = 0
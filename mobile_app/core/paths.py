@@ -0,0 +1,23 @@
+"""
+App-private storage locations.
+On Android files live in the app's internal files dir (readable via
+adb shell run-as); on a desktop they go under ~/.sdkautotester.
+"""
+import os
+
+IS_ANDROID = 'ANDROID_ARGUMENT' in os.environ or 'ANDROID_ROOT' in os.environ
+
+ANDROID_FILES_DIR = '/data/data/com.wellysis.sdkautotester/files'
+DESKTOP_FILES_DIR = os.path.join(os.path.expanduser('~'), '.sdkautotester')
+
+
+def files_dir():
+    """Return the directory used for app data files."""
+    return ANDROID_FILES_DIR if IS_ANDROID else DESKTOP_FILES_DIR
+
+
+def app_file(*parts):
+    """Return a path inside the app data dir, creating parent dirs as needed."""
+    path = os.path.join(files_dir(), *parts)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    return path
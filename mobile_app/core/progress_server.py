@@ -0,0 +1,298 @@
+"""
+Optional HTTP/WebSocket progress server for remote monitoring.
+
+Runs an asyncio loop on its own thread. TestRunner progress events and
+periodic metrics snapshots are published from any thread and fanned out to
+every connected WebSocket client. Each client has a bounded queue; when a
+slow client falls behind, its oldest events are dropped, so one stalled
+dashboard never holds up the others or the runner.
+
+Every route requires the random per-server token as ?token=... (the
+full URL, token included, is shown in the app log); other requests get 403.
+No CORS header is sent, so other web pages can't read the responses.
+
+Routes:
+    GET /        minimal live dashboard page
+    GET /status  latest run / progress / metrics as JSON
+    GET /ws      WebSocket stream of JSON events (text frames)
+"""
+import asyncio
+import base64
+import hashlib
+import hmac
+import json
+import secrets
+import socket
+import struct
+import threading
+import time
+from urllib.parse import parse_qs, urlsplit
+
+DEFAULT_PORT = 8765
+QUEUE_SIZE = 256           # events buffered per client before dropping the oldest
+_WS_GUID = '258EAFA5-E914-47DA-95CA-C5AB0DC85B11'
+
+_PAGE = """<!doctype html><html><head><meta charset="utf-8">
+<title>SDK Auto Tester</title></head><body style="font-family:monospace">
+<h3 id="status">connecting...</h3><div id="metrics"></div><pre id="log"></pre>
+<script>
+const ws = new WebSocket(`ws://${location.host}/ws${location.search}`);
+const log = document.getElementById('log');
+ws.onmessage = (m) => {
+  const e = JSON.parse(m.data);
+  if (e.event === 'progress') {
+    if (e.status) document.getElementById('status').textContent = `${e.status} (${e.progress}%)`;
+    if (e.log) log.textContent = (e.log + '\\n' + log.textContent).slice(0, 20000);
+  } else if (e.event === 'metrics') {
+    const t = e.totals;
+    document.getElementById('metrics').textContent =
+      `${t.rate.toFixed(1)} pkt/s  received ${t.received}  lost ${t.lost}`;
+  }
+};
+ws.onclose = () => { document.getElementById('status').textContent = 'disconnected'; };
+</script></body></html>"""
+
+
+def local_address():
+    """Best-effort LAN IP of this device (no packets are sent)."""
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+            s.connect(('10.255.255.255', 1))
+            return s.getsockname()[0]
+    except OSError:
+        return '127.0.0.1'
+
+
+def _frame(payload, opcode=0x1):
+    """Encode one unmasked server-to-client WebSocket frame."""
+    n = len(payload)
+    if n < 126:
+        head = struct.pack('!BB', 0x80 | opcode, n)
+    elif n < 1 << 16:
+        head = struct.pack('!BBH', 0x80 | opcode, 126, n)
+    else:
+        head = struct.pack('!BBQ', 0x80 | opcode, 127, n)
+    return head + payload
+
+
+class _Client:
+    __slots__ = ('queue', 'writer', 'dropped')
+
+    def __init__(self, writer, size):
+        self.queue = asyncio.Queue(maxsize=size)
+        self.writer = writer
+        self.dropped = 0
+
+
+class ProgressServer:
+    """Broadcasts progress events and metrics to WebSocket clients."""
+
+    def __init__(self, host='0.0.0.0', port=DEFAULT_PORT,
+                 queue_size=QUEUE_SIZE, metrics_interval=1.0, token=None):
+        self.host = host
+        self.port = port
+        self.token = token or secrets.token_urlsafe(12)
+        self.queue_size = queue_size
+        self.metrics_interval = metrics_interval
+        self._clients = set()
+        self._state = {}            # latest 'run', 'progress' and 'metrics' events
+        self._runner = None
+        self._loop = None
+        self._server = None
+        self._thread = None
+        self._ready = threading.Event()
+        self._error = None
+
+    # ── Lifecycle (any thread) ───────────────────────────────────────────────
+
+    def start(self):
+        """Start the server thread; raises OSError if the port can't be bound."""
+        if self._thread is not None:
+            return
+        self._ready.clear()
+        self._error = None
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        self._ready.wait(5)
+        if self._error is not None:
+            self._thread = None
+            raise self._error
+
+    def stop(self):
+        loop = self._loop
+        if loop is not None:
+            loop.call_soon_threadsafe(loop.stop)
+        if self._thread is not None:
+            self._thread.join(2)
+            self._thread = None
+
+    @property
+    def clients(self):
+        return len(self._clients)
+
+    @property
+    def url(self):
+        """Dashboard URL including the access token."""
+        return f'http://{local_address()}:{self.port}/?token={self.token}'
+
+    # ── Publishing (any thread) ──────────────────────────────────────────────
+
+    def attach(self, runner):
+        """Follow a TestRunner: announce the run and publish its metrics."""
+        self._runner = runner
+        self.publish(dict(event='run', **runner.result.header()))
+
+    def progress(self, status, progress, log):
+        """TestRunner callback signature; publishes one progress event."""
+        self.publish({'event': 'progress', 'status': status,
+                      'progress': progress, 'log': log})
+
+    def publish(self, event):
+        """Queue an event for every client. Never blocks."""
+        event['t'] = round(time.time(), 3)
+        if event['event'] != 'progress' or event.get('status'):
+            self._state[event['event']] = event
+        loop = self._loop
+        if loop is not None and self._clients:
+            text = json.dumps(event, separators=(',', ':'))
+            loop.call_soon_threadsafe(self._fanout, text)
+
+    # ── Event loop side ──────────────────────────────────────────────────────
+
+    def _run(self):
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            self._server = loop.run_until_complete(
+                asyncio.start_server(self._handle, self.host, self.port))
+        except OSError as e:
+            self._error = e
+            self._ready.set()
+            loop.close()
+            return
+        self._loop = loop
+        self._ready.set()
+        metrics_task = loop.create_task(self._publish_metrics())
+        try:
+            loop.run_forever()
+        finally:
+            self._loop = None
+            metrics_task.cancel()
+            self._server.close()
+            for client in list(self._clients):
+                client.writer.close()
+            loop.run_until_complete(asyncio.sleep(0))
+            loop.close()
+
+    def _fanout(self, text):
+        for client in self._clients:
+            if client.queue.full():
+                client.queue.get_nowait()       # drop the oldest for slow clients
+                client.dropped += 1
+            client.queue.put_nowait(text)
+
+    async def _publish_metrics(self):
+        last = None
+        while True:
+            await asyncio.sleep(self.metrics_interval)
+            runner = self._runner
+            if runner is None or not self._clients:
+                continue
+            rate, loss, totals = runner.metrics.snapshot()
+            counts = (runner.result.run_id, totals['received'], totals['lost'])
+            if counts != last and (totals['received'] or totals['lost']):
+                last = counts
+                self.publish({'event': 'metrics', 'run_id': runner.result.run_id,
+                              'totals': totals})
+
+    async def _handle(self, reader, writer):
+        try:
+            head = await asyncio.wait_for(reader.readuntil(b'\r\n\r\n'), 10)
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError,
+                asyncio.TimeoutError, ConnectionError):
+            writer.close()
+            return
+        lines = head.decode('latin-1').split('\r\n')
+        parts = lines[0].split()
+        target = urlsplit(parts[1] if len(parts) > 1 else '/')
+        path = target.path
+        token = parse_qs(target.query).get('token', [''])[0]
+        if not hmac.compare_digest(token, self.token):
+            await self._respond(writer, 'text/plain', b'forbidden', '403 Forbidden')
+            return
+        headers = {}
+        for line in lines[1:]:
+            if ':' in line:
+                key, value = line.split(':', 1)
+                headers[key.strip().lower()] = value.strip()
+
+        if path == '/ws' and headers.get('upgrade', '').lower() == 'websocket':
+            await self._websocket(reader, writer, headers.get('sec-websocket-key', ''))
+        elif path == '/status':
+            await self._respond(writer, 'application/json', json.dumps(
+                dict(self._state, clients=self.clients)).encode())
+        elif path == '/':
+            await self._respond(writer, 'text/html; charset=utf-8', _PAGE.encode())
+        else:
+            await self._respond(writer, 'text/plain', b'not found', '404 Not Found')
+
+    async def _respond(self, writer, ctype, body, status='200 OK'):
+        writer.write((f'HTTP/1.1 {status}\r\nContent-Type: {ctype}\r\n'
+                      f'Content-Length: {len(body)}\r\nConnection: close\r\n\r\n'
+                      ).encode() + body)
+        try:
+            await writer.drain()
+        except ConnectionError:
+            pass
+        writer.close()
+
+    async def _websocket(self, reader, writer, key):
+        accept = base64.b64encode(
+            hashlib.sha1((key + _WS_GUID).encode()).digest()).decode()
+        writer.write(('HTTP/1.1 101 Switching Protocols\r\n'
+                      'Upgrade: websocket\r\nConnection: Upgrade\r\n'
+                      f'Sec-WebSocket-Accept: {accept}\r\n\r\n').encode())
+        client = _Client(writer, self.queue_size)
+        # Late joiners first get the current state
+        for name in ('run', 'progress', 'metrics'):
+            if name in self._state:
+                client.queue.put_nowait(json.dumps(self._state[name], separators=(',', ':')))
+        self._clients.add(client)
+        sender = asyncio.ensure_future(self._send_loop(client))
+        try:
+            await self._read_loop(reader, writer)
+        finally:
+            self._clients.discard(client)
+            sender.cancel()
+            writer.close()
+
+    async def _send_loop(self, client):
+        try:
+            while True:
+                text = await client.queue.get()
+                client.writer.write(_frame(text.encode()))
+                await client.writer.drain()
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+
+    async def _read_loop(self, reader, writer):
+        """Handle client control frames until close or disconnect."""
+        try:
+            while True:
+                b1, b2 = await reader.readexactly(2)
+                opcode = b1 & 0x0F
+                n = b2 & 0x7F
+                if n == 126:
+                    n = struct.unpack('!H', await reader.readexactly(2))[0]
+                elif n == 127:
+                    n = struct.unpack('!Q', await reader.readexactly(8))[0]
+                mask = await reader.readexactly(4) if b2 & 0x80 else b'\0\0\0\0'
+                data = bytes(b ^ mask[i % 4] for i, b in enumerate(
+                    await reader.readexactly(n)))
+                if opcode == 0x8:           # close
+                    writer.write(_frame(data[:2], 0x8))
+                    return
+                if opcode == 0x9:           # ping
+                    writer.write(_frame(data, 0xA))
+        except (asyncio.IncompleteReadError, ConnectionError):
+            return
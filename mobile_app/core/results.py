@@ -0,0 +1,162 @@
+"""
+Structured test results.
+
+RunResult holds one TestRecord per executed test with monotonic start/end
+timestamps, attempts, error and measured values. When a ResultWriter is
+attached, every record is appended to a JSON-lines file as soon as the test
+finishes, so other tools can follow a run live.
+
+JSON-lines layout (one object per line):
+    {"type": "run", ...run header...}
+    {"type": "test", ...one per finished test...}
+    {"type": "summary", ...counts and run error...}
+"""
+import json
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from .paths import app_file
+
+
+def _dumps(obj):
+    return json.dumps(obj, separators=(',', ':'))
+
+
+@dataclass(slots=True)
+class TestRecord:
+    """Outcome of a single test."""
+    name: str
+    suite: str
+    passed: bool = False
+    started: float = 0.0          # time.monotonic()
+    ended: float = 0.0            # time.monotonic()
+    attempts: int = 1
+    error: Optional[str] = None
+    values: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def duration(self):
+        return max(self.ended - self.started, 0.0)
+
+    def to_dict(self):
+        return {
+            'name': self.name,
+            'suite': self.suite,
+            'passed': self.passed,
+            'started': round(self.started, 4),
+            'ended': round(self.ended, 4),
+            'duration_s': round(self.duration, 4),
+            'attempts': self.attempts,
+            'error': self.error,
+            'values': self.values,
+        }
+
+
+@dataclass(slots=True)
+class RunResult:
+    """All records of one TestRunner run."""
+    device_address: Optional[str] = None
+    device_name: Optional[str] = None
+    serial: Optional[str] = None
+    fw_version: Optional[str] = None
+    error: Optional[str] = None
+    run_id: str = field(default_factory=lambda: uuid.uuid4().hex[:12])
+    started_at: float = field(default_factory=time.time)        # wall clock
+    started: float = field(default_factory=time.monotonic)
+    ended: float = 0.0
+    tests: List[TestRecord] = field(default_factory=list)
+    artifacts: Dict[str, str] = field(default_factory=dict)    # name -> file path
+    writer: Optional['ResultWriter'] = None
+
+    @property
+    def passed(self):
+        return sum(1 for t in self.tests if t.passed)
+
+    @property
+    def failed(self):
+        return sum(1 for t in self.tests if not t.passed)
+
+    @property
+    def duration(self):
+        end = self.ended or time.monotonic()
+        return max(end - self.started, 0.0)
+
+    def get(self, name):
+        """Return the record for a test name, or None."""
+        for record in self.tests:
+            if record.name == name:
+                return record
+        return None
+
+    def add(self, record):
+        self.tests.append(record)
+        if self.writer:
+            self.writer.write_test(record)
+
+    def finish(self):
+        self.ended = time.monotonic()
+        if self.writer:
+            self.writer.write_summary(self)
+            self.writer.close()
+            self.writer = None
+
+    def header(self):
+        return {
+            'run_id': self.run_id,
+            'device_address': self.device_address,
+            'device_name': self.device_name,
+            'started_at': self.started_at,
+            'started': round(self.started, 4),
+        }
+
+    def summary(self):
+        return {
+            'run_id': self.run_id,
+            'serial': self.serial,
+            'fw_version': self.fw_version,
+            'error': self.error,
+            'passed': self.passed,
+            'failed': self.failed,
+            'duration_s': round(self.duration, 3),
+        }
+
+    def to_dict(self):
+        data = self.header()
+        data.update(self.summary())
+        data['tests'] = [t.to_dict() for t in self.tests]
+        data['artifacts'] = dict(self.artifacts)
+        return data
+
+
+class ResultWriter:
+    """Appends run/test/summary records to a JSON-lines file, one flush per line."""
+
+    def __init__(self, path):
+        self.path = path
+        self._f = open(path, 'a', encoding='utf-8')
+
+    @classmethod
+    def for_run(cls, result, path=None):
+        """Open a writer (default: results/<run_id>.jsonl) and write the header."""
+        writer = cls(path or app_file('results', f'{result.run_id}.jsonl'))
+        result.artifacts['results_jsonl'] = writer.path
+        writer._write(dict(type='run', **result.header()))
+        return writer
+
+    def write_test(self, record):
+        self._write(dict(type='test', **record.to_dict()))
+
+    def write_summary(self, result):
+        self._write(dict(type='summary', **result.summary()))
+
+    def close(self):
+        if self._f:
+            self._f.close()
+            self._f = None
+
+    def _write(self, obj):
+        if self._f:
+            self._f.write(_dumps(obj) + '\n')
+            self._f.flush()
@@ -0,0 +1,96 @@
+"""
+Low-frequency RSSI / battery sampler for long runs.
+
+Runs on its own thread next to packet monitoring. Every `interval` seconds
+it reads the link RSSI, and every `battery_every` ticks the battery level,
+through the BLEManager's serialized GATT operations, so it never overlaps
+another read/write. Notifications keep flowing in the meantime.
+"""
+import threading
+import time
+
+from .ble_manager import Cancelled, BATTERY_SVC, BATTERY_LEVEL, detach_thread
+
+
+def drain_per_hour(series):
+    """Least-squares battery slope of [(t_seconds, pct), ...] in %/hour.
+
+    Positive means the battery is draining. None with fewer than two
+    samples or no elapsed time.
+    """
+    n = len(series)
+    if n < 2:
+        return None
+    mean_t = sum(t for t, _ in series) / n
+    mean_v = sum(v for _, v in series) / n
+    var_t = sum((t - mean_t) ** 2 for t, _ in series)
+    if var_t <= 0:
+        return None
+    slope = sum((t - mean_t) * (v - mean_v) for t, v in series) / var_t
+    return -slope * 3600.0
+
+
+class DeviceSampler:
+    """Background RSSI/battery time series for one connected BLEManager."""
+
+    def __init__(self, ble, interval=5.0, battery_every=6, timeout=5):
+        self.ble = ble
+        self.interval = interval
+        self.battery_every = battery_every
+        self.timeout = timeout
+        self.rssi = []          # [(seconds since start, dBm)]
+        self.battery = []       # [(seconds since start, %)]
+        self.errors = 0
+        self._stop = threading.Event()
+        self._thread = None
+        self._started = 0.0
+
+    def start(self):
+        self._stop.clear()
+        self._started = time.monotonic()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(self.timeout + 1)
+            self._thread = None
+
+    def _run(self):
+        try:
+            tick = 0
+            while not self._stop.is_set():
+                try:
+                    if tick % self.battery_every == 0:
+                        self.battery.append((self._now(), self.ble.read_uint8(
+                            BATTERY_SVC, BATTERY_LEVEL, self.timeout)))
+                    self.rssi.append((self._now(), self.ble.read_rssi(self.timeout)))
+                except Cancelled:
+                    return
+                except Exception:
+                    self.errors += 1
+                tick += 1
+                self._stop.wait(self.interval)
+        finally:
+            detach_thread()     # the GATT calls above attached this thread
+
+    def _now(self):
+        return round(time.monotonic() - self._started, 3)
+
+    def summary(self):
+        """Values for the test record: aggregates plus the raw series."""
+        values = {'rssi_series': list(self.rssi),
+                  'battery_series': list(self.battery),
+                  'sampler_errors': self.errors}
+        if self.rssi:
+            dbm = [v for _, v in self.rssi]
+            values.update(rssi_mean=round(sum(dbm) / len(dbm), 1),
+                          rssi_min=min(dbm), rssi_max=max(dbm))
+        if self.battery:
+            drain = drain_per_hour(self.battery)
+            values.update(battery_start=self.battery[0][1],
+                          battery_end=self.battery[-1][1],
+                          battery_drain_pct_per_hour=(
+                              (round(drain, 2) or 0.0) if drain is not None else None))
+        return values
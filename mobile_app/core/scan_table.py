@@ -0,0 +1,94 @@
+"""
+Table of nearby BLE advertisers for continuous scanning.
+observe() is called from the scan callback thread for every advertisement
+and only updates one dict entry; readers take a sorted snapshot at their own
+pace, which also drops devices not seen within the TTL.
+"""
+import threading
+import time
+from dataclasses import dataclass
+
+DEFAULT_TTL = 10.0     # seconds without an advertisement before a device is dropped
+RSSI_ALPHA = 0.2       # EMA weight of a new RSSI reading
+RATE_ALPHA = 0.2       # EMA weight of a new advertising interval
+
+
+@dataclass(slots=True)
+class ScanEntry:
+    """One advertiser, with smoothed RSSI and advertising rate."""
+    address: str
+    name: str = ""
+    rssi: float = 0.0          # EMA (dBm)
+    last_rssi: int = 0
+    first_seen: float = 0.0    # time.monotonic()
+    last_seen: float = 0.0
+    count: int = 0
+    interval: float = 0.0      # EMA seconds between advertisements
+
+    @property
+    def rate(self):
+        """Advertisements per second (0 until two have been seen)."""
+        return 1.0 / self.interval if self.interval > 0 else 0.0
+
+
+class ScanTable:
+    """Deduplicated, TTL-expiring advertiser table. Thread-safe."""
+
+    def __init__(self, ttl=DEFAULT_TTL):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries = {}
+        self.version = 0           # bumped on every change; lets readers skip redraws
+        self.adverts = 0           # total advertisements observed
+
+    def observe(self, name, address, rssi, now=None):
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            self.adverts += 1
+            self.version += 1
+            e = self._entries.get(address)
+            if e is None:
+                self._entries[address] = ScanEntry(
+                    address, name, float(rssi), rssi, now, now, 1)
+                return
+            dt = now - e.last_seen
+            e.interval = dt if e.count == 1 else e.interval + RATE_ALPHA * (dt - e.interval)
+            e.rssi += RSSI_ALPHA * (rssi - e.rssi)
+            e.last_rssi = rssi
+            e.last_seen = now
+            e.count += 1
+            if name:
+                e.name = name
+
+    def expire(self, now=None):
+        """Drop entries older than the TTL; return how many were removed."""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            stale = [a for a, e in self._entries.items() if now - e.last_seen > self.ttl]
+            for address in stale:
+                del self._entries[address]
+            if stale:
+                self.version += 1
+        return len(stale)
+
+    def snapshot(self, keyword=None, now=None):
+        """Expire stale entries and return copies sorted by smoothed RSSI."""
+        self.expire(now)
+        with self._lock:
+            entries = [ScanEntry(e.address, e.name, e.rssi, e.last_rssi, e.first_seen,
+                                 e.last_seen, e.count, e.interval)
+                       for e in self._entries.values()]
+        if keyword:
+            keyword = keyword.lower()
+            entries = [e for e in entries
+                       if keyword in e.name.lower() or keyword in e.address.lower()]
+        entries.sort(key=lambda e: e.rssi, reverse=True)
+        return entries
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.version += 1
+
+    def __len__(self):
+        return len(self._entries)
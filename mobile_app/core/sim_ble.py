@@ -0,0 +1,164 @@
+"""
+Simulated BLE backend for desktop runs.
+Implements the BLEManager interface in-process with small fixed latencies,
+so TestRunner can be exercised (and profiled) without Android or a patch.
+"""
+import time
+import threading
+
+from .ble_manager import (
+    CancelToken, Cancelled,
+    BATTERY_LEVEL, MODEL_NUMBER, SERIAL_NUMBER,
+    FIRMWARE_REVISION, HARDWARE_REVISION, SOFTWARE_REVISION,
+    CMD_START, CMD_PAUSE, CMD_RESTART, CMD_STOP,
+)
+from .ecg_packet import SEQ_SIZE, SEQ_MODULO
+
+_VALUES = {
+    BATTERY_LEVEL:     bytes([87]),
+    MODEL_NUMBER:      b'S-Patch Sim',
+    SERIAL_NUMBER:     b'SIM000001',
+    FIRMWARE_REVISION: b'2.4.6',
+    HARDWARE_REVISION: b'1.0',
+    SOFTWARE_REVISION: b'1.0.0',
+}
+
+
+class SimulatedBLEManager:
+    """Drop-in stand-in for BLEManager. Streams ECG-sized packets at notify_hz."""
+
+    def __init__(self, latency=None, cancel_token=None,
+                 op_delay=0.005, notify_hz=64, packet_size=20):
+        self.latency = latency
+        self.cancel_token = cancel_token or CancelToken()
+        self.op_delay = op_delay
+        self.notify_hz = notify_hz
+        self.packet_size = packet_size
+        self._connected = False
+        self._notifying = False
+        self._streaming = False
+        self._seq = 0
+        self._next_packet = 0.0
+        self._subscribed_at = None
+        self._lock = threading.Lock()
+
+    # ── Device discovery ─────────────────────────────────────────────────────
+
+    def scan_for_device(self, serial_keyword, timeout=10):
+        return ('S-Patch SIM000001', 'SI:MU:LA:TE:D0:01')
+
+    def get_bonded_devices(self):
+        return [('S-Patch SIM000001', 'SI:MU:LA:TE:D0:01')]
+
+    def is_enabled(self):
+        return True
+
+    # ── Connection ───────────────────────────────────────────────────────────
+
+    def connect(self, address, timeout=15):
+        started = time.monotonic()
+        self._sleep(self.op_delay * 10)
+        self._connected = True
+        self._record('connect', started)
+
+    def disconnect(self):
+        self._connected = False
+        self._notifying = False
+        self._streaming = False
+
+    @property
+    def is_connected(self):
+        return self._connected
+
+    def provides(self, svc_uuid):
+        """The simulated patch serves every service, placeholder UUIDs included."""
+        return True
+
+    # ── GATT read / write ────────────────────────────────────────────────────
+
+    def read(self, svc_uuid, char_uuid, timeout=5):
+        self._check()
+        started = time.monotonic()
+        self._sleep(self.op_delay)
+        if char_uuid not in _VALUES:
+            raise RuntimeError(f"Characteristic not found: {char_uuid}")
+        self._record('read', started)
+        return _VALUES[char_uuid]
+
+    def read_rssi(self, timeout=5):
+        self._check()
+        started = time.monotonic()
+        self._sleep(self.op_delay)
+        self._record('rssi', started)
+        return -58 - self._seq % 5
+
+    def read_string(self, svc_uuid, char_uuid, timeout=5):
+        return self.read(svc_uuid, char_uuid, timeout).decode('utf-8')
+
+    def read_uint8(self, svc_uuid, char_uuid, timeout=5):
+        raw = self.read(svc_uuid, char_uuid, timeout)
+        return raw[0] if raw else 0
+
+    def write(self, svc_uuid, char_uuid, value, timeout=5):
+        self._check()
+        started = time.monotonic()
+        self._sleep(self.op_delay)
+        value = bytes(value)
+        if value in (CMD_START, CMD_RESTART):
+            self._streaming = True
+            self._next_packet = time.monotonic() + 1.0 / self.notify_hz
+        elif value in (CMD_PAUSE, CMD_STOP):
+            self._streaming = False
+        self._record('write', started)
+
+    # ── Notifications ────────────────────────────────────────────────────────
+
+    def enable_notify(self, svc_uuid, char_uuid, callback=None):
+        self._check()
+        self._notifying = True
+        self._streaming = True
+        self._next_packet = time.monotonic()
+        self._subscribed_at = time.monotonic()
+
+    def read_notify(self, timeout=5):
+        self._check()
+        started = time.monotonic()
+        if not (self._notifying and self._streaming):
+            self._sleep(timeout)
+            return b''
+        wait = self._next_packet - started
+        if wait > timeout:
+            self._sleep(timeout)
+            return b''
+        if wait > 0:
+            self._sleep(wait)
+        with self._lock:
+            seq = self._seq
+            self._seq = (self._seq + 1) % SEQ_MODULO
+            self._next_packet = max(self._next_packet, started) + 1.0 / self.notify_hz
+        if self._subscribed_at is not None:
+            self._record('notify', self._subscribed_at)
+            self._subscribed_at = None
+        return seq.to_bytes(SEQ_SIZE, 'little') + bytes(self.packet_size - SEQ_SIZE)
+
+    def clear_notify(self):
+        self._subscribed_at = None
+
+    def disable_notify(self, svc_uuid, char_uuid):
+        self._notifying = False
+        self._subscribed_at = None
+
+    # ── Helpers ──────────────────────────────────────────────────────────────
+
+    def _check(self):
+        self.cancel_token.raise_if_cancelled()
+        if not self._connected:
+            raise RuntimeError("Not connected")
+
+    def _sleep(self, seconds):
+        if self.cancel_token.wait(seconds):
+            raise Cancelled("Cancelled")
+
+    def _record(self, op, started):
+        if self.latency is not None:
+            self.latency.record(op, time.monotonic() - started)
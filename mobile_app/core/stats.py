@@ -0,0 +1,28 @@
+"""
+Small statistics helpers shared by the test suites.
+Pure Python so they run the same on Android and on a desktop.
+"""
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of values (pct in 0..100). Returns None if empty."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = int(round(pct / 100.0 * (len(ordered) - 1)))
+    return ordered[max(0, min(rank, len(ordered) - 1))]
+
+
+def summarize_ms(values):
+    """Summarize latencies given in seconds as a dict of millisecond figures."""
+    if not values:
+        return {'count': 0, 'p50_ms': None, 'p90_ms': None,
+                'p99_ms': None, 'max_ms': None}
+    ordered = sorted(values)
+    return {
+        'count':  len(ordered),
+        'p50_ms': round(percentile(ordered, 50) * 1000, 1),
+        'p90_ms': round(percentile(ordered, 90) * 1000, 1),
+        'p99_ms': round(percentile(ordered, 99) * 1000, 1),
+        'max_ms': round(ordered[-1] * 1000, 1),
+    }
@@ -4,6 +4,7 @@ Runs BLE GATT tests directly on Android using BluetoothGatt API.
 No dependency on any external SDK sample app.
 """
 
+import json
 import time
 import threading
 import traceback
@@ -12,16 +13,23 @@ import os
 IS_ANDROID = 'ANDROID_ARGUMENT' in os.environ or 'ANDROID_ROOT' in os.environ
 
 from .ble_manager import (
-    BLEManager,
+    BLEManager, CancelToken, Cancelled,
     BATTERY_SVC, BATTERY_LEVEL,
     DEVINFO_SVC, MODEL_NUMBER, SERIAL_NUMBER,
     FIRMWARE_REVISION, HARDWARE_REVISION, SOFTWARE_REVISION,
     WELLYSIS_SVC, WELLYSIS_CONTROL, WELLYSIS_ECG_NOTIFY,
     CMD_START, CMD_PAUSE, CMD_RESTART, CMD_STOP,
-    HAS_BLE,
+    has_ble,
 )
-
-_WELLYSIS_TODO = 'TODO_WELLYSIS_SERVICE_UUID'
+from .stats import summarize_ms
+from .latency_stats import LatencyStats
+from .sim_ble import SimulatedBLEManager
+from .results import RunResult, TestRecord, ResultWriter
+from .sampler import DeviceSampler
+from .ecg_packet import LossCounter, WaveformBuffer
+from .metrics import ThroughputMeter
+from .capture import PacketCapture
+from .paths import app_file
 
 
 class TestRunner:
@@ -35,53 +43,103 @@ class TestRunner:
                       device_name (str): Human-readable device name
                       read, writeget, notify, packet_monitoring (bool): test flags
                       target_packets (int): target for packet monitoring
+                      stress (bool): run the command stress suite
+                      stress_iterations (int): Start/Pause/Restart/Stop cycles;
+                                               None = 100, or no limit when
+                                               stress_minutes is set
+                      stress_minutes (float): time budget; 0 = iterations only
+                      stress_interval (float): pause between commands (s)
+                      adaptive_timeouts (bool): derive timeouts from latency
+                                                history (default True)
+                      simulate (bool): use the in-process simulated backend;
+                                       never saved to run history or latency stats
+                      stream_results (bool): append records to a JSON-lines
+                                             file while running (default True)
+                      results_path (str): JSON-lines path (default
+                                          results/<run_id>.jsonl in app files)
+                      sample_interval (float): RSSI sampling period during
+                                               packet monitoring, battery every
+                                               6th sample; 0 disables (default 5)
+                      save_artifacts (bool): write packet capture, log and
+                                             metrics files for export (default True)
+                      save_history (bool): store the result in the SQLite
+                                           run history (default True)
+                      history_path (str): history DB path (default
+                                          history.db in app files)
             callback: Progress callback  fn(status: str, progress: float, log: str)
                       pass progress=-1 to update log only (no progress bar change)
         """
         self.config = config
         self.callback = callback
-        self.cancelled = False
-        self.result = {
-            'passed': 0,
-            'failed': 0,
-            'tests': {},
-            'error': None,
-            'fw_version': None,
-        }
-        self.ble = BLEManager()
+        self.cancel_token = CancelToken()
+        self.metrics = ThroughputMeter()      # read by the UI while running
+        self.waveform = WaveformBuffer()      # raw ECG packets for the preview
+        self.result = RunResult(
+            device_address=config.get('device_address'),
+            device_name=config.get('device_name'),
+        )
+        self.capture = None                   # PacketCapture while running
+        self._log = None
+        self.latency = None
+        if config.get('adaptive_timeouts', True):
+            try:
+                # Simulated timings must not tune real-device timeouts
+                self.latency = LatencyStats(persist=not config.get('simulate'))
+            except Exception:
+                self.latency = None
+        backend = SimulatedBLEManager if config.get('simulate') else BLEManager
+        self.ble = backend(latency=self.latency, cancel_token=self.cancel_token)
 
     # ── Public API ────────────────────────────────────────────────────────────
 
     def run(self):
         """Run the selected test suites."""
+        if self.config.get('stream_results', True):
+            try:
+                self.result.writer = ResultWriter.for_run(
+                    self.result, self.config.get('results_path'))
+            except OSError:
+                pass
+        if self.config.get('save_artifacts', True):
+            self._open_artifacts()
+
         address = self.config.get('device_address')
         if not address:
-            self.result['error'] = 'No BLE device selected'
-            self._update('Error', 100, '[ERROR] No BLE device selected')
+            self.result.error = 'No BLE device selected'
+            self._end('Error', '[ERROR] No BLE device selected')
             return
 
-        if not IS_ANDROID:
-            self.result['error'] = 'BLE testing requires Android'
-            self._update('Android required', 100,
-                         '[WARN] BLE tests can only run on Android. '
-                         'Connect an Android device and install the APK.')
+        simulated = bool(self.config.get('simulate'))
+
+        if not IS_ANDROID and not simulated:
+            self.result.error = 'BLE testing requires Android'
+            self._end('Android required',
+                      '[WARN] BLE tests can only run on Android. '
+                      'Connect an Android device and install the APK.')
             return
 
-        if not HAS_BLE:
-            self.result['error'] = 'BLE not available'
-            self._update('BLE unavailable', 100,
-                         '[ERROR] Bluetooth API unavailable on this device.')
+        if not simulated and not has_ble():
+            self.result.error = 'BLE not available'
+            self._end('BLE unavailable',
+                      '[ERROR] Bluetooth API unavailable on this device.')
             return
 
         try:
             # Connect
             name = self.config.get('device_name', address)
+            if self.latency:
+                self.latency.select(address)
             self._update('Connecting...', 5, f'Connecting to {name} ({address})')
-            self.ble.connect(address, timeout=15)
+            self.ble.connect(address, timeout=self._timeout('connect', 15))
             self._update('Connected', 15, f'[OK] Connected to {name}')
+            if self.latency:
+                self._update('', -1,
+                    '  Timeouts: ' + ', '.join(
+                        f'{op} {self._timeout(op, d):.1f}s'
+                        for op, d in (('read', 5), ('write', 5), ('notify', 2))))
 
             # Calculate progress steps
-            flags = ['read', 'writeget', 'notify', 'packet_monitoring']
+            flags = ['read', 'writeget', 'notify', 'packet_monitoring', 'stress']
             total = sum(1 for f in flags if self.config.get(f, False))
             progress = 15.0
             step = 80.0 / max(total, 1)
@@ -107,6 +165,14 @@ class TestRunner:
                 self._run_packet_monitoring(target)
                 progress += step
 
+            if self.config.get('stress') and not self.cancelled:
+                self._update('Command stress...', progress, '--- Command Stress ---')
+                self._run_stress_tests()
+                progress += step
+
+        except Cancelled:
+            pass
+
         except Exception as e:
             tb = traceback.format_exc()
             try:
@@ -114,7 +180,7 @@ class TestRunner:
                     f.write(f"[TEST ERROR]\n{tb}\n")
             except Exception:
                 pass
-            self.result['error'] = str(e)
+            self.result.error = str(e)
             self._update('Error', 90, f'[ERROR] {e}')
 
         finally:
@@ -122,19 +188,33 @@ class TestRunner:
                 self.ble.disconnect()
             except Exception:
                 pass
+            if self.latency:
+                try:
+                    self.latency.save()
+                except Exception:
+                    pass
+
+        if self.cancelled:
+            idle_ms = (time.monotonic() - self.cancel_token.cancelled_at) * 1000
+            self.result.error = 'Cancelled'
+            self._end('Cancelled', f'[CANCELLED] Stopped {idle_ms:.0f} ms after cancel')
+            return
+        self._end('Complete', '--- All tests finished ---')
 
-        self._update('Complete', 100, '--- All tests finished ---')
+    @property
+    def cancelled(self):
+        return self.cancel_token.is_set()
 
     def cancel(self):
-        """Cancel running tests and disconnect."""
-        self.cancelled = True
-        try:
-            self.ble.disconnect()
-        except Exception:
-            pass
+        """Request cancellation. Safe from any thread; returns immediately.
+
+        Blocking BLE waits on the runner thread raise Cancelled within
+        milliseconds, and run() tears the connection down on that thread.
+        """
+        self.cancel_token.cancel()
 
     def get_result(self):
-        """Return accumulated test result dict."""
+        """Return the RunResult of this run."""
         return self.result
 
     # ── Read Tests ────────────────────────────────────────────────────────────
@@ -155,32 +235,39 @@ class TestRunner:
             self._exec_read(name, svc, char, dtype)
 
     def _exec_read(self, name, svc_uuid, char_uuid, dtype='str'):
-        key = f'Read - {name}'
+        record = self._begin(f'Read - {name}', 'read')
         try:
+            timeout = self._timeout('read', 5)
             if dtype == 'uint8':
-                val = self.ble.read_uint8(svc_uuid, char_uuid)
+                val = self.ble.read_uint8(svc_uuid, char_uuid, timeout)
                 display = f'{val}%' if 'Battery' in name else str(val)
+                values = {'battery_pct': val} if 'Battery' in name else {'value': val}
             else:
-                val = self.ble.read_string(svc_uuid, char_uuid)
+                val = self.ble.read_string(svc_uuid, char_uuid, timeout)
                 display = val if val else '(empty)'
+                values = {'value': val}
 
+            if name == 'Serial Number' and val:
+                self.result.serial = val
             if name == 'Firmware Version':
-                self.result['fw_version'] = display
+                self.result.fw_version = display
+                if self.latency and val:
+                    self.latency.select(self.config.get('device_address'), val)
 
-            self.result['tests'][key] = True
-            self.result['passed'] += 1
+            self._finish(record, True, **values)
             self._update('', -1, f'  [PASS] {name}: {display}')
 
+        except Cancelled:
+            raise
         except Exception as e:
-            self.result['tests'][key] = False
-            self.result['failed'] += 1
+            self._finish(record, False, str(e))
             self._update('', -1, f'  [FAIL] {name}: {e}')
 
     # ── WriteGet Tests ────────────────────────────────────────────────────────
 
     def _run_writeget_tests(self):
         """Write control commands to Wellysis characteristic and verify response."""
-        if WELLYSIS_SVC == _WELLYSIS_TODO:
+        if not self.ble.provides(WELLYSIS_SVC):
             self._update('', -1,
                 '[SKIP] WriteGet: Wellysis UUIDs not configured. '
                 'Replace TODO placeholders in ble_manager.py.')
@@ -194,94 +281,323 @@ class TestRunner:
         ]:
             if self.cancelled:
                 break
-            key = f'WriteGet - {name}'
+            record = self._begin(f'WriteGet - {name}', 'writeget')
             try:
-                self.ble.write(WELLYSIS_SVC, WELLYSIS_CONTROL, cmd)
-                time.sleep(1)
-                self.result['tests'][key] = True
-                self.result['passed'] += 1
+                self.ble.write(WELLYSIS_SVC, WELLYSIS_CONTROL, cmd,
+                               self._timeout('write', 5))
+                write_ms = round((time.monotonic() - record.started) * 1000, 1)
+                if self.cancel_token.wait(1):
+                    raise Cancelled('Cancelled')
+                self._finish(record, True, write_ms=write_ms)
                 self._update('', -1, f'  [PASS] {name}')
+            except Cancelled:
+                raise
             except Exception as e:
-                self.result['tests'][key] = False
-                self.result['failed'] += 1
+                self._finish(record, False, str(e))
                 self._update('', -1, f'  [FAIL] {name}: {e}')
 
     # ── Notify Tests ──────────────────────────────────────────────────────────
 
     def _run_notify_tests(self):
         """Enable ECG notification and verify at least 5 packets are received."""
-        if WELLYSIS_SVC == _WELLYSIS_TODO:
+        if not self.ble.provides(WELLYSIS_SVC):
             self._update('', -1,
                 '[SKIP] Notify: Wellysis UUIDs not configured. '
                 'Replace TODO placeholders in ble_manager.py.')
             return
 
-        key = 'Notify - ECG'
+        record = self._begin('Notify - ECG', 'notify')
         try:
             self.ble.enable_notify(WELLYSIS_SVC, WELLYSIS_ECG_NOTIFY)
-            packets = []
-            deadline = time.time() + 10
-            while len(packets) < 5 and time.time() < deadline:
-                data = self.ble.read_notify(timeout=2)
+            packets = 0
+            per_packet = self._timeout('notify', 2)
+            window = per_packet * 5
+            deadline = time.time() + window
+            while packets < 5 and time.time() < deadline:
+                data = self.ble.read_notify(timeout=per_packet)
                 if data:
-                    packets.append(data)
+                    packets += 1
+                    self.waveform.push(data)
+                    if self.capture:
+                        self.capture.write(data)
             self.ble.disable_notify(WELLYSIS_SVC, WELLYSIS_ECG_NOTIFY)
 
             if packets:
-                self.result['tests'][key] = True
-                self.result['passed'] += 1
-                self._update('', -1, f'  [PASS] ECG Notify: {len(packets)} packets received')
+                self._finish(record, True, packets=packets)
+                self._update('', -1, f'  [PASS] ECG Notify: {packets} packets received')
             else:
-                self.result['tests'][key] = False
-                self.result['failed'] += 1
-                self._update('', -1, '  [FAIL] ECG Notify: no packets received within 10s')
+                error = f'no packets received within {window:.0f}s'
+                self._finish(record, False, error, packets=0)
+                self._update('', -1, f'  [FAIL] ECG Notify: {error}')
 
+        except Cancelled:
+            raise
         except Exception as e:
-            self.result['tests'][key] = False
-            self.result['failed'] += 1
+            self._finish(record, False, str(e))
             self._update('', -1, f'  [FAIL] ECG Notify: {e}')
 
     # ── Packet Monitoring ─────────────────────────────────────────────────────
 
     def _run_packet_monitoring(self, target):
         """Stream ECG packets until target count is reached."""
-        if WELLYSIS_SVC == _WELLYSIS_TODO:
+        if not self.ble.provides(WELLYSIS_SVC):
             self._update('', -1,
                 '[SKIP] Packet monitoring: Wellysis UUIDs not configured. '
                 'Replace TODO placeholders in ble_manager.py.')
             return
 
-        key = 'Packet Monitoring'
+        record = self._begin('Packet Monitoring', 'packet_monitoring')
+        loss = LossCounter()
+        self.metrics.reset()
+        sampler = None
         try:
             self.ble.enable_notify(WELLYSIS_SVC, WELLYSIS_ECG_NOTIFY)
-            packets = []
-            timeout = target * 2 + 30
+            per_packet = self._timeout('notify', 2)
+            timeout = target * per_packet + 30
             deadline = time.time() + timeout
-            while len(packets) < target and time.time() < deadline and not self.cancelled:
-                data = self.ble.read_notify(timeout=2)
+            interval = self.config.get('sample_interval', 5)
+            if interval:
+                sampler = DeviceSampler(self.ble, interval=interval,
+                                        timeout=max(self._timeout('read', 5),
+                                                    self._timeout('rssi', 5)))
+                sampler.start()
+            while loss.received < target and time.time() < deadline and not self.cancelled:
+                data = self.ble.read_notify(timeout=per_packet)
                 if data:
-                    packets.append(data)
-                    if len(packets) % 10 == 0:
-                        self._update('', -1, f'  Packets: {len(packets)}/{target}')
+                    if self.capture:
+                        self.capture.write(data)
+                    gap = loss.feed(data)
+                    if gap is None:
+                        continue
+                    self.waveform.push(data)
+                    self.metrics.feed(gap)
+                    if loss.received % 10 == 0:
+                        self._update('', -1, f'  Packets: {loss.received}/{target}')
+            if sampler:
+                sampler.stop()
             self.ble.disable_notify(WELLYSIS_SVC, WELLYSIS_ECG_NOTIFY)
 
-            if len(packets) >= target:
-                self.result['tests'][key] = True
-                self.result['passed'] += 1
-                self._update('', -1, f'  [PASS] Packet monitoring: {len(packets)} packets received')
+            values = {
+                'packets': loss.received,
+                'target': target,
+                'lost': loss.lost,
+                'duplicates': loss.duplicates,
+                'loss_rate': round(loss.loss_rate, 5),
+            }
+            if sampler:
+                values.update(sampler.summary())
+                drain = values.get('battery_drain_pct_per_hour')
+                if drain is not None:
+                    self._update('', -1, f'  Battery drain: {drain:.2f} %/h, '
+                                         f'RSSI mean {values.get("rssi_mean")} dBm')
+            if loss.received >= target:
+                self._finish(record, True, **values)
+                self._update('', -1,
+                    f'  [PASS] Packet monitoring: {loss.received} packets received '
+                    f'(loss {loss.loss_rate:.2%})')
             else:
-                self.result['tests'][key] = False
-                self.result['failed'] += 1
-                self._update('', -1, f'  [FAIL] Packet monitoring: {len(packets)}/{target} (timeout)')
+                self._finish(record, False, 'timeout', **values)
+                self._update('', -1, f'  [FAIL] Packet monitoring: {loss.received}/{target} (timeout)')
 
+        except Cancelled:
+            raise
         except Exception as e:
-            self.result['tests'][key] = False
-            self.result['failed'] += 1
+            self._finish(record, False, str(e), packets=loss.received)
             self._update('', -1, f'  [FAIL] Packet monitoring: {e}')
+        finally:
+            if sampler:
+                sampler.stop()
+
+    # ── Command Stress ────────────────────────────────────────────────────────
+
+    def _run_stress_tests(self):
+        """Cycle Start/Pause/Restart/Stop as fast as the device accepts them.
+
+        Stops after stress_iterations cycles or stress_minutes, whichever
+        comes first. Per command, records write latency (until the GATT write
+        callback) and failures; after Start and Restart also records how long
+        ECG notifications took to resume. Resume times go to the stress
+        summary only; clear_notify() keeps them out of the latency history.
+        """
+        if not self.ble.provides(WELLYSIS_SVC):
+            self._update('', -1,
+                '[SKIP] Command stress: Wellysis UUIDs not configured. '
+                'Replace TODO placeholders in ble_manager.py.')
+            return
+
+        minutes = float(self.config.get('stress_minutes', 0) or 0)
+        iterations = self.config.get('stress_iterations')
+        if iterations is None:
+            iterations = 0 if minutes > 0 else 100    # time-boxed: cycle until the deadline
+        iterations = int(iterations)
+        if iterations <= 0 and minutes <= 0:
+            iterations = 100
+        interval = float(self.config.get('stress_interval', 0) or 0)
+        resume_timeout = float(self.config.get('stress_resume_timeout', 5))
+        commands = [
+            ('Start',   CMD_START),
+            ('Pause',   CMD_PAUSE),
+            ('Restart', CMD_RESTART),
+            ('Stop',    CMD_STOP),
+        ]
+        resumes_after = ('Start', 'Restart')
+
+        latency = {name: [] for name, _ in commands}
+        resume = {name: [] for name in resumes_after}
+        failures = {name: 0 for name, _ in commands}
+        errors = {name: None for name, _ in commands}
+
+        attempts = {name: 0 for name, _ in commands}
+
+        started = time.monotonic()
+        deadline = started + minutes * 60 if minutes > 0 else None
+        cycles = 0
+        try:
+            self.ble.enable_notify(WELLYSIS_SVC, WELLYSIS_ECG_NOTIFY)
+            while (not iterations or cycles < iterations) and not self.cancelled:
+                if deadline and time.monotonic() >= deadline:
+                    break
+                for name, cmd in commands:
+                    if self.cancelled:
+                        break
+                    if name in resumes_after:
+                        self.ble.clear_notify()
+                    attempts[name] += 1
+                    t0 = time.monotonic()
+                    try:
+                        self.ble.write(WELLYSIS_SVC, WELLYSIS_CONTROL, cmd,
+                                       self._timeout('write', 5))
+                    except Cancelled:
+                        raise
+                    except Exception as e:
+                        failures[name] += 1
+                        errors[name] = str(e)
+                        continue
+                    sent = time.monotonic()
+                    latency[name].append(sent - t0)
+
+                    if name in resumes_after:
+                        if self.ble.read_notify(timeout=resume_timeout):
+                            resume[name].append(time.monotonic() - sent)
+                        else:
+                            failures[name] += 1
+                            errors[name] = f'no notification within {resume_timeout:g}s'
+                    if interval > 0 and self.cancel_token.wait(interval):
+                        break
+                cycles += 1
+                if cycles % 10 == 0:
+                    limit = f'/{iterations}' if iterations else f' ({minutes:g} min)'
+                    self._update('', -1, f'  Stress cycles: {cycles}{limit}')
+
+        except Cancelled:
+            raise
+        except Exception as e:
+            record = self._begin('Stress', 'stress')
+            record.started = started
+            self._finish(record, False, str(e), cycles=cycles)
+            self._update('', -1, f'  [FAIL] Command stress: {e}')
+            return
+        finally:
+            # Never leave the patch streaming after an error or cancel
+            try:
+                self.ble.disable_notify(WELLYSIS_SVC, WELLYSIS_ECG_NOTIFY)
+            except Exception:
+                pass
+
+        self._update('', -1, f'  Completed {cycles} cycles')
+        for name, _ in commands:
+            summary = summarize_ms(latency[name])
+            summary['failures'] = failures[name]
+            line = (f"{summary['count']} ok, {failures[name]} failed | "
+                    f"p50 {summary['p50_ms']}ms p90 {summary['p90_ms']}ms "
+                    f"p99 {summary['p99_ms']}ms")
+            if name in resume:
+                summary['resume'] = summarize_ms(resume[name])
+                line += (f" | resume p50 {summary['resume']['p50_ms']}ms "
+                         f"p99 {summary['resume']['p99_ms']}ms")
+            summary['cycles'] = cycles
+
+            record = self._begin(f'Stress - {name}', 'stress')
+            record.started = started
+            record.attempts = attempts[name]
+            ok = failures[name] == 0 and summary['count'] > 0
+            self._finish(record, ok, errors[name], **summary)
+            if ok:
+                self._update('', -1, f'  [PASS] {name}: {line}')
+            else:
+                self._update('', -1, f'  [FAIL] {name}: {line}'
+                             + (f' ({errors[name]})' if errors[name] else ''))
 
     # ── Helpers ───────────────────────────────────────────────────────────────
 
+    def _begin(self, name, suite):
+        """Start a TestRecord timed from now."""
+        return TestRecord(name=name, suite=suite, started=time.monotonic())
+
+    def _finish(self, record, passed, error=None, **values):
+        """Close a TestRecord and add it to the (streamed) result."""
+        record.ended = time.monotonic()
+        record.passed = passed
+        record.error = error
+        record.values.update(values)
+        self.result.add(record)
+
+    def _open_artifacts(self):
+        """Open the packet capture and log files registered in result.artifacts."""
+        try:
+            self.capture = PacketCapture.for_run(self.result)
+            path = app_file('results', f'{self.result.run_id}.log')
+            self._log = open(path, 'a', encoding='utf-8')
+            self.result.artifacts['log'] = path
+        except OSError:
+            pass
+
+    def _close_artifacts(self):
+        """Close the capture and write the metrics series next to it."""
+        if self.capture:
+            self.capture.close()
+            self.capture = None
+        if not self.config.get('save_artifacts', True):
+            return
+        rate, loss, totals = self.metrics.snapshot()
+        if totals['received']:
+            path = app_file('results', f'{self.result.run_id}.metrics.json')
+            try:
+                with open(path, 'w') as f:
+                    json.dump({'window_s': self.metrics.window,
+                               'columns': ['t_s', 'min', 'max', 'mean'],
+                               'packets_per_s': rate, 'loss_rate': loss,
+                               'totals': totals}, f)
+                self.result.artifacts['metrics'] = path
+            except OSError:
+                pass
+
+    def _end(self, status, log):
+        """Finish the result stream, store it in history and report 100%."""
+        self._close_artifacts()
+        self.result.finish()
+        if self.config.get('save_history', True) and not self.config.get('simulate'):
+            try:
+                from .history import RunHistory    # sqlite3 only when saving
+                history = RunHistory(self.config.get('history_path'))
+                history.add(self.result)
+                history.close()
+            except Exception as e:
+                self._update('', -1, f'[WARN] Could not save run history: {e}')
+        self._update(status, 100, log)
+        if self._log:
+            self._log.close()
+            self._log = None
+
+    def _timeout(self, op, default):
+        """Adaptive timeout for a GATT operation, or default without history."""
+        if self.latency:
+            return self.latency.timeout(op, default)
+        return default
+
     def _update(self, status, progress, log):
         """Send progress update. Use progress=-1 to update log without changing progress bar."""
+        if self._log and log:
+            self._log.write(log + '\n')
         if self.callback:
             self.callback(status, progress, log)
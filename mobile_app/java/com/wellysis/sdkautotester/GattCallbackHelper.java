@@ -26,6 +26,10 @@ public class GattCallbackHelper extends BluetoothGattCallback {
     private final AtomicBoolean  writeDone = new AtomicBoolean(false);
     private final AtomicBoolean  writeOk   = new AtomicBoolean(false);
 
+    private final AtomicBoolean  rssiDone  = new AtomicBoolean(false);
+    private final AtomicBoolean  rssiOk    = new AtomicBoolean(false);
+    private final AtomicInteger  rssiValue = new AtomicInteger(0);
+
     private final LinkedBlockingQueue<byte[]> notifyQueue = new LinkedBlockingQueue<>();
 
     // ── BluetoothGattCallback overrides ──────────────────────────────────────
@@ -59,6 +63,13 @@ public class GattCallbackHelper extends BluetoothGattCallback {
         writeDone.set(true);
     }
 
+    @Override
+    public void onReadRemoteRssi(BluetoothGatt gatt, int rssi, int status) {
+        rssiOk.set(status == 0);
+        rssiValue.set(rssi);
+        rssiDone.set(true);
+    }
+
     @Override
     public void onCharacteristicChanged(BluetoothGatt gatt,
                                         BluetoothGattCharacteristic c) {
@@ -80,9 +91,16 @@ public class GattCallbackHelper extends BluetoothGattCallback {
     public boolean isWriteOk()   { return writeOk.get(); }
     public void    clearWrite()  { writeDone.set(false); writeOk.set(false); }
 
+    public boolean isRssiDone()  { return rssiDone.get(); }
+    public boolean isRssiOk()    { return rssiOk.get(); }
+    public int     getRssi()     { return rssiValue.get(); }
+    public void    clearRssi()   { rssiDone.set(false); rssiOk.set(false); }
+
     /** Block up to timeoutMs for the next notification packet, or return null. */
     public byte[] pollNotify(long timeoutMs) throws InterruptedException {
         return notifyQueue.poll(timeoutMs, TimeUnit.MILLISECONDS);
     }
     public void clearNotify() { notifyQueue.clear(); }
+    /** Wake a blocked pollNotify() with an empty packet (used for cancellation). */
+    public void wakeNotify()  { notifyQueue.offer(new byte[0]); }
 }
@@ -3,6 +3,9 @@ SDK Auto Tester - Mobile App (Material Design)
 KivyMD-based UI for SDK validation testing on Android.
 """
 
+import time
+_T_IMPORT = time.perf_counter()    # startup timing reference (see _log_startup)
+
 from kivymd.app import MDApp
 from kivymd.uix.screen import MDScreen
 from kivymd.uix.screenmanager import MDScreenManager
@@ -18,6 +21,7 @@ from kivymd.uix.list import OneLineAvatarIconListItem, IconLeftWidget
 from kivy.uix.scrollview import ScrollView
 from kivy.uix.image import Image as KivyImage
 from kivy.clock import Clock
+from kivy.logger import Logger
 from kivy.metrics import dp
 from kivy.properties import StringProperty, NumericProperty
 import threading
@@ -25,8 +29,11 @@ import os
 import sys
 
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-from core.test_runner import TestRunner
-from core.ble_manager import BLEManager, IS_ANDROID
+# Only what HomeScreen needs is imported here; the other screens import their
+# modules when they are built (see LazyScreenManager) to keep cold start short.
+from core.ble_manager import BLEManager, IS_ANDROID, has_ble
+from core.device_cache import BondedDeviceCache
+from core.paths import app_file
 
 
 class HomeScreen(MDScreen):
@@ -37,13 +44,17 @@ class HomeScreen(MDScreen):
         self.name = 'home'
         self.selected_device_address = None
         self.selected_device_name = None
+        self.bonded = BondedDeviceCache()
+        self._refresh_id = 0
 
         layout = MDBoxLayout(orientation='vertical', padding=dp(10), spacing=dp(10))
 
         toolbar = MDTopAppBar(
             title="S-patch SDK",
             elevation=3,
-            md_bg_color=(0.2, 0.6, 1, 1)
+            md_bg_color=(0.2, 0.6, 1, 1),
+            right_action_items=[["radar", lambda x: self.open_scan()],
+                                ["history", lambda x: self.open_history()]]
         )
         layout.add_widget(toolbar)
 
@@ -108,7 +119,7 @@ class HomeScreen(MDScreen):
             size_hint=(1, None),
             height=dp(36)
         )
-        refresh_btn.bind(on_press=lambda x: self.refresh_devices())
+        refresh_btn.bind(on_press=lambda x: self.refresh_devices(force=True))
         device_card.add_widget(refresh_btn)
 
         # ── Serial number search ──────────────────────────────────────────────
@@ -153,7 +164,7 @@ class HomeScreen(MDScreen):
         settings_card = MDCard(
             orientation='vertical',
             size_hint=(1, None),
-            height=dp(100),
+            height=dp(280),
             padding=dp(15),
             spacing=dp(10),
             elevation=2
@@ -176,13 +187,41 @@ class HomeScreen(MDScreen):
         )
         settings_card.add_widget(self.packet_input)
 
+        self.stress_input = MDTextField(
+            hint_text="Stress Iterations (blank: 100, or until the time limit)",
+            mode="rectangle",
+            input_filter="int",
+            size_hint_y=None,
+            height=dp(50)
+        )
+        settings_card.add_widget(self.stress_input)
+
+        self.stress_minutes_input = MDTextField(
+            hint_text="Stress Time Limit (minutes, blank: none)",
+            mode="rectangle",
+            input_filter="float",
+            size_hint_y=None,
+            height=dp(50)
+        )
+        settings_card.add_widget(self.stress_minutes_input)
+
+        self.stress_interval_input = MDTextField(
+            hint_text="Stress Pacing (seconds between commands)",
+            text="0",
+            mode="rectangle",
+            input_filter="float",
+            size_hint_y=None,
+            height=dp(50)
+        )
+        settings_card.add_widget(self.stress_interval_input)
+
         content.add_widget(settings_card)
 
         # ── Test items card ───────────────────────────────────────────────────
         test_card = MDCard(
             orientation='vertical',
             size_hint=(1, None),
-            height=dp(250),
+            height=dp(356),
             padding=dp(15),
             spacing=dp(5),
             elevation=2
@@ -201,7 +240,9 @@ class HomeScreen(MDScreen):
             ('read', 'Read Test', True),
             ('writeget', 'WriteGet Test', True),
             ('notify', 'Notify Test', True),
-            ('packet', 'Packet Monitoring', False)
+            ('packet', 'Packet Monitoring', False),
+            ('stress', 'Command Stress', False),
+            ('monitor', 'Remote Monitor (port 8765)', False)
         ]:
             item = OneLineAvatarIconListItem(text=test_name)
             checkbox = MDCheckbox(active=default, size_hint=(None, None), size=(dp(48), dp(48)))
@@ -226,38 +267,86 @@ class HomeScreen(MDScreen):
         layout.add_widget(scroll)
         self.add_widget(layout)
 
-        # Auto-scan bonded devices on first load
+        # Auto-scan bonded devices on first load; re-scan when BT state or
+        # bonds change while the home screen is shown
         Clock.schedule_once(lambda dt: self.refresh_devices(), 0.5)
+        self.bonded.watch(on_change=lambda action: Clock.schedule_once(
+            lambda dt: self._on_bluetooth_changed(), 0))
 
-    def refresh_devices(self):
-        """Reload bonded BLE devices and display as selectable buttons."""
+    def refresh_devices(self, force=False):
+        """Reload bonded BLE devices on a worker; buttons appear as they're read."""
+        self._refresh_id += 1
+        refresh_id = self._refresh_id
         self.device_list.clear_widgets()
-        try:
-            ble = BLEManager()
-            devices = ble.get_bonded_devices()
-        except Exception:
-            devices = []
+        self.device_list.height = dp(44)
+        self._device_hint = MDLabel(
+            text="Loading paired devices...",
+            theme_text_color="Secondary",
+            size_hint_y=None,
+            height=dp(30)
+        )
+        self.device_list.add_widget(self._device_hint)
 
-        if not devices:
-            self.device_list.add_widget(MDLabel(
-                text="No paired BLE devices found.",
-                theme_text_color="Secondary",
-                size_hint_y=None,
-                height=dp(30)
-            ))
-            return
+        # Resolve the Java classes here: app classes only load reliably from
+        # the main thread's ClassLoader. Enumeration itself runs on a worker.
+        has_ble()
 
-        for name, address in devices:
-            btn = MDFlatButton(
-                text=f"{name}  ({address})",
-                size_hint=(1, None),
-                height=dp(44)
-            )
-            btn.bind(on_press=lambda x, n=name, a=address: self.select_device(n, a))
-            self.device_list.add_widget(btn)
+        def on_device(name, address):
+            Clock.schedule_once(lambda dt: self._add_device(refresh_id, name, address), 0)
+
+        def on_done(devices, error):
+            Clock.schedule_once(
+                lambda dt: self._on_devices_done(refresh_id, devices, error), 0)
+
+        self.bonded.refresh(on_device, on_done, force=force)
+
+    def _add_device(self, refresh_id, name, address):
+        if refresh_id != self._refresh_id:
+            return
+        if self._device_hint is not None:
+            self.device_list.remove_widget(self._device_hint)
+            self._device_hint = None
+        btn = MDFlatButton(
+            text=f"{name}  ({address})",
+            size_hint=(1, None),
+            height=dp(44)
+        )
+        btn.bind(on_press=lambda x, n=name, a=address: self.select_device(n, a))
+        self.device_list.add_widget(btn)
 
         # Expand list height to fit all devices
-        self.device_list.height = dp(44) * len(devices)
+        self.device_list.height = dp(44) * len(self.device_list.children)
+
+    def _on_devices_done(self, refresh_id, devices, error=None):
+        if refresh_id != self._refresh_id:
+            return
+        if error:
+            # e.g. Bluetooth off or BLUETOOTH_CONNECT not granted
+            if self._device_hint is None:
+                self._device_hint = MDLabel(
+                    theme_text_color="Error", size_hint_y=None, height=dp(30))
+                self.device_list.add_widget(self._device_hint)
+                self.device_list.height = dp(44) * len(self.device_list.children)
+            self._device_hint.text = f"Could not list paired devices: {error}"
+            self._device_hint.theme_text_color = "Error"
+        elif not devices:
+            self._device_hint.text = "No paired BLE devices found."
+
+    def open_scan(self):
+        MDApp.get_running_app().root.current = 'scan'
+
+    def open_history(self):
+        MDApp.get_running_app().root.current = 'history'
+
+    def on_enter(self, *args):
+        # Pick up bond changes that happened while another screen was shown
+        if self._refresh_id and not self.bonded.is_valid:
+            self.refresh_devices()
+
+    def _on_bluetooth_changed(self):
+        app = MDApp.get_running_app()
+        if app and app.root and app.root.current == 'home':
+            self.refresh_devices()
 
     def find_by_serial(self):
         """Scan for nearby BLE devices and select the one matching the serial number.
@@ -328,7 +417,12 @@ class HomeScreen(MDScreen):
             'writeget': self.checkboxes['writeget'].active,
             'notify': self.checkboxes['notify'].active,
             'packet_monitoring': self.checkboxes['packet'].active,
-            'target_packets': int(self.packet_input.text) if self.packet_input.text else 60
+            'target_packets': int(self.packet_input.text) if self.packet_input.text else 60,
+            'stress': self.checkboxes['stress'].active,
+            'stress_iterations': int(self.stress_input.text) if self.stress_input.text else None,
+            'stress_minutes': float(self.stress_minutes_input.text or 0),
+            'stress_interval': float(self.stress_interval_input.text or 0),
+            'remote_monitor': self.checkboxes['monitor'].active
         }
 
         app = MDApp.get_running_app()
@@ -344,6 +438,10 @@ class TestingScreen(MDScreen):
     progress_value = NumericProperty(0)
 
     def __init__(self, **kwargs):
+        from widgets.log_view import LogView
+        from widgets.throughput_chart import ThroughputChart
+        from widgets.waveform import WaveformView
+
         super().__init__(**kwargs)
         self.name = 'testing'
         self._current_progress = 0
@@ -401,16 +499,14 @@ class TestingScreen(MDScreen):
         )
         card.add_widget(self.progress_label)
 
-        log_scroll = ScrollView(size_hint=(1, 1))
-        self.log_label = MDLabel(
-            text="",
-            halign="left",
-            valign="top",
-            size_hint_y=None
-        )
-        self.log_label.bind(texture_size=self.log_label.setter('size'))
-        log_scroll.add_widget(self.log_label)
-        card.add_widget(log_scroll)
+        self.waveform = WaveformView()
+        card.add_widget(self.waveform)
+
+        self.chart = ThroughputChart()
+        card.add_widget(self.chart)
+
+        self.log_view = LogView(size_hint=(1, 1))
+        card.add_widget(self.log_view)
 
         cancel_btn = MDFlatButton(
             text="Cancel",
@@ -423,6 +519,7 @@ class TestingScreen(MDScreen):
         layout.add_widget(card)
         self.add_widget(layout)
         self.test_runner = None
+        self._server = None
 
     def start_test(self, config):
         """Start the test."""
@@ -430,18 +527,37 @@ class TestingScreen(MDScreen):
         self.status_label.text = 'Starting test...'
         self.progress_bar.value = 0
         self.progress_label.text = '0%'
-        self.log_label.text = ''
+        self.log_view.clear()
         self.status_icon.icon = "loading"
         self.status_icon.text_color = (0.2, 0.6, 1, 1)
 
+        from core.test_runner import TestRunner
         self.test_runner = TestRunner(config, self.update_callback)
+        self._server = None
+        if config.get('remote_monitor'):
+            self._server = MDApp.get_running_app().progress_server()
+            if self._server:
+                self._server.attach(self.test_runner)
+                self.log_view.append(f'Remote monitor: {self._server.url}')
+            else:
+                self.log_view.append('[WARN] Remote monitor could not start')
+        self.chart.start(self.test_runner.metrics)
+        self.waveform.start(self.test_runner.waveform)
         thread = threading.Thread(target=self.test_runner.run)
         thread.daemon = True
         thread.start()
 
     def update_callback(self, status, progress, log):
         """Update progress. progress=-1 means log-only (no progress bar change)."""
+        runner = self.test_runner
+        if self._server is not None and not runner.cancelled:
+            self._server.progress(status, progress, log)   # non-blocking
+
         def update_ui(dt):
+            # A cancelled runner finishes its teardown in the background;
+            # its late updates must not drive this screen any more.
+            if runner is None or runner is not self.test_runner or runner.cancelled:
+                return
             if status:
                 self.status_label.text = status
             if progress >= 0:
@@ -450,14 +566,11 @@ class TestingScreen(MDScreen):
                 self.progress_label.text = f'{int(progress)}%'
 
             if log:
-                current_log = self.log_label.text
-                new_log = current_log + '\n' + log if current_log else log
-                lines = new_log.split('\n')
-                if len(lines) > 20:
-                    lines = lines[-20:]
-                self.log_label.text = '\n'.join(lines)
+                self.log_view.append(log)
 
             if self._current_progress >= 100:
+                self.chart.stop()
+                self.waveform.stop()
                 self.status_icon.icon = "check-circle"
                 self.status_icon.text_color = (0.2, 0.8, 0.4, 1)
                 Clock.schedule_once(self.show_result, 2)
@@ -472,9 +585,11 @@ class TestingScreen(MDScreen):
         app.root.current = 'result'
 
     def cancel_test(self, instance):
-        """Cancel the test."""
+        """Cancel the test. The runner thread disconnects on its own."""
         if self.test_runner:
             self.test_runner.cancel()
+        self.chart.stop()
+        self.waveform.stop()
         app = MDApp.get_running_app()
         app.root.current = 'home'
 
@@ -588,19 +703,19 @@ class ResultScreen(MDScreen):
         self.result_data = None
 
     def set_result(self, result):
-        """Set result data and update UI."""
+        """Set result data (core.results.RunResult) and update UI."""
         self.result_data = result
 
-        if result.get('error'):
+        if result.error:
             self.result_icon.icon = "alert-circle"
             self.result_icon.text_color = (1, 0.3, 0.3, 1)
             self.result_label.text = "Error occurred"
-            self.detail_label.text = result['error']
+            self.detail_label.text = result.error
             self.fw_label.text = ""
             return
 
-        passed = result.get('passed', 0)
-        failed = result.get('failed', 0)
+        passed = result.passed
+        failed = result.failed
         total = passed + failed
 
         if failed == 0 and total > 0:
@@ -616,47 +731,102 @@ class ResultScreen(MDScreen):
         success_rate = int((passed / total) * 100) if total > 0 else 0
         self.result_label.text = f'Passed: {passed}/{total}\nPass rate: {success_rate}%'
 
-        fw = result.get('fw_version')
+        fw = result.fw_version
         self.fw_label.text = f'Firmware: {fw}' if fw else ''
 
         details = []
-        for test_name, test_result in result.get('tests', {}).items():
-            icon = 'PASS' if test_result else 'FAIL'
-            details.append(f'[{icon}] {test_name}')
+        for test in result.tests:
+            icon = 'PASS' if test.passed else 'FAIL'
+            line = f'[{icon}] {test.name}  ({test.duration:.1f}s)'
+            if test.error:
+                line += f'\n    {test.error}'
+            details.append(line)
 
         self.detail_label.text = '\n'.join(details) if details else 'No test results'
 
     def share_result(self, instance):
-        """Share results via Android share intent."""
+        """Export the run artifacts to a ZIP and share it via Android share intent."""
+        result = self.result_data
+        if result is None or getattr(self, '_exporting', False):
+            return
+        self._exporting = True
+        self._share_btn = instance
+        instance.text = "Exporting..."
+        path = os.path.join(self._export_dir(), f'sdkautotester_{result.run_id}.zip')
+        from core.export import export_run
+
+        def work():
+            try:
+                archive, error = export_run(result, path), None
+            except Exception as e:
+                archive, error = None, str(e)
+            Clock.schedule_once(lambda dt: self._on_exported(archive, error), 0)
+
+        threading.Thread(target=work, daemon=True).start()
+
+    def _export_dir(self):
+        """App-specific external storage on Android (readable by the share
+        target and by adb pull); the app files dir elsewhere."""
+        if IS_ANDROID:
+            try:
+                from jnius import autoclass
+                activity = autoclass('org.kivy.android.PythonActivity').mActivity
+                return os.path.join(
+                    activity.getExternalFilesDir(None).getAbsolutePath(), 'exports')
+            except Exception:
+                pass
+        return os.path.dirname(app_file('exports', 'x'))
+
+    def _on_exported(self, archive, error):
+        self._exporting = False
+        self._share_btn.text = "Share"
+        if error:
+            self.detail_label.text += f"\n\nExport failed: {error}"
+            return
+        result = self.result_data
+        passed = result.passed
+        failed = result.failed
+        fw = result.fw_version or 'N/A'
+
+        text = (
+            f"SDK Auto Tester Results\n"
+            f"Firmware: {fw}\n"
+            f"Passed: {passed}  Failed: {failed}\n"
+            f"Pass rate: {int(passed/(passed+failed)*100) if passed+failed else 0}%\n\n"
+        )
+        for test in result.tests:
+            text += f"[{'PASS' if test.passed else 'FAIL'}] {test.name}\n"
+
         try:
-            from jnius import autoclass
+            from jnius import autoclass, cast
             PythonActivity = autoclass('org.kivy.android.PythonActivity')
             Intent = autoclass('android.content.Intent')
             String = autoclass('java.lang.String')
+            File = autoclass('java.io.File')
+            Uri = autoclass('android.net.Uri')
+            StrictMode = autoclass('android.os.StrictMode')
+            VmPolicyBuilder = autoclass('android.os.StrictMode$VmPolicy$Builder')
 
-            result = self.result_data or {}
-            passed = result.get('passed', 0)
-            failed = result.get('failed', 0)
-            fw = result.get('fw_version', 'N/A')
-
-            text = (
-                f"SDK Auto Tester Results\n"
-                f"Firmware: {fw}\n"
-                f"Passed: {passed}  Failed: {failed}\n"
-                f"Pass rate: {int(passed/(passed+failed)*100) if passed+failed else 0}%\n\n"
-            )
-            for name, res in result.get('tests', {}).items():
-                text += f"[{'PASS' if res else 'FAIL'}] {name}\n"
-
+            uri = Uri.fromFile(File(archive))
             intent = Intent()
             intent.setAction(Intent.ACTION_SEND)
             intent.putExtra(Intent.EXTRA_TEXT, String(text))
-            intent.setType('text/plain')
-
-            currentActivity = PythonActivity.mActivity
-            currentActivity.startActivity(Intent.createChooser(intent, String('Share Results')))
+            intent.putExtra(Intent.EXTRA_STREAM, cast('android.os.Parcelable', uri))
+            intent.setType('application/zip')
+            intent.addFlags(Intent.FLAG_GRANT_READ_URI_PERMISSION)
+
+            # No FileProvider in this build (the p4a manifest has no <provider>),
+            # so Android 7+ rejects the file:// URI under the default VM policy.
+            # Relax it only for the startActivity call, then restore it.
+            previous = StrictMode.getVmPolicy()
+            StrictMode.setVmPolicy(VmPolicyBuilder().build())
+            try:
+                currentActivity = PythonActivity.mActivity
+                currentActivity.startActivity(Intent.createChooser(intent, String('Share Results')))
+            finally:
+                StrictMode.setVmPolicy(previous)
         except Exception:
-            pass
+            self.detail_label.text += f"\n\nExported: {archive}"
 
     def go_home(self, instance):
         """Return to home screen."""
@@ -664,21 +834,322 @@ class ResultScreen(MDScreen):
         app.root.current = 'home'
 
 
+class ScanScreen(MDScreen):
+    """Continuous scan of nearby patches with smoothed RSSI and advertising rate."""
+
+    def __init__(self, **kwargs):
+        from core.scan_table import ScanTable
+        from widgets.scan_list import ScanList
+
+        super().__init__(**kwargs)
+        self.name = 'scan'
+        self.table = ScanTable()
+        self._ble = None
+
+        layout = MDBoxLayout(orientation='vertical')
+
+        toolbar = MDTopAppBar(
+            title="Nearby Devices",
+            elevation=3,
+            md_bg_color=(0.2, 0.6, 1, 1),
+            left_action_items=[["arrow-left", lambda x: self.go_home()]]
+        )
+        layout.add_widget(toolbar)
+
+        content = MDBoxLayout(orientation='vertical', padding=dp(15), spacing=dp(10))
+
+        self.filter_input = MDTextField(
+            hint_text="Filter by name or address",
+            mode="rectangle",
+            size_hint=(1, None),
+            height=dp(48)
+        )
+        self.filter_input.bind(text=lambda w, text: self.scan_list.set_keyword(text))
+        content.add_widget(self.filter_input)
+
+        self.status_label = MDLabel(
+            text="",
+            theme_text_color="Secondary",
+            size_hint_y=None,
+            height=dp(24)
+        )
+        content.add_widget(self.status_label)
+
+        self.scan_list = ScanList(on_select=self.select_device, size_hint=(1, 1))
+        content.add_widget(self.scan_list)
+
+        layout.add_widget(content)
+        self.add_widget(layout)
+        self._status_event = None
+
+    def on_enter(self, *args):
+        """Start scanning while the screen is shown."""
+        self.table.clear()
+        self.scan_list.start(self.table)
+        self._status_event = Clock.schedule_interval(self._update_status, 1.0)
+        try:
+            self._ble = BLEManager()
+            self._ble.start_scan(self.table.observe)
+            self.status_label.text = "Scanning..."
+        except Exception as e:
+            self._ble = None
+            self.status_label.text = f"Scan error: {e}"
+
+    def on_leave(self, *args):
+        if self._ble is not None:
+            try:
+                self._ble.stop_scan()
+            except Exception:
+                pass
+            self._ble = None
+        self.scan_list.stop()
+        if self._status_event is not None:
+            self._status_event.cancel()
+            self._status_event = None
+
+    def _update_status(self, dt):
+        if self._ble is not None:
+            self.status_label.text = (f"Scanning...  {len(self.table)} devices, "
+                                      f"{self.table.adverts} advertisements")
+
+    def select_device(self, name, address):
+        """Use the tapped device on the home screen."""
+        app = MDApp.get_running_app()
+        app.root.get_screen('home').select_device(name or address, address)
+        self.go_home()
+
+    def go_home(self):
+        MDApp.get_running_app().root.current = 'home'
+
+
+class HistoryScreen(MDScreen):
+    """Past runs from the on-device SQLite history, one page at a time."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.name = 'history'
+        self._history = None
+        self._history_lock = threading.Lock()
+        self._cursor = None
+        self._loading = False
+
+        layout = MDBoxLayout(orientation='vertical')
+
+        toolbar = MDTopAppBar(
+            title="Run History",
+            elevation=3,
+            md_bg_color=(0.2, 0.6, 1, 1),
+            left_action_items=[["arrow-left", lambda x: self.go_home()]]
+        )
+        layout.add_widget(toolbar)
+
+        scroll = ScrollView()
+        content = MDBoxLayout(orientation='vertical', padding=dp(15), spacing=dp(15), size_hint_y=None)
+        content.bind(minimum_height=content.setter('height'))
+
+        trend_card = MDCard(
+            orientation='vertical',
+            size_hint=(1, None),
+            padding=dp(15),
+            elevation=2
+        )
+        trend_card.bind(minimum_height=trend_card.setter('height'))
+        trend_card.add_widget(MDLabel(
+            text="Firmware Trends",
+            font_style="H6",
+            size_hint_y=None,
+            height=dp(30)
+        ))
+        self.trend_label = MDLabel(text="", size_hint_y=None, markup=True)
+        self.trend_label.bind(texture_size=lambda w, s: setattr(w, 'height', s[1]))
+        trend_card.add_widget(self.trend_label)
+        content.add_widget(trend_card)
+
+        content.add_widget(MDLabel(
+            text="Runs",
+            font_style="H6",
+            size_hint_y=None,
+            height=dp(30)
+        ))
+        self.run_list = MDBoxLayout(orientation='vertical', size_hint_y=None, spacing=dp(4))
+        self.run_list.bind(minimum_height=self.run_list.setter('height'))
+        content.add_widget(self.run_list)
+
+        self.more_btn = MDFlatButton(
+            text="Load more",
+            size_hint=(1, None),
+            height=dp(40)
+        )
+        self.more_btn.bind(on_press=lambda x: self.load_page())
+        content.add_widget(self.more_btn)
+
+        scroll.add_widget(content)
+        layout.add_widget(scroll)
+        self.add_widget(layout)
+
+    def on_enter(self, *args):
+        """Reload trends and the first page each time the screen is shown."""
+        self._cursor = None
+        self.run_list.clear_widgets()
+        self.trend_label.text = "Loading..."
+        self._query(self._load_trends, self._show_trends)
+        self.load_page()
+
+    def load_page(self):
+        """Append the next page of runs (queried off the main thread)."""
+        if self._loading:
+            return
+        self._loading = True
+        cursor = self._cursor
+        self._query(lambda: self._db().page(cursor), self._show_page)
+
+    def _db(self):
+        # Opened on the first query worker (keeps file I/O off the main
+        # thread); the lock stops concurrent workers opening two connections
+        with self._history_lock:
+            if self._history is None:
+                from core.history import RunHistory
+                self._history = RunHistory()
+            return self._history
+
+    def _load_trends(self):
+        return self._db().fw_trends()
+
+    def _query(self, fn, done):
+        def work():
+            try:
+                value, error = fn(), None
+            except Exception as e:
+                value, error = None, str(e)
+            Clock.schedule_once(lambda dt: done(value, error), 0)
+        threading.Thread(target=work, daemon=True).start()
+
+    def _show_trends(self, trends, error):
+        if error:
+            self.trend_label.text = f"[color=ff0000]{error}[/color]"
+        elif not trends:
+            self.trend_label.text = "No runs recorded yet."
+        else:
+            lines = []
+            for t in trends:
+                rate = f"{t['throughput']:.1f} pkt/s" if t['throughput'] else "- pkt/s"
+                lines.append(f"[b]{t['fw_version'] or 'unknown'}[/b]   {t['runs']} runs   "
+                             f"{t['pass_rate'] * 100:.1f}% pass   {rate}")
+            self.trend_label.text = "\n".join(lines)
+
+    def _show_page(self, page, error):
+        self._loading = False
+        if error:
+            self.more_btn.text = f"Error: {error}"
+            return
+        rows, self._cursor = page
+        for row in rows:
+            when = time.strftime('%Y-%m-%d %H:%M', time.localtime(row['started_at']))
+            status = row['error'] or f"{row['passed']} passed, {row['failed']} failed"
+            self.run_list.add_widget(MDLabel(
+                text=f"{when}  {row['serial'] or row['device_name'] or '-'}  "
+                     f"FW {row['fw_version'] or '-'}\n[size=12sp]{status}[/size]",
+                markup=True,
+                size_hint_y=None,
+                height=dp(44)
+            ))
+        self.more_btn.text = "Load more"
+        self.more_btn.disabled = self._cursor is None
+        self.more_btn.opacity = 0 if self._cursor is None else 1
+
+    def go_home(self):
+        MDApp.get_running_app().root.current = 'home'
+
+
+class LazyScreenManager(MDScreenManager):
+    """Screen manager that builds registered screens the first time they're used.
+
+    Only the initial screen is constructed in build(); get_screen() (and so
+    setting `current`) instantiates the others from their factory on demand.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._factories = {}
+
+    def register(self, name, factory):
+        self._factories[name] = factory
+
+    def has_screen(self, name):
+        return name in self._factories or super().has_screen(name)
+
+    def get_screen(self, name):
+        factory = self._factories.pop(name, None)
+        if factory is not None:
+            started = time.perf_counter()
+            self.add_widget(factory())
+            Logger.info(f"Startup: built screen '{name}' in "
+                        f"{(time.perf_counter() - started) * 1000:.0f} ms")
+        return super().get_screen(name)
+
+
+def _process_age():
+    """Seconds since this process started (Linux/Android), or None."""
+    try:
+        with open('/proc/self/stat') as f:
+            start_ticks = int(f.read().rsplit(')', 1)[1].split()[19])
+        with open('/proc/uptime') as f:
+            uptime = float(f.read().split()[0])
+        return uptime - start_ticks / os.sysconf('SC_CLK_TCK')
+    except Exception:
+        return None
+
+
 class SDKAutoTesterApp(MDApp):
     """Main app - Material Design"""
 
+    _progress_server = None
+
+    def progress_server(self):
+        """Shared remote-monitor server, started on first use; None on failure."""
+        if self._progress_server is None:
+            from core.progress_server import ProgressServer
+            server = ProgressServer()
+            try:
+                server.start()
+            except OSError as e:
+                Logger.warning(f"ProgressServer: {e}")
+                return None
+            self._progress_server = server
+        return self._progress_server
+
+    def on_stop(self):
+        if self._progress_server is not None:
+            self._progress_server.stop()
+
     def build(self):
         self.theme_cls.primary_palette = "Blue"
         self.theme_cls.theme_style = "Light"
 
-        sm = MDScreenManager()
+        self._t_build = time.perf_counter()
+        sm = LazyScreenManager()
         sm.add_widget(HomeScreen())
-        sm.add_widget(TestingScreen())
-        sm.add_widget(ResultScreen())
+        sm.register('testing', TestingScreen)
+        sm.register('result', ResultScreen)
+        sm.register('history', HistoryScreen)
+        sm.register('scan', ScanScreen)
+        self._t_built = time.perf_counter()
         return sm
 
+    def _log_startup(self, dt):
+        """Log cold-start timing once the first frame has been drawn."""
+        now = time.perf_counter()
+        age = _process_age()
+        Logger.info(
+            f"Startup: first frame {(now - _T_IMPORT) * 1000:.0f} ms after main import "
+            f"(imports {(self._t_build - _T_IMPORT) * 1000:.0f} ms, "
+            f"build {(self._t_built - self._t_build) * 1000:.0f} ms)"
+            + (f", {age * 1000:.0f} ms since process start" if age is not None else ""))
+
     def on_start(self):
         """Request Bluetooth runtime permissions on Android 12+ at app start."""
+        # on_start runs before the first frame; the next tick is after it.
+        Clock.schedule_once(self._log_startup, 0)
         if IS_ANDROID:
             try:
                 from android.permissions import request_permissions, Permission
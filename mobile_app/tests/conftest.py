@@ -0,0 +1,6 @@
+"""Desktop tests for the mobile app core (no Kivy, Android or patch needed)."""
+import os
+import sys
+
+# Same import root as main.py / cli.py: `from core.x import ...`
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,37 @@
+"""Headless CLI against the simulated backend."""
+import json
+import os
+
+import pytest
+
+import cli
+from core import paths
+
+
+@pytest.fixture
+def app_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(paths, 'DESKTOP_FILES_DIR', str(tmp_path))
+    return tmp_path
+
+
+def test_simulated_packet_monitoring_runs(app_dir, capsys):
+    out = app_dir / 'result.json'
+    code = cli.main(['--simulate', '--packet-monitoring', '--target-packets', '20',
+                     '--sample-interval', '0', '--output', str(out)])
+
+    assert code == 0
+    assert '[SKIP]' not in capsys.readouterr().out
+    records = json.loads(out.read_text())['tests']
+    packet = next(r for r in records if r['suite'] == 'packet_monitoring')
+    assert packet['passed']
+    assert packet['values']['packets'] == 20
+    assert packet['values']['lost'] == 0
+
+
+def test_simulate_persists_no_history_or_latency(app_dir):
+    assert cli.build_config(cli.parse_args(['--simulate']))['save_history'] is False
+
+    cli.main(['--simulate', '--read', '--output', str(app_dir / 'result.json')])
+
+    assert not os.path.exists(app_dir / 'history.db')
+    assert not os.path.exists(app_dir / 'latency_stats.json')
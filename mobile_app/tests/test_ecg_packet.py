@@ -0,0 +1,56 @@
+"""LossCounter sequence accounting."""
+from core.ecg_packet import LossCounter, SEQ_MODULO, SEQ_SIZE
+
+
+def _packet(seq):
+    return seq.to_bytes(SEQ_SIZE, 'little') + bytes(16)
+
+
+def _feed(*seqs):
+    loss = LossCounter()
+    gaps = [loss.feed(_packet(s)) for s in seqs]
+    return loss, gaps
+
+
+def test_consecutive_packets_have_no_loss():
+    loss, gaps = _feed(1, 2, 3)
+    assert gaps == [0, 0, 0]
+    assert (loss.received, loss.lost, loss.duplicates) == (3, 0, 0)
+
+
+def test_gap_counts_missed_packets():
+    loss, gaps = _feed(1, 2, 5)
+    assert gaps == [0, 0, 2]
+    assert loss.lost == 2
+    assert loss.loss_rate == 2 / 5
+
+
+def test_duplicate_is_not_loss():
+    loss, gaps = _feed(1, 2, 2, 3)
+    assert gaps == [0, 0, None, 0]
+    assert (loss.received, loss.lost, loss.duplicates) == (3, 0, 1)
+    assert loss.loss_rate == 0.0
+
+
+def test_reordered_packet_does_not_move_last_backwards():
+    loss, gaps = _feed(1, 3, 2, 4)
+    assert gaps == [0, 1, None, 0]
+    assert (loss.received, loss.lost, loss.duplicates) == (3, 1, 1)
+
+
+def test_wraparound_is_continuous():
+    loss, gaps = _feed(SEQ_MODULO - 2, SEQ_MODULO - 1, 0, 1)
+    assert gaps == [0, 0, 0, 0]
+    assert (loss.received, loss.lost, loss.duplicates) == (4, 0, 0)
+
+
+def test_gap_across_wraparound():
+    loss, gaps = _feed(SEQ_MODULO - 1, 2)
+    assert gaps == [0, 2]
+    assert loss.lost == 2
+
+
+def test_short_packet_counts_as_received():
+    loss = LossCounter()
+    assert loss.feed(b'\x01') == 0
+    assert (loss.received, loss.lost) == (1, 0)
@@ -0,0 +1,82 @@
+"""What the BLE backends feed into LatencyStats."""
+from core.latency_stats import LatencyStats
+from core.sim_ble import SimulatedBLEManager
+from core import test_runner
+
+ADDRESS = 'SI:MU:LA:TE:D0:01'
+
+
+def _stats():
+    stats = LatencyStats(persist=False)
+    stats.select(ADDRESS)
+    return stats
+
+
+def test_rssi_is_recorded_apart_from_reads():
+    stats = _stats()
+    ble = SimulatedBLEManager(latency=stats, op_delay=0)
+    ble.connect(ADDRESS)
+    ble.read_rssi()
+    assert len(stats.samples('rssi')) == 1
+    assert stats.samples('read') == []
+
+
+def test_only_first_packet_after_subscribe_is_notify_latency():
+    stats = _stats()
+    ble = SimulatedBLEManager(latency=stats, op_delay=0, notify_hz=500)
+    ble.connect(ADDRESS)
+    ble.enable_notify('svc', 'ecg')
+    for _ in range(5):
+        assert ble.read_notify(timeout=1)
+    assert len(stats.samples('notify')) == 1
+
+    ble.clear_notify()
+    assert ble.read_notify(timeout=1)
+    assert len(stats.samples('notify')) == 1
+
+
+def test_stress_resume_waits_stay_out_of_latency_stats():
+    runner = test_runner.TestRunner({
+        'device_address': ADDRESS, 'simulate': True, 'stress': True,
+        'stress_iterations': 3, 'save_artifacts': False,
+        'stream_results': False,
+    }, None)
+    runner.ble.notify_hz = 500
+    runner.run()
+
+    resume = [r for r in runner.result.tests if r.name == 'Stress - Start']
+    assert resume and resume[0].values['resume']['count'] == 3
+    assert runner.latency.samples('notify') == []
+    assert len(runner.latency.samples('write')) == 12
+
+
+def test_time_boxed_stress_is_not_capped_at_default_iterations():
+    runner = test_runner.TestRunner({
+        'device_address': ADDRESS, 'simulate': True, 'stress': True,
+        'stress_minutes': 0.01, 'save_artifacts': False,
+        'stream_results': False,
+    }, None)
+    runner.ble.op_delay = 0
+    runner.ble.notify_hz = 20000
+    runner.run()
+
+    stop = [r for r in runner.result.tests if r.name == 'Stress - Stop']
+    assert stop and stop[0].values['cycles'] > 100
+
+
+def test_stress_error_still_disables_notify():
+    runner = test_runner.TestRunner({
+        'device_address': ADDRESS, 'simulate': True, 'stress': True,
+        'stress_iterations': 3, 'save_artifacts': False,
+        'stream_results': False,
+    }, None)
+    disabled = []
+    runner.ble.disable_notify = lambda svc, char: disabled.append(char)
+
+    def fail():
+        raise RuntimeError('GATT error 133')
+    runner.ble.clear_notify = fail
+    runner.run()
+
+    assert [r.name for r in runner.result.tests if r.suite == 'stress'] == ['Stress']
+    assert len(disabled) == 1
@@ -0,0 +1,37 @@
+"""Progress server access control."""
+import socket
+import urllib.error
+import urllib.request
+
+import pytest
+
+from core.progress_server import ProgressServer
+
+
+@pytest.fixture
+def server():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        port = s.getsockname()[1]
+    server = ProgressServer(host='127.0.0.1', port=port)
+    server.start()
+    yield server
+    server.stop()
+
+
+def _get(server, path):
+    return urllib.request.urlopen(f'http://127.0.0.1:{server.port}{path}', timeout=5)
+
+
+@pytest.mark.parametrize('query', ['', '?token=wrong'])
+def test_requests_without_the_token_are_rejected(server, query):
+    with pytest.raises(urllib.error.HTTPError) as e:
+        _get(server, '/status' + query)
+    assert e.value.code == 403
+
+
+def test_token_grants_access_without_cors(server):
+    response = _get(server, f'/status?token={server.token}')
+    assert response.status == 200
+    assert response.headers.get('Access-Control-Allow-Origin') is None
+    assert server.url.endswith(f'/?token={server.token}')
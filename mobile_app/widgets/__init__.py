@@ -0,0 +1 @@
+# UI widgets module
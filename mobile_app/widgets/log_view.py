@@ -0,0 +1,88 @@
+"""
+Log view for TestingScreen.
+Lines are kept in a fixed-size ring buffer and shown through a RecycleView,
+so only the visible rows exist as widgets and appending a line never
+re-renders the whole log.
+"""
+import textwrap
+from collections import deque
+
+from kivy.clock import Clock
+from kivy.metrics import dp, sp
+from kivy.uix.recycleview import RecycleView
+from kivy.uix.recycleboxlayout import RecycleBoxLayout
+from kivymd.uix.label import MDLabel
+
+SCROLLBACK = 10000     # lines kept in memory
+WRAP_CHARS = 56        # long lines are split so every row has the same height
+ROW_HEIGHT = dp(18)
+
+
+class LogLine(MDLabel):
+    """One recycled log row."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.font_size = sp(12)
+        self.size_hint_y = None
+        self.height = ROW_HEIGHT
+        self.halign = 'left'
+        self.valign = 'middle'
+
+
+class LogView(RecycleView):
+    """Scrollback log backed by a deque; redraws at most max_fps times per second."""
+
+    def __init__(self, scrollback=SCROLLBACK, max_fps=10, **kwargs):
+        super().__init__(**kwargs)
+        self.viewclass = LogLine
+        layout = RecycleBoxLayout(
+            orientation='vertical',
+            default_size=(None, ROW_HEIGHT),
+            default_size_hint=(1, None),
+            size_hint_y=None
+        )
+        layout.bind(minimum_height=layout.setter('height'))
+        self.add_widget(layout)
+
+        self._lines = deque(maxlen=scrollback)
+        self._appended = 0      # total lines ever appended
+        self._shown = 0         # value of _appended at the last flush
+        self._flush_trigger = Clock.create_trigger(self._flush, 1.0 / max_fps)
+
+    def append(self, text):
+        """Add one log entry (may contain newlines). Call on the main thread."""
+        for line in text.split('\n'):
+            for row in textwrap.wrap(line, WRAP_CHARS, subsequent_indent='    ') or ['']:
+                self._lines.append(row)
+                self._appended += 1
+        self._flush_trigger()
+
+    def clear(self):
+        self._lines.clear()
+        self._appended = self._shown = 0
+        self.data = []
+
+    def _flush(self, dt):
+        new = self._appended - self._shown
+        if not new:
+            return
+        follow = self.scroll_y <= 0.01 or not self.data
+        self._shown = self._appended
+
+        if new >= len(self._lines):
+            self.data = [{'text': line} for line in self._lines]
+        else:
+            tail = []
+            for line in reversed(self._lines):
+                if len(tail) == new:
+                    break
+                tail.append({'text': line})
+            tail.reverse()
+            self.data.extend(tail)
+            excess = len(self.data) - self._lines.maxlen
+            if excess > 0:
+                del self.data[:excess]
+
+        if follow:
+            Clock.schedule_once(lambda _dt: setattr(self, 'scroll_y', 0), 0)
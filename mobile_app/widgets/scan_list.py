@@ -0,0 +1,85 @@
+"""
+Recycled list of nearby advertisers for ScanScreen.
+The list is rebuilt from a ScanTable snapshot at a fixed rate (not per
+advertisement), and only when the table changed since the last redraw.
+"""
+from kivy.clock import Clock
+from kivy.metrics import dp
+from kivy.properties import StringProperty
+from kivy.uix.behaviors import ButtonBehavior
+from kivy.uix.recycleboxlayout import RecycleBoxLayout
+from kivy.uix.recycleview import RecycleView
+from kivymd.uix.label import MDLabel
+
+ROW_HEIGHT = dp(44)
+
+
+class ScanRow(ButtonBehavior, MDLabel):
+    """One recycled advertiser row; tapping it selects the device."""
+    address = StringProperty('')
+    device_name = StringProperty('')
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.markup = True
+        self.size_hint_y = None
+        self.height = ROW_HEIGHT
+
+    def on_release(self):
+        list_view = self.parent.parent if self.parent else None
+        if list_view is not None and list_view.on_select:
+            list_view.on_select(self.device_name, self.address)
+
+
+class ScanList(RecycleView):
+    """Advertiser list redrawn at `fps` from a ScanTable while started."""
+
+    def __init__(self, fps=4, on_select=None, **kwargs):
+        super().__init__(**kwargs)
+        self.viewclass = ScanRow
+        layout = RecycleBoxLayout(
+            orientation='vertical',
+            default_size=(None, ROW_HEIGHT),
+            default_size_hint=(1, None),
+            size_hint_y=None
+        )
+        layout.bind(minimum_height=layout.setter('height'))
+        self.add_widget(layout)
+        self.fps = fps
+        self.on_select = on_select
+        self.keyword = ''
+        self.table = None
+        self._event = None
+        self._version = -1
+
+    def start(self, table):
+        self.stop()
+        self.table = table
+        self._version = -1
+        self._event = Clock.schedule_interval(self._redraw, 1.0 / self.fps)
+
+    def stop(self):
+        if self._event is not None:
+            self._event.cancel()
+            self._event = None
+
+    def set_keyword(self, keyword):
+        self.keyword = keyword.strip()
+        self._version = -1
+
+    def _redraw(self, dt):
+        table = self.table
+        if table is None:
+            return
+        # snapshot() also expires stale devices, so run it even when idle
+        entries = table.snapshot(self.keyword)
+        if table.version == self._version:
+            return
+        self._version = table.version
+        self.data = [{
+            'address': e.address,
+            'device_name': e.name,
+            'text': f"[b]{e.name or 'Unknown'}[/b]  {e.address}\n"
+                    f"[size=12sp]{e.rssi:.0f} dBm   {e.rate:.1f} adv/s   "
+                    f"{e.count} seen[/size]",
+        } for e in entries]
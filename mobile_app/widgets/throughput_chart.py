@@ -0,0 +1,106 @@
+"""
+Live packets/s and loss-rate chart for TestingScreen.
+Reads a core.metrics.ThroughputMeter a few times per second and redraws two
+Line instructions in place; the meter's min/max buckets bound the number
+of points regardless of run length.
+"""
+from kivy.clock import Clock
+from kivy.graphics import Color, Line, Rectangle
+from kivy.metrics import dp
+from kivy.uix.widget import Widget
+from kivymd.uix.boxlayout import MDBoxLayout
+from kivymd.uix.label import MDLabel
+
+RATE_COLOR = (0.2, 0.6, 1, 1)
+LOSS_COLOR = (1, 0.3, 0.3, 1)
+MIN_LOSS_SCALE = 0.01       # loss axis shows at least 0-1 %
+
+
+class _ChartCanvas(Widget):
+    """Plot area: background plus one min/max polyline per series."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        with self.canvas:
+            Color(0.96, 0.96, 0.96, 1)
+            self._bg = Rectangle(pos=self.pos, size=self.size)
+            Color(*RATE_COLOR)
+            self._rate_line = Line(points=[], width=dp(1))
+            Color(*LOSS_COLOR)
+            self._loss_line = Line(points=[], width=dp(1))
+        self.bind(pos=self._sync_bg, size=self._sync_bg)
+
+    def _sync_bg(self, *args):
+        self._bg.pos = self.pos
+        self._bg.size = self.size
+
+    def plot(self, rate, loss):
+        if not rate:
+            self._rate_line.points = []
+            self._loss_line.points = []
+            return
+        t0 = rate[0][0]
+        span = max(rate[-1][0] - t0, 1e-6)
+        rate_max = max(p[2] for p in rate) or 1.0
+        loss_max = max(max((p[2] for p in loss), default=0.0), MIN_LOSS_SCALE)
+        self._rate_line.points = self._zigzag(rate, t0, span, rate_max * 1.1)
+        self._loss_line.points = self._zigzag(loss, t0, span, loss_max * 1.1)
+
+    def _zigzag(self, points, t0, span, vmax):
+        """Min/max envelope as one polyline: (x, min) -> (x, max) per bucket."""
+        x0, y0 = self.pos
+        w, h = self.size
+        out = []
+        for t, vmin, vhi, _mean in points:
+            x = x0 + (t - t0) / span * w
+            out += [x, y0 + vmin / vmax * h, x, y0 + vhi / vmax * h]
+        return out
+
+
+class ThroughputChart(MDBoxLayout):
+    """Header with current values above a live throughput/loss plot."""
+
+    def __init__(self, fps=4, **kwargs):
+        kwargs.setdefault('orientation', 'vertical')
+        kwargs.setdefault('size_hint', (1, None))
+        kwargs.setdefault('height', dp(110))
+        super().__init__(**kwargs)
+        self.fps = fps
+        self.meter = None
+        self._event = None
+
+        self.header = MDLabel(
+            text="Throughput: -",
+            theme_text_color="Secondary",
+            font_style="Caption",
+            size_hint_y=None,
+            height=dp(20)
+        )
+        self.add_widget(self.header)
+        self.canvas_widget = _ChartCanvas()
+        self.add_widget(self.canvas_widget)
+
+    def start(self, meter):
+        """Begin redrawing from meter (a ThroughputMeter)."""
+        self.stop()
+        self.meter = meter
+        self.canvas_widget.plot([], [])
+        self.header.text = "Throughput: -"
+        self._event = Clock.schedule_interval(self._redraw, 1.0 / self.fps)
+
+    def stop(self):
+        if self._event is not None:
+            self._event.cancel()
+            self._event = None
+
+    def _redraw(self, dt):
+        if self.meter is None:
+            return
+        rate, loss, totals = self.meter.snapshot()
+        if not totals['received']:
+            return
+        self.header.text = (
+            f"{totals['rate']:.1f} pkt/s  |  loss {totals['loss_rate']:.2%}  |  "
+            f"{totals['received']:,} rx, {totals['lost']:,} lost"
+        )
+        self.canvas_widget.plot(rate, loss)
@@ -0,0 +1,81 @@
+"""
+Live ECG waveform preview for TestingScreen.
+Pulls the newest samples from a core.ecg_packet.WaveformBuffer, reduces them
+to one min/max pair per pixel column and updates a single Line instruction;
+no widgets are created while running.
+"""
+from kivy.clock import Clock
+from kivy.graphics import Color, Line, Rectangle
+from kivy.metrics import dp
+from kivy.uix.widget import Widget
+
+from core.ecg_packet import minmax_downsample
+
+PREVIEW_SAMPLES = 1024     # samples shown across the widget width
+TRACE_COLOR = (0.2, 0.8, 0.4, 1)
+
+
+class WaveformView(Widget):
+    """Scrolling min/max ECG trace redrawn at `fps` while started."""
+
+    def __init__(self, fps=15, **kwargs):
+        kwargs.setdefault('size_hint', (1, None))
+        kwargs.setdefault('height', dp(90))
+        super().__init__(**kwargs)
+        self.fps = fps
+        self.buffer = None
+        self._event = None
+        self._last_pushed = -1
+        self._lo = -1.0
+        self._hi = 1.0
+        with self.canvas:
+            Color(0.08, 0.08, 0.08, 1)
+            self._bg = Rectangle(pos=self.pos, size=self.size)
+            Color(*TRACE_COLOR)
+            self._trace = Line(points=[], width=dp(1))
+        self.bind(pos=self._sync_bg, size=self._sync_bg)
+
+    def _sync_bg(self, *args):
+        self._bg.pos = self.pos
+        self._bg.size = self.size
+        self._last_pushed = -1
+
+    def start(self, buffer):
+        """Begin drawing from buffer (a WaveformBuffer)."""
+        self.stop()
+        self.buffer = buffer
+        self._trace.points = []
+        self._last_pushed = -1
+        self._event = Clock.schedule_interval(self._redraw, 1.0 / self.fps)
+
+    def stop(self):
+        if self._event is not None:
+            self._event.cancel()
+            self._event = None
+
+    def _redraw(self, dt):
+        buf = self.buffer
+        if buf is None or buf.pushed == self._last_pushed:
+            return
+        self._last_pushed = buf.pushed
+        columns = max(int(self.width), 1)
+        pairs = minmax_downsample(buf.samples(PREVIEW_SAMPLES), columns)
+        if not pairs:
+            return
+
+        # Autoscale with a little decay so the trace doesn't jump per frame
+        lo = min(p[0] for p in pairs)
+        hi = max(p[1] for p in pairs)
+        self._lo = lo if lo < self._lo else self._lo + (lo - self._lo) * 0.1
+        self._hi = hi if hi > self._hi else self._hi + (hi - self._hi) * 0.1
+        span = max(self._hi - self._lo, 1.0)
+
+        x0, y0 = self.pos
+        h = self.height - dp(4)
+        dx = self.width / max(len(pairs) - 1, 1)
+        points = []
+        for i, (vmin, vmax) in enumerate(pairs):
+            x = x0 + i * dx
+            points += [x, y0 + dp(2) + (vmin - self._lo) / span * h,
+                       x, y0 + dp(2) + (vmax - self._lo) / span * h]
+        self._trace.points = points
@@ -0,0 +1,166 @@
+"""Assign each pytest-xdist worker its own phone / patch pair from an inventory file.
+
+Inventory (path in DEVICE_INVENTORY), one entry per phone/patch pair:
+
+    {"devices": [
+        {"name": "bench-1", "udid": "R58N12ABCDE", "serial": "610031",
+         "appium_port": 4723, "system_port": 8200},
+        {"name": "bench-2", "udid": "R58N12FGHIJ", "serial": "610032",
+         "appium_url": "http://10.0.0.5:4724", "system_port": 8201}
+    ]}
+
+Worker gwN leases entry N (a run without xdist uses entry 0). The lease
+is applied by exporting the usual APPIUM_* / BLE_DEVICE_SERIAL variables
+in the worker process, so get_driver(), the fixtures and the adb helpers
+pick it up unchanged.
+"""
+import json
+import os
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+DEFAULT_SYSTEM_PORT = 8200
+
+
+class LeaseError(RuntimeError):
+    """No device can be leased to this worker."""
+
+
+@dataclass
+class DeviceSlot:
+    """One phone + patch pair on the bench."""
+    name: str
+    udid: str
+    serial: str
+    appium_url: str
+    system_port: int
+
+    def env(self) -> Dict[str, str]:
+        """Environment variables that point the test stack at this slot."""
+        return {
+            'APPIUM_DEVICE_NAME': self.udid,
+            'APPIUM_UDID': self.udid,
+            'APPIUM_SERVER_URL': self.appium_url,
+            'APPIUM_SYSTEM_PORT': str(self.system_port),
+            'BLE_DEVICE_SERIAL': self.serial,
+            'DEVICE_SLOT': self.name,
+        }
+
+    def apply(self):
+        os.environ.update(self.env())
+
+
+def load_inventory(path: str) -> List[DeviceSlot]:
+    """
+    Parse an inventory file.
+
+    Args:
+        path: JSON file with a "devices" list (or a bare list)
+
+    Returns:
+        DeviceSlots in file order
+
+    Raises:
+        LeaseError: If the file is missing fields or has duplicate ports
+    """
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    entries = data.get('devices', []) if isinstance(data, dict) else data
+
+    slots = []
+    for i, entry in enumerate(entries):
+        missing = [k for k in ('udid', 'serial') if not entry.get(k)]
+        if missing:
+            raise LeaseError(f"{path}: device #{i} is missing {', '.join(missing)}")
+        url = entry.get('appium_url') or f"http://localhost:{entry.get('appium_port', 4723)}"
+        slots.append(DeviceSlot(
+            name=entry.get('name') or entry['udid'],
+            udid=entry['udid'],
+            serial=str(entry['serial']),
+            appium_url=url,
+            system_port=int(entry.get('system_port', DEFAULT_SYSTEM_PORT + i)),
+        ))
+
+    for attr in ('udid', 'system_port'):
+        values = [getattr(s, attr) for s in slots]
+        if len(values) != len(set(values)):
+            raise LeaseError(f"{path}: duplicate {attr} values")
+    return slots
+
+
+def worker_index(worker_id: Optional[str] = None) -> int:
+    """0-based index of an xdist worker id ("gw3" -> 3); 0 without xdist."""
+    worker_id = worker_id or os.getenv('PYTEST_XDIST_WORKER', '')
+    m = re.fullmatch(r'gw(\d+)', worker_id)
+    return int(m.group(1)) if m else 0
+
+
+def lease_device(worker_id: Optional[str] = None) -> Optional[DeviceSlot]:
+    """
+    Lease and apply the slot for this worker.
+
+    Args:
+        worker_id: xdist worker id (default: PYTEST_XDIST_WORKER)
+
+    Returns:
+        The leased DeviceSlot, or None if DEVICE_INVENTORY is not set
+        (single-device mode from .env)
+
+    Raises:
+        LeaseError: If there are more workers than devices
+    """
+    path = os.getenv('DEVICE_INVENTORY')
+    if not path:
+        return None
+    slots = load_inventory(path)
+    index = worker_index(worker_id)
+    if index >= len(slots):
+        raise LeaseError(
+            f"Worker {worker_id or index} has no device: inventory {path} lists "
+            f"{len(slots)} device(s); run with -n {len(slots)} or fewer")
+    slot = slots[index]
+    slot.apply()
+    return slot
+
+
+class DeviceResults:
+    """Per-device outcome counts aggregated from test reports (xdist controller side)."""
+
+    def __init__(self):
+        self.devices: Dict[str, Dict[str, float]] = {}
+        self._outcomes: Dict[str, str] = {}
+
+    def add(self, report):
+        """Count one pytest TestReport tagged with a ("device", name) user property.
+
+        Each test counts once: the call outcome, or setup's if the test never
+        ran, overridden by 'failed' when teardown fails.
+        """
+        if report.when != 'call' and report.passed:
+            return
+        if report.when == 'teardown' and not report.failed:
+            return
+        device = dict(report.user_properties).get('device', 'unknown')
+        stats = self.devices.setdefault(
+            device, {'passed': 0, 'failed': 0, 'skipped': 0, 'duration': 0.0})
+        stats['duration'] += report.duration
+        outcome = 'failed' if report.failed else report.outcome
+        previous = self._outcomes.get(report.nodeid)
+        if previous == outcome or previous == 'failed':
+            return
+        if previous is not None:
+            stats[previous] -= 1
+        self._outcomes[report.nodeid] = outcome
+        stats[outcome] += 1
+
+    def lines(self) -> List[str]:
+        rows = [f"{'device':<20} {'passed':>6} {'failed':>6} {'skipped':>7} {'time':>8}"]
+        for device, s in sorted(self.devices.items()):
+            rows.append(f"{device:<20} {s['passed']:>6} {s['failed']:>6} "
+                        f"{s['skipped']:>7} {s['duration']:>7.1f}s")
+        return rows
+
+    def write(self, path: str):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.devices, f, indent=2)
@@ -1,11 +1,25 @@
 from appium import webdriver
 from appium.options.android import UiAutomator2Options
 import os
+from typing import Optional
 
+# Implicit wait used unless explicit-only wait mode is on
+IMPLICIT_WAIT = 10
 
-def get_driver():
+
+def explicit_waits_enabled() -> bool:
+    """True if APPIUM_EXPLICIT_WAITS asks for explicit-only wait mode."""
+    return os.getenv('APPIUM_EXPLICIT_WAITS', '').lower() in ('1', 'true', 'yes')
+
+
+def get_driver(explicit_waits: Optional[bool] = None):
     """Return an Appium webdriver.Remote instance using environment-configured capabilities.
 
+    With explicit_waits (default: APPIUM_EXPLICIT_WAITS) the implicit wait
+    is 0, so a missing element fails at once and all waiting happens in
+    BasePage's explicit waits. Otherwise the legacy 10 s implicit wait is
+    kept. The value in effect is stored as driver.implicit_wait_seconds.
+
     Environment variables:
       - APPIUM_SERVER_URL (default: http://localhost:4723)
       - APPIUM_PLATFORM_NAME (default: Android)
@@ -14,12 +28,24 @@ def get_driver():
       - APPIUM_AUTOMATION_NAME (default: UiAutomator2)
       - APPIUM_APP_PACKAGE (optional: app package name)
       - APPIUM_APP_ACTIVITY (optional: main activity)
+      - APPIUM_UDID (optional: adb serial of the phone to use)
+      - APPIUM_SYSTEM_PORT (optional: UiAutomator2 systemPort, unique per
+        phone when several sessions share one host)
+      - APPIUM_EXPLICIT_WAITS (optional: 1 for explicit-only wait mode)
     """
     # Create options object (new Appium API)
     options = UiAutomator2Options()
     options.platform_name = os.getenv('APPIUM_PLATFORM_NAME', 'Android')
     options.device_name = os.getenv('APPIUM_DEVICE_NAME', 'Android Emulator')
 
+    # Set per worker by tests/appium/device_lease.py when running in parallel
+    udid = os.getenv('APPIUM_UDID', '')
+    if udid:
+        options.udid = udid
+    system_port = os.getenv('APPIUM_SYSTEM_PORT', '')
+    if system_port:
+        options.system_port = int(system_port)
+
     app_path = os.getenv('APPIUM_APP_PATH', '')
     if app_path:
         options.app = app_path
@@ -40,5 +66,8 @@ def get_driver():
 
     server_url = os.getenv('APPIUM_SERVER_URL', 'http://localhost:4723')
     driver = webdriver.Remote(server_url, options=options)
-    driver.implicitly_wait(10)
+    if explicit_waits is None:
+        explicit_waits = explicit_waits_enabled()
+    driver.implicit_wait_seconds = 0 if explicit_waits else IMPLICIT_WAIT
+    driver.implicitly_wait(driver.implicit_wait_seconds)
     return driver
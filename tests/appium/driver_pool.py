@@ -0,0 +1,138 @@
+"""Reuse one healthy Appium session (and the BLE link set up on it) across tests."""
+import logging
+import time
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def session_alive(driver) -> bool:
+    """
+    Cheap liveness probe: one round-trip to the UiAutomator2 server.
+
+    get_window_size is answered by the on-device server without touching
+    adb or the view hierarchy, so it fails fast when the session, the
+    server or the device connection is gone.
+    """
+    try:
+        driver.get_window_size()
+        return True
+    except Exception as e:          # WebDriverException, or urllib3 connection errors
+        logger.warning(f"Driver liveness probe failed: {e.__class__.__name__}: {e}")
+        return False
+
+
+class DriverPool:
+    """
+    Holds one Appium session for the whole test session.
+
+    acquire() probes the current driver and only rebuilds it (new session
+    plus the setup callback, e.g. permissions and BLE connect) when the
+    probe fails, so suite setup normally runs once.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], object],
+        setup: Optional[Callable[[object], None]] = None,
+        probe: Callable[[object], bool] = session_alive,
+        max_builds: int = 3
+    ):
+        """
+        Initialize driver pool.
+
+        Args:
+            factory: Returns a new driver (e.g. get_driver)
+            setup: Prepares a new driver; raise to reject it
+            probe: Returns True if a driver is still usable
+            max_builds: Consecutive build attempts before giving up
+        """
+        self.factory = factory
+        self.setup = setup
+        self.probe = probe
+        self.max_builds = max_builds
+        self.builds = 0
+        self.probes = 0
+        self._driver = None
+        self._needs_setup = False
+
+    def acquire(self):
+        """
+        Return a healthy driver, rebuilding it if the probe fails.
+
+        Returns:
+            Appium WebDriver instance
+
+        Raises:
+            The last setup/factory error after max_builds failed attempts
+        """
+        if self._driver is not None:
+            self.probes += 1
+            if not self.probe(self._driver):
+                logger.warning("Appium session unhealthy — rebuilding")
+                self._discard()
+            elif not self._needs_setup:
+                return self._driver
+            else:
+                try:
+                    if self.setup is not None:
+                        self.setup(self._driver)
+                    self._needs_setup = False
+                    return self._driver
+                except Exception as e:
+                    logger.error(f"Setup on existing session failed: {e} — rebuilding")
+                    self._discard()
+
+        for attempt in range(1, self.max_builds + 1):
+            started = time.monotonic()
+            try:
+                driver = self.factory()
+            except Exception as e:
+                logger.error(f"Driver build {attempt}/{self.max_builds} failed: {e}")
+                if attempt == self.max_builds:
+                    raise
+                continue
+            try:
+                if self.setup is not None:
+                    self.setup(driver)
+            except Exception as e:
+                logger.error(f"Driver setup {attempt}/{self.max_builds} failed: {e}")
+                _quit(driver)
+                if attempt == self.max_builds:
+                    raise
+                continue
+            self.builds += 1
+            self._driver = driver
+            logger.info(f"Driver ready in {time.monotonic() - started:.1f}s "
+                        f"(build #{self.builds})")
+            return driver
+
+    def invalidate(self, keep_session: bool = False):
+        """
+        Make the next acquire() redo setup.
+
+        Args:
+            keep_session: Re-run only the setup callback on the current
+                session (e.g. after a test reset the BLE device) instead
+                of starting a new session
+        """
+        if keep_session and self._driver is not None:
+            self._needs_setup = True
+        else:
+            self._discard()
+
+    def close(self):
+        self._discard()
+
+    def _discard(self):
+        driver, self._driver = self._driver, None
+        self._needs_setup = False
+        if driver is not None:
+            _quit(driver)
+
+
+def _quit(driver):
+    try:
+        driver.quit()
+    except Exception:
+        pass
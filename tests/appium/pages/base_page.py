@@ -1,8 +1,10 @@
 """Base page object with common utilities for all page objects."""
 import logging
 import os
+import time
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Tuple, Optional
+from typing import Any, Callable, Dict, List, Sequence, Tuple, Optional, Union
 
 from appium.webdriver.common.appiumby import AppiumBy
 from selenium.webdriver.support.ui import WebDriverWait
@@ -11,13 +13,26 @@ from selenium.common.exceptions import (
     TimeoutException,
     NoSuchElementException,
     StaleElementReferenceException,
-    WebDriverException
+    WebDriverException,
+    InvalidSessionIdException,
+    InvalidSelectorException
 )
 
+from tests.appium.driver import IMPLICIT_WAIT
+from tests.appium.utils.locators import compile_locator, mark_fallback
+from tests.appium.utils.page_snapshot import PageSnapshot, SnapshotElement, UnsupportedLocator
+from tests.appium.utils.wait_ledger import ledger
+
+Locator = Tuple[str, str]
+
 
 class BasePage:
     """Base class for all page objects with common utilities."""
 
+    # Nodes whose text the app updates on its own; scroll_into_view() ignores
+    # their text when deciding that a swipe reached the end of the list
+    LIVE_VALUES: Tuple[Locator, ...] = ()
+
     def __init__(self, driver, timeout: int = 10):
         """
         Initialize base page.
@@ -31,6 +46,7 @@ class BasePage:
         self.wait = WebDriverWait(driver, timeout)
         self.logger = logging.getLogger(self.__class__.__name__)
         self.screenshot_dir = "screenshots"
+        self._snapshot = None
         self._ensure_screenshot_dir()
 
     def _ensure_screenshot_dir(self):
@@ -40,6 +56,24 @@ class BasePage:
 
     # ========== Wait Strategies ==========
 
+    def _until(self, condition, locator: Tuple[str, str], timeout: float):
+        """
+        Run an expected_conditions factory against the compiled locator.
+
+        XPath locators are sent as UiSelector / resource-id lookups when
+        compile_locator() can translate them. If the server rejects the
+        translation, the XPath is pinned to the slow path and retried.
+        """
+        compiled = compile_locator(locator)
+        wait = WebDriverWait(self.driver, timeout)
+        try:
+            return wait.until(condition(compiled))
+        except InvalidSelectorException as e:
+            if compiled == locator:
+                raise
+            mark_fallback(locator[1], f"rejected by server: {e.msg}")
+            return wait.until(condition(locator))
+
     def wait_for_element(
         self,
         locator: Tuple[str, str],
@@ -61,8 +95,7 @@ class BasePage:
         timeout = timeout or self.default_timeout
         try:
             self.logger.debug(f"Waiting for element: {locator}")
-            wait = WebDriverWait(self.driver, timeout)
-            element = wait.until(EC.presence_of_element_located(locator))
+            element = self._until(EC.presence_of_element_located, locator, timeout)
             self.logger.debug(f"Element found: {locator}")
             return element
         except TimeoutException:
@@ -88,8 +121,7 @@ class BasePage:
         timeout = timeout or self.default_timeout
         try:
             self.logger.debug(f"Waiting for element to be visible: {locator}")
-            wait = WebDriverWait(self.driver, timeout)
-            element = wait.until(EC.visibility_of_element_located(locator))
+            element = self._until(EC.visibility_of_element_located, locator, timeout)
             self.logger.debug(f"Element visible: {locator}")
             return element
         except TimeoutException:
@@ -115,8 +147,7 @@ class BasePage:
         timeout = timeout or self.default_timeout
         try:
             self.logger.debug(f"Waiting for element to be clickable: {locator}")
-            wait = WebDriverWait(self.driver, timeout)
-            element = wait.until(EC.element_to_be_clickable(locator))
+            element = self._until(EC.element_to_be_clickable, locator, timeout)
             self.logger.debug(f"Element clickable: {locator}")
             return element
         except TimeoutException:
@@ -144,8 +175,7 @@ class BasePage:
         timeout = timeout or self.default_timeout
         try:
             self.logger.debug(f"Waiting for text '{text}' in element: {locator}")
-            wait = WebDriverWait(self.driver, timeout)
-            wait.until(EC.text_to_be_present_in_element(locator, text))
+            self._until(lambda loc: EC.text_to_be_present_in_element(loc, text), locator, timeout)
             self.logger.debug(f"Text '{text}' found in element: {locator}")
             return True
         except TimeoutException:
@@ -154,6 +184,28 @@ class BasePage:
 
     # ========== Element Finding ==========
 
+    def find(self, locator: Tuple[str, str]):
+        """
+        Find element without an explicit wait, using the accelerated locator.
+
+        Args:
+            locator: Tuple of (By strategy, value)
+
+        Returns:
+            WebElement
+
+        Raises:
+            NoSuchElementException: If element not found
+        """
+        compiled = compile_locator(locator)
+        try:
+            return self.driver.find_element(*compiled)
+        except InvalidSelectorException as e:
+            if compiled == locator:
+                raise
+            mark_fallback(locator[1], f"rejected by server: {e.msg}")
+            return self.driver.find_element(*locator)
+
     def find_element_by_id(self, element_id: str):
         """Find element by resource ID."""
         locator = (AppiumBy.ID, element_id)
@@ -191,6 +243,196 @@ class BasePage:
         """Find all elements with given class name."""
         return self.driver.find_elements(AppiumBy.CLASS_NAME, class_name)
 
+    # ========== Page Snapshot ==========
+
+    def snapshot(self, refresh: bool = False) -> PageSnapshot:
+        """
+        Return the parsed page source, fetching it with one HTTP call if needed.
+
+        The snapshot is reused until the next UI action made through this
+        page object (click, send keys, scroll) or until refresh=True. Use
+        refresh=True when the screen may have changed on its own, e.g.
+        after waiting for the device to respond.
+
+        Args:
+            refresh: Force a new page_source fetch
+
+        Returns:
+            PageSnapshot
+        """
+        if self._snapshot is None or refresh:
+            started = time.perf_counter()
+            self._snapshot = PageSnapshot(self.driver.page_source)
+            self.logger.debug(
+                f"Page snapshot fetched in {(time.perf_counter() - started) * 1000:.0f} ms")
+        return self._snapshot
+
+    def invalidate_snapshot(self):
+        """Drop the cached snapshot (called after every UI action)."""
+        self._snapshot = None
+
+    def snapshot_find_all(
+        self,
+        locator: Tuple[str, str],
+        refresh: bool = False
+    ) -> List[SnapshotElement]:
+        """Find all elements matching locator in the page snapshot."""
+        return self.snapshot(refresh).find_all(locator)
+
+    def snapshot_text(
+        self,
+        locator: Tuple[str, str],
+        refresh: bool = False
+    ) -> Optional[str]:
+        """Text of the first element matching locator in the snapshot, or None."""
+        return self.snapshot(refresh).text_of(locator)
+
+    def snapshot_texts(
+        self,
+        locators: Dict[str, Tuple[str, str]],
+        refresh: bool = False
+    ) -> Dict[str, Optional[str]]:
+        """
+        Resolve many named locators against one snapshot.
+
+        Args:
+            locators: Mapping of name -> (By strategy, value)
+            refresh: Force a new page_source fetch first
+
+        Returns:
+            Mapping of name -> text (None where nothing matched)
+        """
+        return self.snapshot(refresh).resolve(locators)
+
+    # ========== Condition Waits ==========
+
+    def wait_until(
+        self,
+        condition: Callable[[], Any],
+        timeout: Optional[float] = None,
+        message: str = "condition",
+        replaces: Optional[float] = None,
+        poll: float = 0.2,
+        max_poll: float = 1.0,
+        backoff: float = 1.5
+    ) -> Any:
+        """
+        Poll condition with backoff and return its first truthy result.
+
+        The first check runs immediately; the delay between checks starts at
+        poll seconds and grows by backoff up to max_poll. WebDriverExceptions
+        raised by condition (stale elements, transient UiAutomator errors)
+        count as "not yet"; a terminated session is re-raised at once.
+
+        Args:
+            condition: Zero-argument callable; any truthy return ends the wait
+            timeout: Maximum seconds to wait (default: page timeout)
+            message: Description used in logs and the timeout error
+            replaces: Fixed sleep in seconds this wait stands in for; when
+                given, the wait is recorded in the time-saved ledger
+            poll: Initial delay between checks in seconds
+            max_poll: Upper bound for the delay between checks
+            backoff: Multiplier applied to the delay after each check
+
+        Returns:
+            The truthy value returned by condition
+
+        Raises:
+            TimeoutException: If condition stays falsy for timeout seconds
+        """
+        timeout = timeout if timeout is not None else self.default_timeout
+        started = time.monotonic()
+        deadline = started + timeout
+        interval = poll
+        checks = 0
+        while True:
+            checks += 1
+            try:
+                value = condition()
+            except InvalidSessionIdException:
+                raise
+            except WebDriverException as e:
+                self.logger.debug(f"Waiting for {message}: {e.__class__.__name__}")
+                value = None
+            elapsed = time.monotonic() - started
+            if value:
+                self.logger.debug(f"{message} after {elapsed:.2f}s ({checks} checks)")
+                if replaces is not None:
+                    ledger.record(message, replaces, elapsed)
+                return value
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                if replaces is not None:
+                    ledger.record(message, replaces, elapsed)
+                self.logger.warning(f"Timed out after {elapsed:.1f}s waiting for {message}")
+                raise TimeoutException(f"Timed out after {timeout}s waiting for {message}")
+            time.sleep(min(interval, remaining))
+            interval = min(interval * backoff, max_poll)
+
+    def wait_for_screen(
+        self,
+        markers: Union[Locator, Sequence[Locator]],
+        timeout: Optional[float] = None,
+        replaces: Optional[float] = None
+    ) -> Locator:
+        """
+        Wait until any screen marker is present in a fresh page snapshot.
+
+        Markers are resolved locally (see PageSnapshot), so a check costs one
+        page_source call and never blocks on the driver's implicit wait.
+
+        Args:
+            markers: One locator or a sequence of locators
+            timeout: Maximum seconds to wait (default: page timeout)
+            replaces: Fixed sleep this wait stands in for (time-saved ledger)
+
+        Returns:
+            The first marker found
+
+        Raises:
+            TimeoutException: If no marker appears within timeout
+        """
+        if isinstance(markers[0], str):
+            markers = [markers]
+
+        def _present():
+            snapshot = self.snapshot(refresh=True)
+            return next((m for m in markers if snapshot.has(m)), None)
+
+        names = ', '.join(m[1] for m in markers)
+        return self.wait_until(_present, timeout, f"screen marker {names}", replaces)
+
+    def wait_for_text_change(
+        self,
+        locator: Locator,
+        previous: Optional[str],
+        timeout: Optional[float] = None,
+        replaces: Optional[float] = None
+    ) -> str:
+        """
+        Wait until the element's text is non-empty and differs from previous.
+
+        Typical use: read the value TextView, trigger a device read, then
+        wait for the TextView to show the response.
+
+        Args:
+            locator: Snapshot-resolvable locator of the value element
+            previous: Text before the action (None or '' if absent/empty)
+            timeout: Maximum seconds to wait (default: page timeout)
+            replaces: Fixed sleep this wait stands in for (time-saved ledger)
+
+        Returns:
+            The new text
+
+        Raises:
+            TimeoutException: If the text does not change within timeout
+        """
+        def _changed():
+            text = self.snapshot_text(locator, refresh=True)
+            return text if text and text.strip() and text != previous else None
+
+        return self.wait_until(_changed, timeout, f"text change in {locator[1]}", replaces)
+
     # ========== Safe Interactions ==========
 
     def safe_click(
@@ -210,6 +452,7 @@ class BasePage:
         Returns:
             True if click succeeded, False otherwise
         """
+        self.invalidate_snapshot()
         for attempt in range(retries):
             try:
                 element = self.wait_for_element_clickable(locator, timeout)
@@ -243,6 +486,7 @@ class BasePage:
         Returns:
             True if successful
         """
+        self.invalidate_snapshot()
         try:
             element = self.wait_for_element_visible(locator)
             if clear_first:
@@ -301,6 +545,72 @@ class BasePage:
         except TimeoutException:
             return False
 
+    @property
+    def implicit_wait(self) -> float:
+        """Implicit wait configured on the driver (0 in explicit-only mode)."""
+        return getattr(self.driver, 'implicit_wait_seconds', IMPLICIT_WAIT)
+
+    @contextmanager
+    def no_implicit_wait(self):
+        """Temporarily set the implicit wait to 0 (no-op in explicit-only mode)."""
+        implicit = self.implicit_wait
+        if not implicit:
+            yield
+            return
+        self.driver.implicitly_wait(0)
+        try:
+            yield
+        finally:
+            self.driver.implicitly_wait(implicit)
+
+    def is_element_absent(
+        self,
+        locator: Tuple[str, str],
+        timeout: float = 0
+    ) -> bool:
+        """
+        Check that element is absent without paying the implicit wait.
+
+        In explicit-only mode this is a single find_elements call. With an
+        implicit wait configured, the locator is resolved against a fresh
+        page snapshot instead, and only locators the snapshot can't resolve
+        fall back to find_elements with the implicit wait switched off.
+
+        Args:
+            locator: Tuple of (By strategy, value)
+            timeout: Keep checking up to this many seconds for the element
+                to disappear (0: check once)
+
+        Returns:
+            True if element absent, False otherwise
+        """
+        if not self._present_now(locator):
+            return True
+        if timeout <= 0:
+            return False
+        try:
+            self.wait_until(lambda: not self._present_now(locator), timeout,
+                            f"absence of {locator[1]}")
+            return True
+        except TimeoutException:
+            return False
+
+    def _present_now(self, locator: Tuple[str, str]) -> bool:
+        if self.implicit_wait:
+            try:
+                return self.snapshot(refresh=True).has(locator)
+            except UnsupportedLocator:
+                pass
+        with self.no_implicit_wait():
+            compiled = compile_locator(locator)
+            try:
+                return bool(self.driver.find_elements(*compiled))
+            except InvalidSelectorException as e:
+                if compiled == locator:
+                    raise
+                mark_fallback(locator[1], f"rejected by server: {e.msg}")
+                return bool(self.driver.find_elements(*locator))
+
     def is_element_visible(
         self,
         locator: Tuple[str, str],
@@ -361,6 +671,7 @@ class BasePage:
             start_y = size['height'] * 0.8
             end_y = size['height'] * 0.2
 
+            self.invalidate_snapshot()
             self.driver.swipe(start_x, start_y, start_x, end_y, duration)
             self.logger.debug("Scrolled down")
         except Exception as e:
@@ -379,11 +690,77 @@ class BasePage:
             start_y = size['height'] * 0.2
             end_y = size['height'] * 0.8
 
+            self.invalidate_snapshot()
             self.driver.swipe(start_x, start_y, start_x, end_y, duration)
             self.logger.debug("Scrolled up")
         except Exception as e:
             self.logger.error(f"Failed to scroll up: {e}")
 
+    def scroll_into_view(
+        self,
+        locator: Tuple[str, str],
+        max_swipes: int = 5,
+        direction: str = "down"
+    ):
+        """
+        Scroll the first scrollable container until element is on screen.
+
+        The common case is one UiScrollable(...).scrollIntoView(...) command
+        executed on the device. If the locator has no UiSelector form or the
+        screen has no scrollable container, falls back to a bounded swipe
+        loop that stops early once a swipe leaves the page unchanged apart
+        from LIVE_VALUES (end of list, see PageSnapshot.same_page).
+
+        Args:
+            locator: Tuple of (By strategy, value)
+            max_swipes: Maximum swipes (device-side search and fallback loop)
+            direction: Fallback swipe direction, "down" or "up"
+
+        Returns:
+            WebElement if found, None otherwise
+        """
+        selector = self._uiselector(locator)
+        if selector is not None:
+            scrollable = (
+                AppiumBy.ANDROID_UIAUTOMATOR,
+                "new UiScrollable(new UiSelector().scrollable(true))"
+                f".setMaxSearchSwipes({max_swipes}).scrollIntoView({selector})"
+            )
+            self.invalidate_snapshot()
+            started = time.perf_counter()
+            try:
+                with self.no_implicit_wait():
+                    element = self.driver.find_element(*scrollable)
+                self.logger.info(
+                    f"Scrolled {locator[1]} into view in {time.perf_counter() - started:.1f}s")
+                return element
+            except (NoSuchElementException, InvalidSelectorException) as e:
+                self.logger.debug(f"UiScrollable search failed for {locator[1]}: {e.__class__.__name__}")
+
+        previous = None
+        for swipe in range(max_swipes + 1):
+            snapshot = self.snapshot(refresh=True)
+            try:
+                found = snapshot.has(locator)
+            except UnsupportedLocator:
+                found = not self.is_element_absent(locator)
+            if found:
+                self.logger.info(f"Element found after {swipe} swipes")
+                return self.find(locator)
+            if previous is not None and snapshot.same_page(previous, self.LIVE_VALUES):
+                self.logger.info(f"Reached end of list after {swipe} swipes")
+                break
+            previous = snapshot
+            if swipe == max_swipes:
+                break
+            if direction == "down":
+                self.scroll_down()
+            else:
+                self.scroll_up()
+
+        self.logger.warning(f"Element not found by scrolling: {locator}")
+        return None
+
     def scroll_to_element(
         self,
         locator: Tuple[str, str],
@@ -399,11 +776,13 @@ class BasePage:
         Returns:
             True if element found, False otherwise
         """
-        for i in range(max_scrolls):
-            if self.is_element_visible(locator, timeout=2):
-                self.logger.info(f"Element found after {i} scrolls")
-                return True
-            self.scroll_down()
-
-        self.logger.warning(f"Element not found after {max_scrolls} scrolls")
-        return False
+        return self.scroll_into_view(locator, max_scrolls) is not None
+
+    def _uiselector(self, locator: Tuple[str, str]) -> Optional[str]:
+        """UiSelector expression equivalent to locator, if there is one."""
+        by, value = compile_locator(locator)
+        if by == AppiumBy.ANDROID_UIAUTOMATOR:
+            return value
+        if by == AppiumBy.ID and ':id/' in value:
+            return f'new UiSelector().resourceId("{value}")'
+        return None
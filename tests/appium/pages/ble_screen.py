@@ -192,53 +192,32 @@ class BLEScreen(BasePage):
         devices = []
 
         try:
+            # One page_source fetch; every item and field resolves locally
+            snapshot = self.snapshot(refresh=True)
+
             # Find all device items in list
-            device_elements = self.driver.find_elements(*self.DEVICE_ITEM)
+            device_elements = snapshot.find_all(self.DEVICE_ITEM)
 
             if not device_elements:
                 # Try finding by device name elements
-                device_elements = self.driver.find_elements(*self.DEVICE_NAME_TEXT)
+                device_elements = snapshot.find_all(self.DEVICE_NAME_TEXT)
 
             self.logger.info(f"Found {len(device_elements)} device elements")
 
             for device_elem in device_elements:
-                try:
-                    # Extract device info
-                    device_info = {
-                        "name": "",
-                        "mac": "",
-                        "rssi": ""
-                    }
-
-                    # Try to get device name
-                    try:
-                        name_elem = device_elem.find_element(*self.DEVICE_NAME_TEXT)
-                        device_info["name"] = name_elem.text
-                    except:
-                        # Fallback: use device element text
-                        device_info["name"] = device_elem.text
-
-                    # Try to get MAC address
-                    try:
-                        mac_elem = device_elem.find_element(*self.DEVICE_MAC_TEXT)
-                        device_info["mac"] = mac_elem.text
-                    except:
-                        pass
-
-                    # Try to get RSSI
-                    try:
-                        rssi_elem = device_elem.find_element(*self.DEVICE_RSSI_TEXT)
-                        device_info["rssi"] = rssi_elem.text
-                    except:
-                        pass
-
-                    if device_info["name"]:
-                        devices.append(device_info)
-                        self.logger.debug(f"Device: {device_info}")
-
-                except Exception as e:
-                    self.logger.debug(f"Error parsing device element: {e}")
-                    continue
+                # Extract device info; fall back to the item's own text for the name
+                name_elem = device_elem.find(self.DEVICE_NAME_TEXT)
+                mac_elem = device_elem.find(self.DEVICE_MAC_TEXT)
+                rssi_elem = device_elem.find(self.DEVICE_RSSI_TEXT)
+                device_info = {
+                    "name": name_elem.text if name_elem else device_elem.text,
+                    "mac": mac_elem.text if mac_elem else "",
+                    "rssi": rssi_elem.text if rssi_elem else ""
+                }
+
+                if device_info["name"]:
+                    devices.append(device_info)
+                    self.logger.debug(f"Device: {device_info}")
 
             return devices
 
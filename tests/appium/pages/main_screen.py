@@ -22,6 +22,7 @@ class MainScreen(BasePage):
     CONNECTION_STATUS_LABEL = (AppiumBy.XPATH, "//*[@text='Connection Status']")
     CONNECTION_STATUS_TEXT = (AppiumBy.XPATH, "//*[@text='DISCONNECTED' or @text='CONNECTED']")
     RSSI_LABEL = (AppiumBy.XPATH, "//*[@text='RSSI']")
+    RSSI_VALUE = (AppiumBy.XPATH, "//*[@text='RSSI']/following-sibling::android.widget.TextView[1]")
 
     # Link screen elements
     SERIAL_NUMBER_INPUT = (AppiumBy.XPATH, "//android.widget.EditText")
@@ -143,7 +144,7 @@ class MainScreen(BasePage):
                 return False
 
             # Enter text
-            elem = self.driver.find_element(*self.SERIAL_NUMBER_INPUT)
+            elem = self.find(self.SERIAL_NUMBER_INPUT)
             elem.clear()
             elem.send_keys(serial_number)
 
@@ -179,11 +180,10 @@ class MainScreen(BasePage):
         self.logger.info("Getting RSSI value")
         try:
             # RSSI value is the text element right after RSSI label
-            rssi_value = self.driver.find_element(
-                AppiumBy.XPATH,
-                "//*[@text='RSSI']/following-sibling::android.widget.TextView[1]"
-            )
-            value = rssi_value.text
+            value = self.snapshot_text(self.RSSI_VALUE, refresh=True)
+            if value is None:
+                self.logger.error("RSSI value not found")
+                return "0"
             self.logger.info(f"RSSI value: {value}")
             return value
         except Exception as e:
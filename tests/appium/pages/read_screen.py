@@ -1,10 +1,17 @@
 """Read screen page object for SDK Sample app."""
 import re
 import time
+from typing import Dict, List, Optional, Tuple
 from appium.webdriver.common.appiumby import AppiumBy
+from selenium.common.exceptions import TimeoutException
 from tests.appium.pages.base_page import BasePage
 
 
+def _value_after(label: str) -> Tuple[str, str]:
+    """Locator of the value TextView that follows a Read screen label."""
+    return (AppiumBy.XPATH, f"//*[@text='{label}']/following-sibling::android.widget.TextView[1]")
+
+
 class ReadScreen(BasePage):
     """Page object for Read screen where device information can be read."""
 
@@ -19,6 +26,7 @@ class ReadScreen(BasePage):
     FW_VERSION_LABEL = (AppiumBy.XPATH, "//*[@text='Firmware Version']")
     HW_VERSION_LABEL = (AppiumBy.XPATH, "//*[@text='Hardware Version']")
     SW_VERSION_LABEL = (AppiumBy.XPATH, "//*[@text='Software Version']")
+    MANUFACTURE_NAME_LABEL = (AppiumBy.XPATH, "//*[@text='Manufacture Name']")
 
     # Read options - Buttons (clickable to execute read operation)
     BATTERY_BUTTON = (AppiumBy.XPATH, "//*[@text='BATTERY']")
@@ -27,6 +35,37 @@ class ReadScreen(BasePage):
     FW_VERSION_BUTTON = (AppiumBy.XPATH, "//*[@text='FIRMWARE VERSION']")
     HW_VERSION_BUTTON = (AppiumBy.XPATH, "//*[@text='HARDWARE VERSION']")
     SW_VERSION_BUTTON = (AppiumBy.XPATH, "//*[@text='SOFTWARE VERSION']")
+    MANUFACTURE_NAME_BUTTON = (AppiumBy.XPATH, "//*[@text='MANUFACTURE NAME']")
+
+    # Read values - TextView right after each label
+    BATTERY_VALUE = _value_after('Battery')
+    MODEL_NUMBER_VALUE = _value_after('Model Number')
+    SERIAL_NUMBER_VALUE = _value_after('Serial Number')
+    FW_VERSION_VALUE = _value_after('Firmware Version')
+    HW_VERSION_VALUE = _value_after('Hardware Version')
+    SW_VERSION_VALUE = _value_after('Software Version')
+    MANUFACTURE_NAME_VALUE = _value_after('Manufacture Name')
+
+    # Top menu tab that opens this screen
+    READ_TAB = (AppiumBy.XPATH, "//*[@text='Read']")
+
+    # Seconds after a tap before an unchanged, non-empty value counts as the
+    # response (a re-read of a static characteristic shows the same text)
+    READ_SETTLE = 2.0
+
+    # (name, button, value) in on-screen order, top to bottom
+    CHARACTERISTICS = (
+        ('battery', BATTERY_BUTTON, BATTERY_VALUE),
+        ('model_number', MODEL_NUMBER_BUTTON, MODEL_NUMBER_VALUE),
+        ('serial_number', SERIAL_NUMBER_BUTTON, SERIAL_NUMBER_VALUE),
+        ('fw_version', FW_VERSION_BUTTON, FW_VERSION_VALUE),
+        ('hw_version', HW_VERSION_BUTTON, HW_VERSION_VALUE),
+        ('sw_version', SW_VERSION_BUTTON, SW_VERSION_VALUE),
+        ('manufacture_name', MANUFACTURE_NAME_BUTTON, MANUFACTURE_NAME_VALUE),
+    )
+
+    # Values fill in as read responses arrive, including mid-scroll
+    LIVE_VALUES = tuple(value for _, _, value in CHARACTERISTICS)
 
     def __init__(self, driver):
         """Initialize read screen page object."""
@@ -54,6 +93,153 @@ class ReadScreen(BasePage):
             self.take_screenshot("read_screen_not_loaded")
             return False
 
+    def open(
+        self,
+        marker: Tuple[str, str] = FW_VERSION_BUTTON,
+        timeout: float = 10
+    ) -> bool:
+        """
+        Tap the Read tab and wait for the screen to show marker.
+
+        Replaces the fixed 3 s post-navigation sleep: returns as soon as
+        marker is on screen.
+
+        Args:
+            marker: Locator that proves the screen (or the part of it the
+                caller needs) has loaded
+            timeout: Maximum seconds to wait for marker
+
+        Returns:
+            True if marker appeared
+        """
+        self.logger.info("Opening Read screen")
+        if not self.safe_click(self.READ_TAB):
+            return False
+        try:
+            self.wait_for_screen(marker, timeout, replaces=3)
+            return True
+        except TimeoutException:
+            self.take_screenshot("read_screen_marker_missing")
+            return False
+
+    def read_characteristic(
+        self,
+        button: Tuple[str, str],
+        value: Tuple[str, str],
+        timeout: float = 10
+    ) -> Optional[str]:
+        """
+        Tap a read button and wait for its value TextView to update.
+
+        Replaces the fixed 5 s post-read sleep. If the value does not change
+        within timeout but a value was already displayed (the same
+        characteristic was read earlier in the session and the device
+        returned the same thing), that value is returned.
+
+        Args:
+            button: Read button locator
+            value: Value TextView locator
+            timeout: Maximum seconds to wait for the device response
+
+        Returns:
+            The displayed value, or None if nothing was displayed
+        """
+        previous = self.snapshot_text(value, refresh=True)
+        self.logger.info(f"Reading {button[1]} (previous value: {previous!r})")
+        if not self.safe_click(button):
+            return None
+        try:
+            return self.wait_for_text_change(value, previous, timeout, replaces=5)
+        except TimeoutException:
+            current = self.snapshot_text(value, refresh=True)
+            if current and current.strip():
+                self.logger.info(f"Value unchanged after read: {current!r}")
+                return current
+            self.take_screenshot("read_value_missing")
+            return None
+
+    def read_all(self, timeout: float = 15) -> Dict[str, Optional[str]]:
+        """
+        Read every Device Information characteristic in one navigation.
+
+        Opens the screen once, then works through CHARACTERISTICS one screen
+        position at a time: taps every read button on screen, waits until
+        all of their value slots show a response to the tap, and takes the
+        values from that snapshot. Buttons below the fold are brought in with
+        scroll_into_view(). Slots that stay empty are retried one at a time
+        with read_characteristic(), in case the device dropped a read that
+        was queued behind another.
+
+        Args:
+            timeout: Maximum seconds to wait for one screenful of responses
+
+        Returns:
+            Mapping of CHARACTERISTICS name -> value (None if not read)
+        """
+        values = {name: None for name, _, _ in self.CHARACTERISTICS}
+        self.logger.info("Reading all characteristics")
+        # Battery BLE service loads slower than DevInfo
+        if not self.open(marker=self.BATTERY_BUTTON, timeout=30):
+            return values
+
+        remaining = list(self.CHARACTERISTICS)
+        while remaining:
+            snapshot = self.snapshot(refresh=True)
+            batch = [c for c in remaining if snapshot.has(c[1])]
+            if not batch:
+                if self.scroll_into_view(remaining[0][1]) is None:
+                    self.logger.warning(f"Read button not found: {remaining[0][1][1]}")
+                    remaining.pop(0)
+                continue
+            remaining = [c for c in remaining if c not in batch]
+            values.update(self._read_batch(batch, snapshot, timeout))
+
+        self.logger.info(f"Read all characteristics: {values}")
+        return values
+
+    def _read_batch(self, batch: List[tuple], snapshot, timeout: float) -> Dict[str, Optional[str]]:
+        """
+        Tap every button in batch, then wait for all value slots at once.
+
+        A slot has responded when it shows a non-empty value that differs
+        from the one before the tap, or - if it already showed a value, e.g.
+        from an earlier read_all() on the shared session - any non-empty
+        value READ_SETTLE seconds after its tap.
+        """
+        previous = {name: snapshot.text_of(value) for name, _, value in batch}
+        tapped = {}
+        for name, button, _ in batch:
+            if self.safe_click(button):
+                tapped[name] = time.monotonic()
+
+        def _responded(text, name):
+            if not (text and text.strip()):
+                return False
+            if text != previous[name]:
+                return True
+            return name in tapped and time.monotonic() - tapped[name] >= self.READ_SETTLE
+
+        def _all_responded():
+            current = self.snapshot(refresh=True).resolve({name: value for name, _, value in batch})
+            return current if all(_responded(current[n], n) for n in current) else None
+
+        try:
+            return self.wait_until(_all_responded, timeout, f"{len(batch)} read values",
+                                   replaces=5 * len(batch))
+        except TimeoutException:
+            pass
+
+        current = self.snapshot(refresh=True).resolve({name: value for name, _, value in batch})
+        for name, button, value in batch:
+            if _responded(current[name], name):
+                continue
+            if current[name] and current[name].strip():
+                self.logger.info(f"{name} unchanged after read: {current[name]!r}")
+                continue
+            self.logger.info(f"Retrying read of {name}")
+            current[name] = self.read_characteristic(button, value, timeout)
+        return current
+
     def select_firmware_version(self) -> bool:
         """
         Click 'FIRMWARE VERSION' button to read firmware version from device.
@@ -113,7 +299,7 @@ class ReadScreen(BasePage):
         The version appears in a TextView immediately following the "Firmware Version" label.
 
         Args:
-            wait_time: Time to wait for version to appear (device communication time)
+            wait_time: Maximum time to wait for version to appear (device communication time)
 
         Returns:
             Firmware version string or empty string if not found
@@ -121,16 +307,20 @@ class ReadScreen(BasePage):
         self.logger.info("Reading firmware version from display")
         try:
             # Give device time to communicate and respond
-            time.sleep(wait_time)
+            try:
+                self.wait_until(
+                    lambda: self.snapshot_text(self.FW_VERSION_VALUE, refresh=True),
+                    wait_time, "firmware version value", replaces=wait_time)
+            except TimeoutException:
+                pass
+
+            # One page_source fetch; both methods below resolve against it
+            snapshot = self.snapshot()
 
             # Method 1: Find the TextView right after "Firmware Version" label
             # XPath: Get the next sibling TextView after Firmware Version label
             try:
-                fw_value_elem = self.driver.find_element(
-                    AppiumBy.XPATH,
-                    "//*[@text='Firmware Version']/following-sibling::android.widget.TextView[1]"
-                )
-                version_text = fw_value_elem.text
+                version_text = snapshot.text_of(self.FW_VERSION_VALUE)
                 if version_text:
                     fw_version = self._extract_version_from_text(version_text)
                     if fw_version:
@@ -144,17 +334,11 @@ class ReadScreen(BasePage):
                 self.logger.debug(f"Method 1 failed: {e}")
 
             # Method 2: Search all TextViews for version pattern
-            text_views = self.find_elements_by_class("android.widget.TextView")
-            for tv in text_views:
-                try:
-                    text = tv.text
-                    if text:
-                        fw_version = self._extract_version_from_text(text)
-                        if fw_version:
-                            self.logger.info(f"Found FW version in TextView: {fw_version}")
-                            return fw_version
-                except:
-                    continue
+            for text in snapshot.texts("android.widget.TextView"):
+                fw_version = self._extract_version_from_text(text)
+                if fw_version:
+                    self.logger.info(f"Found FW version in TextView: {fw_version}")
+                    return fw_version
 
             self.logger.warning("Could not find firmware version display")
             self.take_screenshot("fw_version_not_found")
@@ -238,6 +422,7 @@ class ReadScreen(BasePage):
                 return True
 
             # Try system back button
+            self.invalidate_snapshot()
             self.driver.back()
             self.logger.info("Used system back button")
             return True
@@ -0,0 +1,207 @@
+"""Persistent `adb shell` session for frequent device commands.
+
+One `adb shell` process per device is kept open and fed commands over
+stdin. Each command is followed by an end marker carrying a unique token
+and the exit status, printed after a newline so it starts its own line
+even when the output doesn't end with one. Outputs are thus correlated
+with their commands. A dead or stuck session is replaced transparently
+on the next command.
+"""
+import logging
+import queue
+import subprocess
+import threading
+import time
+import uuid
+from typing import Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_MARK = '__ADB_END__'
+
+
+class AdbShellError(RuntimeError):
+    """The adb shell session could not run a command."""
+
+
+class AdbShell:
+    """One long-lived `adb shell` process for a device."""
+
+    def __init__(self, device: Optional[str] = None, timeout: float = 10):
+        """
+        Initialize adb shell client (the session starts on first use).
+
+        Args:
+            device: adb serial (None: the only connected device)
+            timeout: Default per-command timeout in seconds
+        """
+        self.device = device or None
+        self.timeout = timeout
+        self.restarts = -1          # the first start is not a restart
+        self.commands = 0
+        self._process = None
+        self._lines = None
+        self._lock = threading.Lock()
+
+    # ========== Session ==========
+
+    def _start(self):
+        cmd = ['adb'] + (['-s', self.device] if self.device else []) + ['shell']
+        try:
+            self._process = subprocess.Popen(
+                cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT, text=True, errors='replace', bufsize=1)
+        except OSError as e:
+            raise AdbShellError(f"Could not start adb shell: {e}") from e
+        self._lines = queue.Queue()
+        threading.Thread(target=self._pump, args=(self._process, self._lines),
+                         daemon=True).start()
+        self.restarts += 1
+        logger.debug(f"adb shell session started for {self.device or 'default device'}")
+
+    @staticmethod
+    def _pump(process, lines):
+        for line in process.stdout:
+            lines.put(line.rstrip('\r\n'))
+        lines.put(None)             # EOF: session ended
+
+    def _alive(self) -> bool:
+        return self._process is not None and self._process.poll() is None
+
+    def close(self):
+        with self._lock:
+            self._kill()
+
+    def _kill(self):
+        process, self._process = self._process, None
+        if process is None:
+            return
+        try:
+            process.stdin.close()
+        except OSError:
+            pass
+        process.terminate()
+        try:
+            process.wait(2)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ========== Commands ==========
+
+    def run(self, command: str, timeout: Optional[float] = None) -> Tuple[int, str]:
+        """
+        Run one shell command on the device.
+
+        Reconnects once if the session has died (the command may then run
+        twice, so keep commands idempotent). A timed-out command kills the
+        session so a stuck command can't block the next one.
+
+        Args:
+            command: Shell command line (stderr is merged into the output)
+            timeout: Seconds the whole command may take
+
+        Returns:
+            (exit status, output)
+
+        Raises:
+            AdbShellError: If the session can't be (re)started or times out
+        """
+        timeout = timeout or self.timeout
+        with self._lock:
+            for _ in range(2):
+                if not self._alive():
+                    self._start()
+                token = uuid.uuid4().hex
+                try:
+                    self._process.stdin.write(
+                        f'{{ {command}\n}} 2>&1; printf \'\\n{_MARK} {token} %s\\n\' "$?"\n')
+                    self._process.stdin.flush()
+                except OSError:
+                    self._kill()
+                    continue
+                self.commands += 1
+                result = self._collect(token, time.monotonic() + timeout, timeout)
+                if result is not None:
+                    return result
+                self._kill()
+            raise AdbShellError("adb shell session closed")
+
+    def _collect(self, token: str, deadline: float,
+                 timeout: float) -> Optional[Tuple[int, str]]:
+        """Read lines up to this command's end marker; None if the session ended."""
+        output: List[str] = []
+        while True:
+            try:
+                line = self._lines.get(timeout=max(deadline - time.monotonic(), 0))
+            except queue.Empty:
+                self._kill()
+                raise AdbShellError(f"adb shell command timed out after {timeout}s")
+            if line is None:
+                return None
+            if line.startswith(_MARK):
+                parts = line.split()
+                if len(parts) == 3 and parts[1] == token:
+                    # Drop the newline printed before the marker
+                    if output and output[-1] == '':
+                        output.pop()
+                    return int(parts[2]) if parts[2].isdigit() else -1, '\n'.join(output)
+                output.clear()      # late output of an earlier, timed-out command
+                continue
+            output.append(line)
+
+    def keyevent(self, code: int) -> bool:
+        """Send one key event (e.g. 224 = KEYCODE_WAKEUP)."""
+        status, _ = self.run(f'input keyevent {int(code)}')
+        return status == 0
+
+    def grant_permissions(self, package: str, permissions: Iterable[str]) -> Dict[str, bool]:
+        """
+        Grant many runtime permissions with one batched shell command.
+
+        Args:
+            package: App package name
+            permissions: Permission names
+
+        Returns:
+            Mapping of permission -> granted
+        """
+        permissions = list(permissions)
+        script = (f'for p in {" ".join(permissions)}; do '
+                  f'if pm grant {package} "$p" >/dev/null 2>&1; '
+                  f'then echo "GRANTED $p"; else echo "FAILED $p"; fi; done')
+        _, output = self.run(script, timeout=max(self.timeout, 2 * len(permissions)))
+        granted = {p: False for p in permissions}
+        for line in output.splitlines():
+            state, _, permission = line.partition(' ')
+            if permission in granted:
+                granted[permission] = state == 'GRANTED'
+        return granted
+
+
+_shells: Dict[Optional[str], AdbShell] = {}
+_shells_lock = threading.Lock()
+
+
+def adb_shell(device: Optional[str] = None) -> AdbShell:
+    """Shared AdbShell for device, created on first use."""
+    device = device or None
+    with _shells_lock:
+        shell = _shells.get(device)
+        if shell is None:
+            shell = _shells[device] = AdbShell(device)
+        return shell
+
+
+def close_all():
+    """Close every shared session (end of the test session)."""
+    with _shells_lock:
+        shells = list(_shells.values())
+        _shells.clear()
+    for shell in shells:
+        shell.close()
@@ -0,0 +1,199 @@
+"""
+Compile simple XPath locators into UiAutomator2-native lookups.
+
+On UiAutomator2 every XPath query serialises the whole view hierarchy on
+the device. The shapes the page objects use most - a single step with
+@text / @content-desc / @resource-id / @class predicates - map directly
+onto `-android uiautomator` UiSelector expressions or resource-id lookups,
+which the device resolves without a dump. Anything else is returned
+unchanged and logged once so it can be rewritten.
+
+Known limitation: multi-step paths are not compiled. In particular the
+"label, then its value" shape, //*[@text='Battery']/following-sibling::
+android.widget.TextView[1] (every ReadScreen *_VALUE locator), has no
+exact UiSelector form: fromParent() can select a sibling, but not "the
+first one after the label", and the label's index is only known at run
+time. Such locators are meant to be resolved locally by PageSnapshot
+(snapshot_text(), wait_for_text_change()), where one page_source dump
+serves every value on screen; passed to the driver they still cost a
+hierarchy dump per lookup.
+
+Set APPIUM_ACCELERATE_LOCATORS=0 to disable compilation.
+"""
+import logging
+import os
+import re
+from typing import Dict, Optional, Set, Tuple
+
+from appium.webdriver.common.appiumby import AppiumBy
+
+logger = logging.getLogger("locators")
+
+Locator = Tuple[str, str]
+
+_STEP = re.compile(r"^//(?P<tag>\*|[\w.$]+)(?P<preds>(?:\[[^\]]+\])*)$")
+_PRED = re.compile(r"\[([^\]]+)\]")
+_LITERAL = r"""(?:'(?P<sq>[^']*)'|"(?P<dq>[^"]*)")"""
+_EQ = re.compile(rf"^@(?P<attr>[\w-]+)\s*=\s*{_LITERAL}$")
+_FUNC = re.compile(
+    rf"^(?P<fn>contains|starts-with)\(\s*@(?P<attr>[\w-]+)\s*,\s*{_LITERAL}\s*\)$")
+_OR = re.compile(r"\s+or\s+")
+
+# XPath attribute -> UiSelector method for (=, contains, starts-with)
+_METHODS = {
+    'text': ('text', 'textContains', 'textStartsWith'),
+    'content-desc': ('description', 'descriptionContains', 'descriptionStartsWith'),
+    'class': ('className', None, None),
+    'resource-id': ('resourceId', None, None),
+}
+# Attributes that only have a regex form for or-chains / partial matches
+_MATCHES = {
+    'text': 'textMatches',
+    'content-desc': 'descriptionMatches',
+    'class': 'classNameMatches',
+    'resource-id': 'resourceIdMatches',
+}
+
+_compiled: Dict[Locator, Locator] = {}
+_fallbacks: Set[str] = set()
+
+
+class _NotCompilable(Exception):
+    """XPath shape with no UiSelector equivalent."""
+
+
+def enabled() -> bool:
+    return os.getenv('APPIUM_ACCELERATE_LOCATORS', '1').lower() not in ('0', 'false', 'no')
+
+
+def compile_locator(locator: Locator) -> Locator:
+    """
+    Return the fastest equivalent of locator for UiAutomator2.
+
+    Non-XPath locators and XPaths that can't be translated are returned
+    unchanged; results are memoised.
+
+    Args:
+        locator: Tuple of (By strategy, value)
+
+    Returns:
+        (By strategy, value), possibly ANDROID_UIAUTOMATOR or ID
+    """
+    by, value = locator
+    if by != AppiumBy.XPATH or not enabled():
+        return locator
+    compiled = _compiled.get(locator)
+    if compiled is None:
+        try:
+            compiled = _compile_xpath(value)
+        except _NotCompilable as e:
+            mark_fallback(value, str(e))
+            compiled = locator
+        _compiled[locator] = compiled
+    return compiled
+
+
+def mark_fallback(xpath: str, reason: str):
+    """Pin an XPath to the slow path (e.g. after the server rejected its UiSelector)."""
+    _compiled[(AppiumBy.XPATH, xpath)] = (AppiumBy.XPATH, xpath)
+    if xpath not in _fallbacks:
+        _fallbacks.add(xpath)
+        logger.info(f"XPath not accelerated ({reason}): {xpath}")
+
+
+def fallback_locators() -> Set[str]:
+    """XPaths seen so far that still go through a hierarchy dump."""
+    return set(_fallbacks)
+
+
+def to_uiselector(xpath: str) -> Optional[str]:
+    """UiSelector expression for xpath, or None if it has no equivalent."""
+    try:
+        by, value = _compile_xpath(xpath)
+    except _NotCompilable:
+        return None
+    if by == AppiumBy.ID:
+        return f'new UiSelector().resourceId({_java_string(value)})'
+    return value
+
+
+def _compile_xpath(xpath: str) -> Locator:
+    if 'following-sibling::' in xpath:
+        raise _NotCompilable("following-sibling axis; resolve it with PageSnapshot")
+    m = _STEP.match(xpath.strip())
+    if not m:
+        raise _NotCompilable("not a single // step")
+    calls = []
+    tag = m.group('tag')
+    if tag != '*':
+        calls.append(f'className({_java_string(tag)})')
+    preds = _PRED.findall(m.group('preds'))
+    for pred in preds:
+        calls.append(_compile_predicate(pred.strip()))
+
+    # A lone exact resource-id is a native ID lookup
+    if len(calls) == 1 and len(preds) == 1:
+        eq = _EQ.match(preds[0].strip())
+        if eq and eq.group('attr') == 'resource-id':
+            return (AppiumBy.ID, _literal(eq))
+    if not calls:
+        raise _NotCompilable("no predicates")
+    return (AppiumBy.ANDROID_UIAUTOMATOR, 'new UiSelector().' + '.'.join(calls))
+
+
+def _compile_predicate(pred: str) -> str:
+    if pred.isdigit():
+        raise _NotCompilable("positional predicate")
+    terms = _OR.split(pred)
+    if len(terms) > 1:
+        return _compile_or(terms)
+
+    eq = _EQ.match(pred)
+    fn = _FUNC.match(pred) if not eq else None
+    match = eq or fn
+    if not match or match.group('attr') not in _METHODS:
+        raise _NotCompilable(f"predicate [{pred}]")
+    attr, value = match.group('attr'), _literal(match)
+    kind = 0 if eq else (1 if fn.group('fn') == 'contains' else 2)
+    method = _METHODS[attr][kind]
+    if method is not None:
+        return f'{method}({_java_string(value)})'
+    pattern = '.*' + _regex_escape(value) + '.*' if kind == 1 else _regex_escape(value) + '.*'
+    return f'{_MATCHES[attr]}({_java_string(pattern)})'
+
+
+def _compile_or(terms) -> str:
+    """@a='x' or contains(@a, 'y') ... on one attribute -> xxxMatches(regex)."""
+    attrs, alternatives = set(), []
+    for term in terms:
+        eq = _EQ.match(term.strip())
+        fn = _FUNC.match(term.strip()) if not eq else None
+        match = eq or fn
+        if not match:
+            raise _NotCompilable(f"or-term [{term}]")
+        attrs.add(match.group('attr'))
+        value = _regex_escape(_literal(match))
+        if eq:
+            alternatives.append(value)
+        elif fn.group('fn') == 'contains':
+            alternatives.append(f'.*{value}.*')
+        else:
+            alternatives.append(f'{value}.*')
+    if len(attrs) != 1 or next(iter(attrs)) not in _MATCHES:
+        raise _NotCompilable("or across attributes")
+    pattern = '(?s)(' + '|'.join(alternatives) + ')'
+    return f'{_MATCHES[attrs.pop()]}({_java_string(pattern)})'
+
+
+def _literal(match) -> str:
+    sq = match.group('sq')
+    return sq if sq is not None else match.group('dq')
+
+
+def _regex_escape(value: str) -> str:
+    """Escape for java.util.regex (a subset of Python's metacharacters)."""
+    return re.sub(r'([\\.^$|?*+()\[\]{}])', r'\\\1', value)
+
+
+def _java_string(value: str) -> str:
+    return '"' + value.replace('\\', '\\\\').replace('"', '\\"') + '"'
@@ -0,0 +1,170 @@
+"""Read the ECG packet counter from a streaming adb logcat instead of the UI.
+
+The sample app logs each received packet number. A background thread
+follows `adb logcat` filtered to the app's log tag (or, without a tag, to
+the app's process) and parses the counter line by line, so the count is
+current to the last log line and costs no Appium commands.
+
+Environment variables:
+  - PACKET_LOG_TAG (optional: logcat tag the app logs packets under;
+    default: filter by the app's pid instead)
+  - PACKET_LOG_REGEX (optional: regex whose first group is the packet
+    number; default matches "Packet Number : 123")
+"""
+import logging
+import os
+import re
+import subprocess
+import threading
+import time
+from typing import List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REGEX = r'Packet\s*Number\s*:?\s*(\d+)'
+DEFAULT_PACKAGE = 'com.wellysis.spatch.sdk.sample'
+
+
+class LogcatPacketCounter:
+    """Background `adb logcat` reader that tracks the latest packet number."""
+
+    def __init__(
+        self,
+        device: Optional[str] = None,
+        tag: Optional[str] = None,
+        pattern: Optional[str] = None,
+        package: Optional[str] = None
+    ):
+        """
+        Initialize logcat packet counter.
+
+        Args:
+            device: adb serial (default: APPIUM_DEVICE_NAME, else the only device)
+            tag: Log tag to filter on (default: PACKET_LOG_TAG)
+            pattern: Regex with the packet number as group 1 (default: PACKET_LOG_REGEX)
+            package: App package used for the pid filter when no tag is set
+        """
+        self.device = device if device is not None else os.getenv('APPIUM_DEVICE_NAME', '')
+        self.tag = tag if tag is not None else os.getenv('PACKET_LOG_TAG', '')
+        self.pattern = re.compile(pattern or os.getenv('PACKET_LOG_REGEX') or DEFAULT_REGEX)
+        self.package = package or os.getenv('APPIUM_APP_PACKAGE', DEFAULT_PACKAGE)
+
+        self.count = 0
+        self.first_count = None
+        self.started_at = None
+        self.updated_at = None
+        self.lines_read = 0
+        self._process = None
+        self._thread = None
+        self._changed = threading.Condition()
+
+    # ========== Lifecycle ==========
+
+    def _adb(self) -> List[str]:
+        return ['adb', '-s', self.device] if self.device else ['adb']
+
+    def command(self) -> List[str]:
+        """The logcat command line: new lines only, filtered to the app."""
+        cmd = self._adb() + ['logcat', '-v', 'brief', '-T', '1']
+        if self.tag:
+            return cmd + [f'{self.tag}:V', '*:S']
+        pid = self._pid()
+        if pid:
+            return cmd + [f'--pid={pid}']
+        logger.warning(f"{self.package} not running; reading unfiltered logcat")
+        return cmd
+
+    def _pid(self) -> str:
+        try:
+            out = subprocess.run(self._adb() + ['shell', 'pidof', self.package],
+                                 capture_output=True, text=True, timeout=5).stdout
+            return out.split()[0] if out.split() else ''
+        except (OSError, subprocess.TimeoutExpired):
+            return ''
+
+    def start(self):
+        """Start following logcat; raises OSError if adb can't be run."""
+        if self._process is not None:
+            return
+        cmd = self.command()
+        logger.info(f"Following logcat: {' '.join(cmd)}")
+        self._process = subprocess.Popen(
+            cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            text=True, errors='replace', bufsize=1)
+        self.started_at = time.monotonic()
+        self._thread = threading.Thread(target=self._read, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        process, self._process = self._process, None
+        if process is not None:
+            process.terminate()
+            try:
+                process.wait(5)
+            except subprocess.TimeoutExpired:
+                process.kill()
+        if self._thread is not None:
+            self._thread.join(2)
+            self._thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    @property
+    def alive(self) -> bool:
+        return self._process is not None and self._process.poll() is None
+
+    # ========== Counter ==========
+
+    def feed(self, line: str) -> bool:
+        """Parse one log line; returns True if it carried a packet number."""
+        self.lines_read += 1
+        m = self.pattern.search(line)
+        if not m:
+            return False
+        with self._changed:
+            self.count = int(m.group(1))
+            if self.first_count is None:
+                self.first_count = self.count
+            self.updated_at = time.monotonic()
+            self._changed.notify_all()
+        return True
+
+    def _read(self):
+        process = self._process
+        for line in process.stdout:
+            self.feed(line)
+        with self._changed:
+            self._changed.notify_all()      # wake waiters when logcat exits
+
+    def wait_for(self, target: int, timeout: float) -> int:
+        """
+        Block until the count reaches target, timeout passes or logcat exits.
+
+        Returns:
+            The current count
+        """
+        deadline = time.monotonic() + timeout
+        with self._changed:
+            while self.count < target and self.alive:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._changed.wait(remaining)
+            return self.count
+
+    def rate(self) -> float:
+        """Packets per second since the first counted line."""
+        if self.first_count is None or self.updated_at is None or self.started_at is None:
+            return 0.0
+        elapsed = self.updated_at - self.started_at
+        return (self.count - self.first_count) / elapsed if elapsed > 0 else 0.0
+
+    def idle_for(self) -> float:
+        """Seconds since the last counted line (or since start)."""
+        since = self.updated_at or self.started_at
+        return time.monotonic() - since if since else 0.0
@@ -0,0 +1,243 @@
+"""Local resolution of locators against a single Appium page_source dump."""
+import re
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+from xml.etree import ElementTree
+
+from appium.webdriver.common.appiumby import AppiumBy
+
+
+class UnsupportedLocator(ValueError):
+    """Locator shape the snapshot resolver cannot evaluate locally."""
+
+
+# One XPath step: //tag followed by zero or more [predicate] blocks
+_STEP = re.compile(r"(?P<axis>//|/following-sibling::|/)(?P<tag>\*|[\w$][\w.$]*)(?P<preds>(?:\[[^\]]+\])*)")
+_PRED = re.compile(r"\[([^\]]+)\]")
+_LITERAL = r"""(?:'(?P<sq>[^']*)'|"(?P<dq>[^"]*)")"""
+_EQ = re.compile(rf"^@(?P<attr>[\w-]+)\s*=\s*{_LITERAL}$")
+_FUNC = re.compile(
+    rf"^(?P<fn>contains|starts-with)\(\s*@(?P<attr>[\w-]+)\s*,\s*{_LITERAL}\s*\)$")
+
+
+class SnapshotElement:
+    """Read-only view of one node in a PageSnapshot."""
+
+    __slots__ = ('_node', '_snapshot')
+
+    def __init__(self, node, snapshot: 'PageSnapshot'):
+        self._node = node
+        self._snapshot = snapshot
+
+    @property
+    def attrib(self) -> Dict[str, str]:
+        return self._node.attrib
+
+    @property
+    def tag(self) -> str:
+        return self._node.tag
+
+    @property
+    def text(self) -> str:
+        return self._node.get('text', '')
+
+    @property
+    def resource_id(self) -> str:
+        return self._node.get('resource-id', '')
+
+    @property
+    def bounds(self) -> Optional[Tuple[int, int, int, int]]:
+        """(left, top, right, bottom) parsed from the bounds attribute."""
+        nums = re.findall(r'-?\d+', self._node.get('bounds', ''))
+        return tuple(int(n) for n in nums[:4]) if len(nums) >= 4 else None
+
+    def find_all(self, locator: Tuple[str, str]) -> List['SnapshotElement']:
+        """Resolve a locator against this element's subtree."""
+        return self._snapshot._find_all(locator, self._node)
+
+    def find(self, locator: Tuple[str, str]) -> Optional['SnapshotElement']:
+        matches = self.find_all(locator)
+        return matches[0] if matches else None
+
+    def __repr__(self):
+        return f"<SnapshotElement {self.tag} text={self.text!r}>"
+
+
+class PageSnapshot:
+    """Parsed page_source that answers many locator queries without HTTP calls.
+
+    Supports ID, ACCESSIBILITY_ID, CLASS_NAME and the XPath shapes used in
+    the page objects: absolute/descendant steps with [@attr='v'],
+    [contains(@attr, 'v')], [starts-with(@attr, 'v')] and [n] predicates,
+    plus /following-sibling:: steps. Anything else raises UnsupportedLocator
+    so the caller can fall back to the driver.
+    """
+
+    def __init__(self, source: str):
+        self.root = ElementTree.fromstring(source.encode('utf-8'))
+        self._parents = {child: parent for parent in self.root.iter() for child in parent}
+
+    def same_page(self, other: 'PageSnapshot',
+                  live: Sequence[Tuple[str, str]] = ()) -> bool:
+        """True if other shows the same nodes, in the same place, with the same text.
+
+        Nodes matched by a live locator (values the app updates on its own,
+        such as counters) may differ in text only. Scroll loops use this to
+        tell that a swipe did not move the page (end of list).
+        """
+        nodes, others = list(self.root.iter()), list(other.root.iter())
+        if len(nodes) != len(others):
+            return False
+        ignored = set()
+        for locator in live:
+            try:
+                ignored.update(e._node for e in self.find_all(locator))
+            except UnsupportedLocator:
+                pass            # compare that node's text like any other
+        for a, b in zip(nodes, others):
+            if (_class_of(a), a.get('resource-id'), a.get('bounds')) != \
+                    (_class_of(b), b.get('resource-id'), b.get('bounds')):
+                return False
+            if a not in ignored and a.get('text') != b.get('text'):
+                return False
+        return True
+
+    # ========== Queries ==========
+
+    def find_all(self, locator: Tuple[str, str]) -> List[SnapshotElement]:
+        """Resolve a (By, value) locator against the whole page."""
+        return self._find_all(locator, self.root)
+
+    def find(self, locator: Tuple[str, str]) -> Optional[SnapshotElement]:
+        """Return the first match or None."""
+        matches = self.find_all(locator)
+        return matches[0] if matches else None
+
+    def has(self, locator: Tuple[str, str]) -> bool:
+        return self.find(locator) is not None
+
+    def text_of(self, locator: Tuple[str, str]) -> Optional[str]:
+        """Return the text of the first match, or None if nothing matches."""
+        element = self.find(locator)
+        return element.text if element is not None else None
+
+    def texts(self, class_name: Optional[str] = None) -> List[str]:
+        """All non-empty text attributes in document order, optionally by class."""
+        return [node.get('text') for node in self.root.iter()
+                if node.get('text') and (class_name is None or _class_of(node) == class_name)]
+
+    def resolve(self, locators: Dict[str, Tuple[str, str]]) -> Dict[str, Optional[str]]:
+        """Resolve many named locators at once; values are texts or None."""
+        return {name: self.text_of(locator) for name, locator in locators.items()}
+
+    # ========== Resolution ==========
+
+    def _find_all(self, locator, scope) -> List[SnapshotElement]:
+        by, value = locator
+        if by == AppiumBy.ID:
+            nodes = [n for n in _descendants(scope) if _id_matches(n.get('resource-id', ''), value)]
+        elif by == AppiumBy.ACCESSIBILITY_ID:
+            nodes = [n for n in _descendants(scope) if n.get('content-desc') == value]
+        elif by == AppiumBy.CLASS_NAME:
+            nodes = [n for n in _descendants(scope) if _class_of(n) == value]
+        elif by == AppiumBy.XPATH:
+            nodes = self._xpath(value, scope)
+        else:
+            raise UnsupportedLocator(f"Unsupported strategy: {by}")
+        return [SnapshotElement(n, self) for n in nodes]
+
+    def _xpath(self, xpath: str, scope) -> list:
+        xpath = xpath.strip()
+        if xpath.startswith('.'):
+            xpath = xpath[1:]
+        pos = 0
+        nodes = [scope]
+        while pos < len(xpath):
+            m = _STEP.match(xpath, pos)
+            if not m:
+                raise UnsupportedLocator(f"Unsupported XPath: {xpath}")
+            pos = m.end()
+            axis, tag = m.group('axis'), m.group('tag')
+            preds = _PRED.findall(m.group('preds'))
+
+            result, seen = [], set()
+            for node in nodes:
+                if axis == '//':
+                    candidates = self._descendant_step(node, tag, preds, xpath)
+                else:
+                    if axis == '/':
+                        candidates = [n for n in node if _tag_matches(n, tag)]
+                    else:
+                        candidates = [n for n in self._following_siblings(node) if _tag_matches(n, tag)]
+                    for pred in preds:
+                        candidates = _apply_predicate(candidates, pred, xpath)
+                for c in candidates:
+                    if c not in seen:
+                        seen.add(c)
+                        result.append(c)
+            nodes = result
+            if not nodes:
+                break
+        return [n for n in nodes if n is not scope]
+
+    def _descendant_step(self, node, tag: str, preds: list, xpath: str) -> list:
+        """//tag[...]: as in XPath, [n] counts among each parent's matching children."""
+        if not any(pred.strip().isdigit() for pred in preds):
+            candidates = [n for n in _descendants(node) if _tag_matches(n, tag)]
+            for pred in preds:
+                candidates = _apply_predicate(candidates, pred, xpath)
+            return candidates
+        selected = set()
+        for parent in node.iter():
+            children = [c for c in parent if _tag_matches(c, tag)]
+            for pred in preds:
+                children = _apply_predicate(children, pred, xpath)
+            selected.update(children)
+        return [n for n in _descendants(node) if n in selected]
+
+    def _following_siblings(self, node) -> list:
+        parent = self._parents.get(node)
+        if parent is None:
+            return []
+        siblings = list(parent)
+        return siblings[siblings.index(node) + 1:]
+
+
+def _descendants(node) -> Iterator:
+    it = node.iter()
+    next(it)            # skip the node itself
+    return it
+
+
+def _class_of(node) -> str:
+    return node.get('class') or node.tag
+
+
+def _tag_matches(node, tag: str) -> bool:
+    return tag == '*' or node.tag == tag or node.get('class') == tag
+
+
+def _id_matches(resource_id: str, value: str) -> bool:
+    return resource_id == value or (':id/' not in value and resource_id.endswith(f':id/{value}'))
+
+
+def _literal(match) -> str:
+    sq = match.group('sq')
+    return sq if sq is not None else match.group('dq')
+
+
+def _apply_predicate(nodes: list, pred: str, xpath: str) -> list:
+    pred = pred.strip()
+    if pred.isdigit():
+        index = int(pred) - 1
+        return [nodes[index]] if 0 <= index < len(nodes) else []
+    m = _EQ.match(pred)
+    if m:
+        value = _literal(m)
+        return [n for n in nodes if n.get(m.group('attr')) == value]
+    m = _FUNC.match(pred)
+    if m:
+        attr, value = m.group('attr'), _literal(m)
+        if m.group('fn') == 'contains':
+            return [n for n in nodes if value in n.get(attr, '')]
+        return [n for n in nodes if n.get(attr, '').startswith(value)]
+    raise UnsupportedLocator(f"Unsupported XPath predicate [{pred}] in {xpath}")
@@ -2,6 +2,8 @@
 import time
 import logging
 from appium.webdriver.common.appiumby import AppiumBy
+from tests.appium.utils.adb_shell import AdbShellError, adb_shell
+from tests.appium.utils.locators import compile_locator
 
 
 logger = logging.getLogger(__name__)
@@ -45,10 +47,9 @@ def handle_permission_dialogs(driver, max_dialogs=5, timeout_per_dialog=3):
                 # Try to find and click Allow button
                 for allow_text in allow_texts:
                     try:
-                        allow_button = driver.find_element(
-                            AppiumBy.XPATH,
-                            f"//*[@text='{allow_text}']"
-                        )
+                        allow_button = driver.find_element(*compile_locator(
+                            (AppiumBy.XPATH, f"//*[@text='{allow_text}']")
+                        ))
 
                         logger.info(f"Found '{allow_text}' button, clicking...")
                         allow_button.click()
@@ -88,8 +89,6 @@ def grant_permissions_via_adb(package_name, device_id=None):
     Returns:
         True if successful
     """
-    import subprocess
-
     logger.info(f"Granting permissions to {package_name} via adb...")
 
     # Common dangerous permissions
@@ -102,24 +101,19 @@ def grant_permissions_via_adb(package_name, device_id=None):
         "android.permission.POST_NOTIFICATIONS",
     ]
 
-    device_arg = ["-s", device_id] if device_id else []
-
     try:
-        for permission in permissions:
-            cmd = ["adb"] + device_arg + ["shell", "pm", "grant", package_name, permission]
-
-            logger.debug(f"Running: {' '.join(cmd)}")
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=5)
-
-            if result.returncode == 0:
+        # One shell round-trip for all grants instead of one adb process each
+        granted = adb_shell(device_id).grant_permissions(package_name, permissions)
+        for permission, ok in granted.items():
+            if ok:
                 logger.info(f"✅ Granted: {permission}")
             else:
                 # Permission might not be declared in manifest, that's OK
-                logger.debug(f"⚠️  Could not grant {permission}: {result.stderr.strip()}")
+                logger.debug(f"⚠️  Could not grant {permission}")
 
         logger.info("✅ Permission granting complete")
         return True
 
-    except Exception as e:
+    except AdbShellError as e:
         logger.error(f"❌ Error granting permissions via adb: {e}")
         return False
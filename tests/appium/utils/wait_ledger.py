@@ -0,0 +1,80 @@
+"""Per-test accounting of time saved by condition waits over fixed sleeps."""
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+
+@dataclass
+class WaitRecord:
+    """One condition wait and the fixed sleep it replaced."""
+    label: str
+    replaced: float
+    elapsed: float
+
+    @property
+    def saved(self) -> float:
+        return self.replaced - self.elapsed
+
+
+@dataclass
+class TestWaits:
+    """All condition waits recorded while one test ran."""
+    nodeid: str
+    records: List[WaitRecord] = field(default_factory=list)
+
+    @property
+    def replaced(self) -> float:
+        return sum(r.replaced for r in self.records)
+
+    @property
+    def elapsed(self) -> float:
+        return sum(r.elapsed for r in self.records)
+
+    @property
+    def saved(self) -> float:
+        return self.replaced - self.elapsed
+
+
+class WaitLedger:
+    """
+    Collects WaitRecords grouped by test.
+
+    BasePage.wait_until() records into the module-level `ledger` whenever a
+    wait is given the fixed sleep it replaces; the autouse fixture in
+    tests/conftest.py opens and closes one TestWaits per test.
+    """
+
+    def __init__(self):
+        self.tests: Dict[str, TestWaits] = {}
+        self._current: Optional[TestWaits] = None
+
+    def begin(self, nodeid: str):
+        self._current = self.tests.setdefault(nodeid, TestWaits(nodeid))
+
+    def end(self) -> Optional[TestWaits]:
+        current, self._current = self._current, None
+        return current
+
+    def record(self, label: str, replaced: float, elapsed: float):
+        """Record one wait; ignored outside a test (e.g. in module fixtures)."""
+        if self._current is not None:
+            self._current.records.append(WaitRecord(label, replaced, elapsed))
+
+    def report_lines(self) -> List[str]:
+        """Summary table lines, one per test that made condition waits."""
+        rows = [t for t in self.tests.values() if t.records]
+        if not rows:
+            return []
+        lines = [f"{'test':<60} {'waits':>5} {'fixed':>8} {'actual':>8} {'saved':>8}"]
+        for t in rows:
+            name = t.nodeid if len(t.nodeid) <= 60 else '...' + t.nodeid[-57:]
+            lines.append(f"{name:<60} {len(t.records):>5} {t.replaced:>7.1f}s "
+                         f"{t.elapsed:>7.1f}s {t.saved:>7.1f}s")
+        total_replaced = sum(t.replaced for t in rows)
+        total_elapsed = sum(t.elapsed for t in rows)
+        lines.append(f"{'TOTAL':<60} {sum(len(t.records) for t in rows):>5} "
+                     f"{total_replaced:>7.1f}s {total_elapsed:>7.1f}s "
+                     f"{total_replaced - total_elapsed:>7.1f}s")
+        return lines
+
+
+ledger = WaitLedger()
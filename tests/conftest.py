@@ -4,18 +4,50 @@ import time
 import os
 from dotenv import load_dotenv
 from tests.appium.driver import get_driver
+from tests.appium.device_lease import DeviceResults, LeaseError, lease_device
+from tests.appium.driver_pool import DriverPool
 from tests.appium.pages.main_screen import MainScreen
+from tests.appium.utils.adb_shell import close_all as close_adb_shells
 from tests.appium.utils.permission_handler import handle_permission_dialogs
+from tests.appium.utils.wait_ledger import ledger
 
 load_dotenv()
 
-SERIAL_NUMBER = os.getenv("BLE_DEVICE_SERIAL")
-if not SERIAL_NUMBER:
-    raise ValueError(
-        "BLE_DEVICE_SERIAL not found in environment variables!\n"
-        "Please set it in .env file:\n"
-        "BLE_DEVICE_SERIAL=YOUR_SERIAL_NUMBER"
-    )
+device_results = DeviceResults()
+
+
+def pytest_configure(config):
+    """Lease this worker's phone/patch pair, then check the patch serial is known."""
+    worker_id = getattr(config, "workerinput", {}).get("workerid")
+    try:
+        config.device_slot = lease_device(worker_id)
+    except LeaseError as e:
+        raise pytest.UsageError(str(e))
+
+    if not os.getenv("BLE_DEVICE_SERIAL"):
+        raise ValueError(
+            "BLE_DEVICE_SERIAL not found in environment variables!\n"
+            "Please set it in .env file:\n"
+            "BLE_DEVICE_SERIAL=YOUR_SERIAL_NUMBER\n"
+            "or list devices in the DEVICE_INVENTORY file"
+        )
+
+
+def pytest_runtest_setup(item):
+    """Tag every report with the device it ran on (sent to the xdist controller)."""
+    item.user_properties.append(
+        ("device", os.getenv("DEVICE_SLOT") or os.getenv("APPIUM_DEVICE_NAME", "default")))
+
+
+def pytest_runtest_logreport(report):
+    device_results.add(report)
+
+
+def pytest_sessionfinish(session):
+    close_adb_shells()
+    path = session.config.getoption("--device-report")
+    if path and not hasattr(session.config, "workerinput"):
+        device_results.write(path)
 
 
 def pytest_addoption(parser):
@@ -27,6 +59,52 @@ def pytest_addoption(parser):
         type=int,
         help="Target packet count for packet monitoring test (e.g., 3600)"
     )
+    parser.addoption(
+        "--explicit-waits",
+        action="store_true",
+        default=None,
+        help="Set the driver implicit wait to 0 and wait only explicitly "
+             "(default: APPIUM_EXPLICIT_WAITS env var)"
+    )
+    parser.addoption(
+        "--packet-source",
+        action="store",
+        default="ui",
+        choices=("ui", "logcat"),
+        help="Where packet monitoring reads the packet count: the Notify "
+             "screen TextView (ui) or a streaming adb logcat filter (logcat)"
+    )
+    parser.addoption(
+        "--device-report",
+        action="store",
+        default=None,
+        help="Write per-device pass/fail/duration totals to this JSON file"
+    )
+
+
+def pytest_terminal_summary(terminalreporter):
+    """Report results per device and time saved by condition waits."""
+    if os.getenv("DEVICE_INVENTORY") and device_results.devices:
+        terminalreporter.section("results per device")
+        for line in device_results.lines():
+            terminalreporter.write_line(line)
+
+    lines = ledger.report_lines()
+    if lines:
+        terminalreporter.section("condition waits vs fixed sleeps")
+        for line in lines:
+            terminalreporter.write_line(line)
+
+
+@pytest.fixture(autouse=True)
+def wait_ledger(request):
+    """Group BasePage condition waits by test and print the time saved."""
+    ledger.begin(request.node.nodeid)
+    yield
+    waits = ledger.end()
+    if waits and waits.records:
+        print(f"\n⏱️  Condition waits: {waits.elapsed:.1f}s instead of "
+              f"{waits.replaced:.1f}s fixed sleeps (saved {waits.saved:.1f}s)")
 
 
 @pytest.fixture
@@ -35,14 +113,22 @@ def target_packets(request):
     return request.config.getoption("--target-packets")
 
 
-@pytest.fixture(scope="module")
-def connected_driver():
-    """Setup: Launch app, handle permissions, and connect to BLE device."""
+@pytest.fixture
+def packet_source(request):
+    """Get packet count source ("ui" or "logcat") from command line option."""
+    return request.config.getoption("--packet-source")
+
+
+def connect_device(driver):
+    """Handle permissions and connect the app to the BLE device.
+
+    Raises:
+        RuntimeError: If the device is not connected afterwards
+    """
     print("\n" + "="*60)
     print("🚀 SETUP: Connecting to device...")
     print("="*60)
-
-    driver = get_driver()
+    print(f"⏱️  Implicit wait: {driver.implicit_wait_seconds}s")
 
     print("\n🔐 Handling permissions...")
     handle_permission_dialogs(driver, max_dialogs=5, timeout_per_dialog=2)
@@ -61,8 +147,9 @@ def connected_driver():
     print(f"Current RSSI: {rssi}")
 
     if rssi == "0" or int(rssi) == 0:
-        print(f"\n🔌 Connecting to device (Serial: {SERIAL_NUMBER})...")
-        main_screen.enter_serial_number(SERIAL_NUMBER)
+        serial_number = os.getenv("BLE_DEVICE_SERIAL")
+        print(f"\n🔌 Connecting to device (Serial: {serial_number})...")
+        main_screen.enter_serial_number(serial_number)
         main_screen.click_connect()
 
         print("⏳ Waiting for connection...")
@@ -78,8 +165,7 @@ def connected_driver():
                 print(f"⏳ Waiting... {i+1}/30s")
 
         if not connected:
-            driver.quit()
-            pytest.fail("Failed to connect to device")
+            raise RuntimeError("Failed to connect to device")
 
         time.sleep(3)
     else:
@@ -87,13 +173,45 @@ def connected_driver():
 
     rssi = main_screen.get_rssi_value()
     if rssi == "0" or int(rssi) == 0:
-        driver.quit()
-        pytest.fail(f"Device not connected! RSSI: {rssi}")
+        raise RuntimeError(f"Device not connected! RSSI: {rssi}")
 
     print(f"\n✅ Setup complete - Device connected (RSSI: {rssi})")
     print("="*60)
 
-    yield driver
+
+@pytest.fixture(scope="session")
+def driver_pool(request):
+    """One Appium session and BLE link for the whole run, rebuilt only if it dies."""
+    explicit_waits = request.config.getoption("--explicit-waits")
+    pool = DriverPool(
+        factory=lambda: get_driver(explicit_waits=explicit_waits),
+        setup=connect_device
+    )
+    yield pool
 
     print("\n🛑 Closing driver...")
-    driver.quit()
+    print(f"Driver builds: {pool.builds}, liveness probes: {pool.probes}")
+    pool.close()
+
+
+@pytest.fixture
+def connected_driver(driver_pool):
+    """Setup: Launch app, handle permissions, and connect to BLE device.
+
+    Probes the pooled session before every test; the full setup only runs
+    for the first test or after the session has died.
+    """
+    return _acquire(driver_pool)
+
+
+@pytest.fixture(scope="module")
+def module_driver(driver_pool):
+    """connected_driver for module-scoped fixtures that set up once per file."""
+    return _acquire(driver_pool)
+
+
+def _acquire(driver_pool):
+    try:
+        return driver_pool.acquire()
+    except Exception as e:
+        pytest.fail(f"Could not set up a connected driver: {e}")
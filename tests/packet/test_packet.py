@@ -2,19 +2,71 @@
 import pytest
 import time
 import os
-import subprocess
 from dotenv import load_dotenv
 from appium.webdriver.common.appiumby import AppiumBy
 from selenium.common.exceptions import InvalidSessionIdException
 import re
+from tests.appium.pages.base_page import BasePage
+from tests.appium.utils.adb_shell import AdbShellError, adb_shell
+from tests.appium.utils.logcat_counter import LogcatPacketCounter
 
 load_dotenv()
 
+WRITESET_TAB = (AppiumBy.XPATH, "//*[@text='WriteSet']")
+START_BUTTON = (AppiumBy.XPATH, "//*[@text='START']")
+STOP_BUTTON = (AppiumBy.XPATH, "//*[@text='STOP']")
+ECG_STREAM = (AppiumBy.XPATH, "//*[@text='ECG']")
+
+
+def _monitor_packets_logcat(target_packets, device_name, stall_timeout=300):
+    """Wait for target_packets using the logcat counter; returns the last count."""
+    counter = LogcatPacketCounter(device=device_name)
+    try:
+        counter.start()
+    except OSError as e:
+        pytest.fail(f"Could not start adb logcat: {e}")
+
+    start_time = time.time()
+    last_log_time = start_time
+    try:
+        while counter.count < target_packets:
+            # Returns at the target or after 30 s, which paces progress and keepalive
+            count = counter.wait_for(target_packets, timeout=30)
+            if not counter.alive:
+                print("\n❌ adb logcat exited — stopping packet monitoring")
+                break
+            if counter.idle_for() >= stall_timeout:
+                print(f"\n⚠️  No packet log lines for {stall_timeout}s, stopping")
+                break
+            try:
+                adb_shell(device_name).keyevent(224)
+            except AdbShellError:
+                pass
+
+            current_time = time.time()
+            print(f"📦 Packets: {count} / {target_packets} ({counter.rate():.1f} pkt/s)")
+            if current_time - last_log_time >= 60:
+                elapsed = (current_time - start_time) / 60
+                progress = (count / target_packets) * 100
+                print(f"\n📊 Progress: {count:,}/{target_packets:,} ({progress:.1f}%) | "
+                      f"Elapsed: {elapsed:.1f}m\n")
+                last_log_time = current_time
+    finally:
+        counter.stop()
+
+    if counter.count >= target_packets:
+        total_time = (time.time() - start_time) / 60
+        print(f"\n{'='*80}")
+        print(f"✅ Target reached: {counter.count:,} packets in {total_time:.1f} minutes!")
+        print(f"{'='*80}\n")
+    return counter.count
+
 
 class TestDataCollectionWorkflow:
     """Test complete data collection workflow: WriteSet Start/Pause/Restart → Notify → WriteSet Stop/Reset"""
 
-    def test_data_collection_workflow(self, connected_driver, target_packets):
+    def test_data_collection_workflow(self, connected_driver, driver_pool, target_packets,
+                                      packet_source):
         """
         Complete data collection workflow test.
 
@@ -32,9 +84,10 @@ class TestDataCollectionWorkflow:
         print("="*80)
 
         driver = connected_driver
+        page = BasePage(driver)
 
         print("\n⏳ Waiting for UI to stabilize...")
-        time.sleep(3)
+        page.wait_for_screen(WRITESET_TAB, replaces=3)
 
         try:
             driver.hide_keyboard()
@@ -49,12 +102,12 @@ class TestDataCollectionWorkflow:
         print("="*80)
 
         print("\n📖 Navigating to WriteSet screen...")
-        writeset_button = driver.find_element(AppiumBy.XPATH, "//*[@text='WriteSet']")
+        writeset_button = page.find(WRITESET_TAB)
         writeset_button.click()
-        time.sleep(3)
+        page.wait_for_screen(START_BUTTON, replaces=3)
 
         print("\n▶️  Clicking START button...")
-        start_button = driver.find_element(AppiumBy.XPATH, "//*[@text='START']")
+        start_button = page.find(START_BUTTON)
         start_button.click()
 
         print("⏳ Waiting for measurement to start (10 seconds)...")
@@ -71,7 +124,7 @@ class TestDataCollectionWorkflow:
         print("="*80)
 
         print("\n⏸️  Clicking PAUSE button...")
-        pause_button = driver.find_element(AppiumBy.XPATH, "//*[@text='PAUSE']")
+        pause_button = page.find((AppiumBy.XPATH, "//*[@text='PAUSE']"))
         pause_button.click()
 
         print("⏳ Waiting for measurement to pause (5 seconds)...")
@@ -88,7 +141,7 @@ class TestDataCollectionWorkflow:
         print("="*80)
 
         print("\n🔄 Clicking RESTART button...")
-        restart_button = driver.find_element(AppiumBy.XPATH, "//*[@text='RESTART']")
+        restart_button = page.find((AppiumBy.XPATH, "//*[@text='RESTART']"))
         restart_button.click()
 
         print("⏳ Waiting for measurement to restart (10 seconds)...")
@@ -105,40 +158,46 @@ class TestDataCollectionWorkflow:
         print("="*80)
 
         print("\n📖 Navigating to Notify screen...")
-        notify_button = driver.find_element(AppiumBy.XPATH, "//*[@text='Notify']")
+        notify_button = page.find((AppiumBy.XPATH, "//*[@text='Notify']"))
         notify_button.click()
-        time.sleep(5)
+        page.wait_for_screen(ECG_STREAM, replaces=5)
 
         driver.save_screenshot('step4_notify_before_check.png')
 
         expected_elements = ["ECG", "IMU", "ACC", "Memory", "Heart Rate", "Battery"]
         print("\n🔍 Checking for active data streams...")
-
-        found_elements = []
-        for element_name in expected_elements:
+        check_started = time.monotonic()
+
+        # One page_source fetch per screen position instead of one XPath
+        # round-trip per stream
+        visible = set(page.snapshot().texts())
+        found_elements = [name for name in expected_elements if name in visible]
+        for element_name in found_elements:
+            print(f"✅ Found: {element_name}")
+
+        missing = [name for name in expected_elements if name not in found_elements]
+        # One device-side scrollIntoView per stream still missing; streams
+        # revealed along the way are picked up from the next snapshot
+        for element_name in list(missing):
+            if element_name not in missing:
+                continue
+            print(f"📜 Scrolling to find: {element_name}...")
             try:
-                driver.find_element(AppiumBy.XPATH, f"//*[@text='{element_name}']")
-                print(f"✅ Found: {element_name}")
-                found_elements.append(element_name)
+                if page.scroll_into_view((AppiumBy.XPATH, f"//*[@text='{element_name}']"),
+                                         max_swipes=3) is None:
+                    continue
+                visible = set(page.snapshot(refresh=True).texts())
             except Exception:
-                print(f"📜 Scrolling to find: {element_name}...")
-                found = False
-                for scroll_attempt in range(3):
-                    try:
-                        driver.execute_script('mobile: scrollGesture', {
-                            'left': 100, 'top': 800, 'width': 500, 'height': 1000,
-                            'direction': 'down', 'percent': 0.75
-                        })
-                        time.sleep(1)
-                        driver.find_element(AppiumBy.XPATH, f"//*[@text='{element_name}']")
-                        print(f"✅ Found after scroll (attempt {scroll_attempt + 1}): {element_name}")
-                        found_elements.append(element_name)
-                        found = True
-                        break
-                    except Exception:
-                        continue
-                if not found:
-                    print(f"❌ Missing: {element_name}")
+                continue
+            for name in [name for name in missing if name in visible]:
+                print(f"✅ Found after scroll: {name}")
+                found_elements.append(name)
+                missing.remove(name)
+        for element_name in missing:
+            print(f"❌ Missing: {element_name}")
+        found_elements.sort(key=expected_elements.index)
+        print(f"⏱️  Notify stream checks took {time.monotonic() - check_started:.1f}s "
+              f"(implicit wait {page.implicit_wait}s)")
 
         print(f"\n📊 Result: {len(found_elements)}/{len(expected_elements)} elements found")
         if len(found_elements) != len(expected_elements):
@@ -172,17 +231,13 @@ class TestDataCollectionWorkflow:
 
             def _keepalive():
                 try:
-                    adb_cmd = ['adb']
-                    if device_name:
-                        adb_cmd += ['-s', device_name]
-                    subprocess.run(adb_cmd + ['shell', 'input', 'keyevent', '224'],
-                                   timeout=5, capture_output=True)
-                except Exception:
+                    adb_shell(device_name).keyevent(224)
+                except AdbShellError:
                     pass
 
             def _recover_notify_screen():
                 try:
-                    notify_tab = driver.find_element(AppiumBy.XPATH, "//*[@text='Notify']")
+                    notify_tab = page.find((AppiumBy.XPATH, "//*[@text='Notify']"))
                     notify_tab.click()
                     time.sleep(2)
                     for _ in range(3):
@@ -195,106 +250,102 @@ class TestDataCollectionWorkflow:
                 except Exception as re:
                     print(f"⚠️  [RECOVER] Could not navigate to Notify: {re}")
 
-            # Scroll to top so Packet Number is visible
-            print("\n📜 Scrolling to top of screen...")
-            try:
-                for _ in range(3):
-                    driver.execute_script('mobile: scrollGesture', {
-                        'left': 100, 'top': 800, 'width': 500, 'height': 1000,
-                        'direction': 'up', 'percent': 0.75
-                    })
-                    time.sleep(0.5)
-            except Exception:
-                pass
-
-            current_packets = 0
-            consecutive_failures = 0
-            max_failures = 30
-
-            while current_packets < target_packets:
+            if packet_source == "logcat":
+                current_packets = _monitor_packets_logcat(target_packets, device_name)
+            else:
+                # Scroll to top so Packet Number is visible
+                print("\n📜 Scrolling to top of screen...")
                 try:
-                    packet_text = None
+                    for _ in range(3):
+                        driver.execute_script('mobile: scrollGesture', {
+                            'left': 100, 'top': 800, 'width': 500, 'height': 1000,
+                            'direction': 'up', 'percent': 0.75
+                        })
+                        time.sleep(0.5)
+                except Exception:
+                    pass
+
+                current_packets = 0
+                consecutive_failures = 0
+                max_failures = 30
 
+                while current_packets < target_packets:
                     try:
-                        packet_element = driver.find_element(
-                            AppiumBy.XPATH, "//*[contains(@text, 'Packet Number :')]"
-                        )
-                        packet_text = packet_element.text
-                    except Exception as e1:
+                        packet_text = None
+
                         try:
-                            all_texts = driver.find_elements(
-                                AppiumBy.CLASS_NAME, "android.widget.TextView"
+                            packet_element = page.find(
+                                (AppiumBy.XPATH, "//*[contains(@text, 'Packet Number :')]")
                             )
-                            for elem in all_texts:
-                                try:
-                                    text = elem.text
-                                    if text and 'Packet Number' in text:
+                            packet_text = packet_element.text
+                        except Exception as e1:
+                            try:
+                                for text in page.snapshot(refresh=True).texts("android.widget.TextView"):
+                                    if 'Packet Number' in text:
                                         packet_text = text
                                         break
-                                except Exception:
-                                    continue
-                            if not packet_text:
-                                raise Exception("Packet Number not found")
-                        except Exception as e2:
-                            # Session terminated — exit immediately, no point retrying
-                            if isinstance(e1, InvalidSessionIdException) or isinstance(e2, InvalidSessionIdException):
-                                print("\n❌ Appium session terminated — stopping packet monitoring")
-                                consecutive_failures = max_failures  # force exit
-                                break
-                            print(f"❌ [DEBUG] XPath failed: {str(e1)[:60]}")
-                            consecutive_failures += 1
-                            if consecutive_failures % 3 == 0:
-                                _keepalive()
-                                _recover_notify_screen()
-                            if consecutive_failures >= max_failures:
-                                print(f"\n⚠️  Too many failures ({consecutive_failures}), stopping")
-                                break
-
-                    if packet_text:
-                        consecutive_failures = 0
-                        match = re.search(r'Packet Number:\s*(\d+)', packet_text, re.IGNORECASE)
-                        if match:
-                            prev_packets = current_packets
-                            current_packets = int(match.group(1))
-                            print(f"📦 Packets: {prev_packets} → {current_packets} / {target_packets}")
-
-                            current_time = time.time()
-                            if current_time - last_log_time >= 60:
-                                elapsed = (current_time - start_time) / 60
-                                progress = (current_packets / target_packets) * 100
-                                remaining = target_packets - current_packets
-                                eta = remaining / max(current_packets / (elapsed + 0.001), 0.001)
-                                print(f"\n📊 Progress: {current_packets:,}/{target_packets:,} ({progress:.1f}%) | "
-                                      f"Elapsed: {elapsed:.1f}m | ETA: {eta:.1f}m\n")
-                                last_log_time = current_time
-                        else:
-                            print(f"⚠️  Could not parse: '{packet_text[:80]}'")
-
-                    if current_packets >= target_packets:
-                        total_time = (time.time() - start_time) / 60
-                        print(f"\n{'='*80}")
-                        print(f"✅ Target reached: {current_packets:,} packets in {total_time:.1f} minutes!")
-                        print(f"{'='*80}\n")
+                                if not packet_text:
+                                    raise Exception("Packet Number not found")
+                            except Exception as e2:
+                                # Session terminated — exit immediately, no point retrying
+                                if isinstance(e1, InvalidSessionIdException) or isinstance(e2, InvalidSessionIdException):
+                                    print("\n❌ Appium session terminated — stopping packet monitoring")
+                                    consecutive_failures = max_failures  # force exit
+                                    break
+                                print(f"❌ [DEBUG] XPath failed: {str(e1)[:60]}")
+                                consecutive_failures += 1
+                                if consecutive_failures % 3 == 0:
+                                    _keepalive()
+                                    _recover_notify_screen()
+                                if consecutive_failures >= max_failures:
+                                    print(f"\n⚠️  Too many failures ({consecutive_failures}), stopping")
+                                    break
+
+                        if packet_text:
+                            consecutive_failures = 0
+                            match = re.search(r'Packet Number:\s*(\d+)', packet_text, re.IGNORECASE)
+                            if match:
+                                prev_packets = current_packets
+                                current_packets = int(match.group(1))
+                                print(f"📦 Packets: {prev_packets} → {current_packets} / {target_packets}")
+
+                                current_time = time.time()
+                                if current_time - last_log_time >= 60:
+                                    elapsed = (current_time - start_time) / 60
+                                    progress = (current_packets / target_packets) * 100
+                                    remaining = target_packets - current_packets
+                                    eta = remaining / max(current_packets / (elapsed + 0.001), 0.001)
+                                    print(f"\n📊 Progress: {current_packets:,}/{target_packets:,} ({progress:.1f}%) | "
+                                          f"Elapsed: {elapsed:.1f}m | ETA: {eta:.1f}m\n")
+                                    last_log_time = current_time
+                            else:
+                                print(f"⚠️  Could not parse: '{packet_text[:80]}'")
+
+                        if current_packets >= target_packets:
+                            total_time = (time.time() - start_time) / 60
+                            print(f"\n{'='*80}")
+                            print(f"✅ Target reached: {current_packets:,} packets in {total_time:.1f} minutes!")
+                            print(f"{'='*80}\n")
+                            break
+
+                        current_time = time.time()
+                        if current_time - last_keepalive_time >= 30:
+                            _keepalive()
+                            last_keepalive_time = current_time
+
+                        time.sleep(check_interval)
+
+                    except InvalidSessionIdException:
+                        print("\n❌ Appium session terminated — stopping packet monitoring")
                         break
-
-                    current_time = time.time()
-                    if current_time - last_keepalive_time >= 30:
+                    except Exception as e:
+                        print(f"⚠️  Error: {e}")
+                        consecutive_failures += 1
+                        if consecutive_failures >= max_failures:
+                            print(f"\n⚠️  Too many failures, stopping packet monitoring")
+                            break
                         _keepalive()
-                        last_keepalive_time = current_time
-
-                    time.sleep(check_interval)
-
-                except InvalidSessionIdException:
-                    print("\n❌ Appium session terminated — stopping packet monitoring")
-                    break
-                except Exception as e:
-                    print(f"⚠️  Error: {e}")
-                    consecutive_failures += 1
-                    if consecutive_failures >= max_failures:
-                        print(f"\n⚠️  Too many failures, stopping packet monitoring")
-                        break
-                    _keepalive()
-                    time.sleep(check_interval)
+                        time.sleep(check_interval)
 
             try:
                 driver.save_screenshot('step4_notify_target_reached.png')
@@ -319,27 +370,23 @@ class TestDataCollectionWorkflow:
 
         def _keepalive_simple():
             try:
-                adb_cmd = ['adb']
-                if device_name:
-                    adb_cmd += ['-s', device_name]
-                subprocess.run(adb_cmd + ['shell', 'input', 'keyevent', '224'],
-                               timeout=5, capture_output=True)
-            except Exception:
+                adb_shell(device_name).keyevent(224)
+            except AdbShellError:
                 pass
 
         print("\n📖 Returning to WriteSet screen...")
         for _attempt in range(5):
             try:
-                writeset_button = driver.find_element(AppiumBy.XPATH, "//*[@text='WriteSet']")
+                writeset_button = page.find(WRITESET_TAB)
                 writeset_button.click()
                 break
             except Exception:
                 _keepalive_simple()
                 time.sleep(3)
-        time.sleep(3)
+        page.wait_for_screen(STOP_BUTTON, replaces=3)
 
         print("\n⏹️  Clicking STOP button...")
-        stop_button = driver.find_element(AppiumBy.XPATH, "//*[@text='STOP']")
+        stop_button = page.find(STOP_BUTTON)
         stop_button.click()
 
         print("⏳ Waiting for measurement to stop (5 seconds)...")
@@ -356,8 +403,10 @@ class TestDataCollectionWorkflow:
         print("="*80)
 
         print("\n🔄 Clicking RESET DEVICE button...")
-        reset_button = driver.find_element(AppiumBy.XPATH, "//*[@text='RESET DEVICE']")
+        reset_button = page.find((AppiumBy.XPATH, "//*[@text='RESET DEVICE']"))
         reset_button.click()
+        # The reset drops the BLE link; the next test reconnects on this session
+        driver_pool.invalidate(keep_session=True)
 
         print("⏳ Waiting for device reset (5 seconds)...")
         time.sleep(5)
@@ -1,9 +1,10 @@
 """Regression tests for SDK Sample app Read screen."""
+import os
 import pytest
-import time
-from appium.webdriver.common.appiumby import AppiumBy
 import re
+import time
 from packaging import version
+from tests.appium.pages.read_screen import ReadScreen
 
 
 def get_supported_sampling_rates(fw_version_str):
@@ -25,260 +26,117 @@ def get_supported_sampling_rates(fw_version_str):
     return [128, 256]
 
 
+@pytest.fixture(scope="module")
+def read_values(module_driver):
+    """Navigate to Read once and read every characteristic; tests share the result."""
+    driver = module_driver
+    print("\n" + "="*60)
+    print("📖 SETUP: Reading all characteristics")
+    print("="*60)
+    try:
+        driver.hide_keyboard()
+    except Exception:
+        pass
+
+    started = time.monotonic()
+    values = ReadScreen(driver).read_all()
+    read_count = sum(1 for v in values.values() if v)
+    print(f"\n✅ Read {read_count}/{len(values)} values in {time.monotonic() - started:.1f}s")
+    driver.save_screenshot('test_read_all.png')
+    return values
+
+
 class TestReadScreen:
     """Regression tests for Read screen — 7 characteristics + sampling rate info."""
 
-    def test_read_battery(self, connected_driver):
+    def test_read_battery(self, read_values):
         """Test reading battery level."""
         print("\n" + "="*60)
         print("🔋 TEST: Battery Level")
         print("="*60)
 
-        driver = connected_driver
-
-        try:
-            driver.hide_keyboard()
-        except Exception:
-            pass
-
-        print("\n📖 Navigating to Read screen...")
-        driver.find_element(AppiumBy.XPATH, "//*[@text='Read']").click()
-        time.sleep(3)
-
-        # Battery BLE service loads slower than DevInfo — poll up to 30s
-        print("\n🔋 Waiting for BATTERY button (up to 30s)...")
-        battery_button = None
-        for _wait in range(30):
-            try:
-                battery_button = driver.find_element(AppiumBy.XPATH, "//*[@text='BATTERY']")
-                print(f"✅ BATTERY button found after {_wait}s")
-                break
-            except Exception:
-                time.sleep(1)
-        if battery_button is None:
-            raise Exception("BATTERY button not found after 30 seconds")
-        battery_button.click()
-
-        print("⏳ Waiting for device response...")
-        time.sleep(5)
-        driver.save_screenshot('test_battery.png')
-
-        battery_value = driver.find_element(
-            AppiumBy.XPATH,
-            "//*[@text='Battery']/following-sibling::android.widget.TextView[1]"
-        )
-        battery_text = battery_value.text
+        battery_text = read_values['battery']
         print(f"\n✅ Battery Level: {battery_text}")
         assert battery_text, "Battery value is empty"
         assert any(c.isdigit() for c in battery_text), f"Battery value '{battery_text}' has no digits"
         print("✅ Test PASSED")
 
-    def test_read_model_number(self, connected_driver):
+    def test_read_model_number(self, read_values):
         """Test reading model number."""
         print("\n" + "="*60)
         print("📱 TEST: Model Number")
         print("="*60)
 
-        driver = connected_driver
-
-        print("\n📖 Navigating to Read screen...")
-        driver.find_element(AppiumBy.XPATH, "//*[@text='Read']").click()
-        time.sleep(3)
-
-        print("\n📱 Clicking MODEL NUMBER button...")
-        driver.find_element(AppiumBy.XPATH, "//*[@text='MODEL NUMBER']").click()
-
-        print("⏳ Waiting for device response...")
-        time.sleep(5)
-        driver.save_screenshot('test_model_number.png')
-
-        model_text = driver.find_element(
-            AppiumBy.XPATH,
-            "//*[@text='Model Number']/following-sibling::android.widget.TextView[1]"
-        ).text
+        model_text = read_values['model_number']
         print(f"\n✅ Model Number: {model_text}")
         assert model_text, "Model number is empty"
         print("✅ Test PASSED")
 
-    def test_read_serial_number(self, connected_driver):
+    def test_read_serial_number(self, read_values):
         """Test reading serial number."""
         print("\n" + "="*60)
         print("🔢 TEST: Serial Number")
         print("="*60)
 
-        driver = connected_driver
-
-        print("\n📖 Navigating to Read screen...")
-        driver.find_element(AppiumBy.XPATH, "//*[@text='Read']").click()
-        time.sleep(3)
-
-        print("\n🔢 Clicking SERIAL NUMBER button...")
-        driver.find_element(AppiumBy.XPATH, "//*[@text='SERIAL NUMBER']").click()
-
-        print("⏳ Waiting for device response...")
-        time.sleep(5)
-        driver.save_screenshot('test_serial_number.png')
-
-        import os
         serial_number = os.getenv("BLE_DEVICE_SERIAL", "")
-        serial_text = driver.find_element(
-            AppiumBy.XPATH,
-            "//*[@text='Serial Number']/following-sibling::android.widget.TextView[1]"
-        ).text
+        serial_text = read_values['serial_number']
         print(f"\n✅ Serial Number: {serial_text}")
         assert serial_text, "Serial number is empty"
         assert serial_number in serial_text, f"Expected serial {serial_number}, got {serial_text}"
         print("✅ Test PASSED")
 
-    def test_read_firmware_version(self, connected_driver):
+    def test_read_firmware_version(self, read_values):
         """Test reading firmware version."""
         print("\n" + "="*60)
         print("🔧 TEST: Firmware Version")
         print("="*60)
 
-        driver = connected_driver
-
-        print("\n📖 Navigating to Read screen...")
-        driver.find_element(AppiumBy.XPATH, "//*[@text='Read']").click()
-        time.sleep(3)
-
-        print("\n🔧 Clicking FIRMWARE VERSION button...")
-        driver.find_element(AppiumBy.XPATH, "//*[@text='FIRMWARE VERSION']").click()
-
-        print("⏳ Waiting for device response...")
-        time.sleep(5)
-        driver.save_screenshot('test_firmware_version.png')
-
-        fw_text = driver.find_element(
-            AppiumBy.XPATH,
-            "//*[@text='Firmware Version']/following-sibling::android.widget.TextView[1]"
-        ).text
+        fw_text = read_values['fw_version']
         print(f"\n✅ Firmware Version: {fw_text}")
         assert fw_text, "Firmware version is empty"
         assert re.search(r'\d+\.\d+\.\d+', fw_text), f"Firmware version '{fw_text}' not in expected format"
         print("✅ Test PASSED")
 
-    def test_read_hardware_version(self, connected_driver):
+    def test_read_hardware_version(self, read_values):
         """Test reading hardware version."""
         print("\n" + "="*60)
         print("⚙️  TEST: Hardware Version")
         print("="*60)
 
-        driver = connected_driver
-
-        print("\n📖 Navigating to Read screen...")
-        driver.find_element(AppiumBy.XPATH, "//*[@text='Read']").click()
-        time.sleep(3)
-
-        # Hardware Version is on first screen — no scroll needed
-        print("\n⚙️  Clicking HARDWARE VERSION button...")
-        driver.find_element(AppiumBy.XPATH, "//*[@text='HARDWARE VERSION']").click()
-
-        print("⏳ Waiting for device response...")
-        time.sleep(5)
-        driver.save_screenshot('test_hardware_version.png')
-
-        hw_text = driver.find_element(
-            AppiumBy.XPATH,
-            "//*[@text='Hardware Version']/following-sibling::android.widget.TextView[1]"
-        ).text
+        hw_text = read_values['hw_version']
         print(f"\n✅ Hardware Version: {hw_text}")
         assert hw_text, "Hardware version is empty"
         print("✅ Test PASSED")
 
-    def test_read_software_version(self, connected_driver):
+    def test_read_software_version(self, read_values):
         """Test reading software version."""
         print("\n" + "="*60)
         print("💿 TEST: Software Version")
         print("="*60)
 
-        driver = connected_driver
-
-        print("\n📖 Navigating to Read screen...")
-        driver.find_element(AppiumBy.XPATH, "//*[@text='Read']").click()
-        time.sleep(3)
-
-        # Software Version is below the fold — scroll down
-        print("\n📜 Scrolling down to find Software Version...")
-        driver.execute_script('mobile: scrollGesture', {
-            'left': 100, 'top': 800, 'width': 500, 'height': 1000,
-            'direction': 'down', 'percent': 0.75
-        })
-        time.sleep(1)
-
-        print("\n💿 Clicking SOFTWARE VERSION button...")
-        driver.find_element(AppiumBy.XPATH, "//*[@text='SOFTWARE VERSION']").click()
-
-        print("⏳ Waiting for device response...")
-        time.sleep(5)
-        driver.save_screenshot('test_software_version.png')
-
-        sw_text = driver.find_element(
-            AppiumBy.XPATH,
-            "//*[@text='Software Version']/following-sibling::android.widget.TextView[1]"
-        ).text
+        sw_text = read_values['sw_version']
         print(f"\n✅ Software Version: {sw_text}")
         assert sw_text, "Software version is empty"
         print("✅ Test PASSED")
 
-    def test_read_manufacture_name(self, connected_driver):
+    def test_read_manufacture_name(self, read_values):
         """Test reading manufacture name."""
         print("\n" + "="*60)
         print("🏭 TEST: Manufacture Name")
         print("="*60)
 
-        driver = connected_driver
-
-        print("\n📖 Navigating to Read screen...")
-        driver.find_element(AppiumBy.XPATH, "//*[@text='Read']").click()
-        time.sleep(3)
-
-        # Manufacture Name is below the fold — scroll down
-        print("\n📜 Scrolling down to find Manufacture Name...")
-        driver.execute_script('mobile: scrollGesture', {
-            'left': 100, 'top': 800, 'width': 500, 'height': 1000,
-            'direction': 'down', 'percent': 0.75
-        })
-        time.sleep(1)
-
-        print("\n🏭 Clicking MANUFACTURE NAME button...")
-        driver.find_element(AppiumBy.XPATH, "//*[@text='MANUFACTURE NAME']").click()
-
-        print("⏳ Waiting for device response...")
-        time.sleep(5)
-        driver.save_screenshot('test_manufacture_name.png')
-
-        mfr_text = driver.find_element(
-            AppiumBy.XPATH,
-            "//*[@text='Manufacture Name']/following-sibling::android.widget.TextView[1]"
-        ).text
+        mfr_text = read_values['manufacture_name']
         print(f"\n✅ Manufacture Name: {mfr_text}")
         assert mfr_text, "Manufacture name is empty"
         print("✅ Test PASSED")
 
-    def test_firmware_version_and_sampling_rates(self, connected_driver):
+    def test_firmware_version_and_sampling_rates(self, read_values):
         """Test firmware version and display supported sampling rates."""
         print("\n" + "="*60)
         print("🔧 TEST: Firmware Version & Supported Sampling Rates")
         print("="*60)
 
-        driver = connected_driver
-
-        print("\n📖 Navigating to Read screen...")
-        driver.find_element(AppiumBy.XPATH, "//*[@text='Read']").click()
-        time.sleep(3)
-
-        print("\n🔧 Clicking FIRMWARE VERSION button...")
-        driver.find_element(AppiumBy.XPATH, "//*[@text='FIRMWARE VERSION']").click()
-
-        print("⏳ Waiting for device response...")
-        time.sleep(5)
-        driver.save_screenshot('test_fw_and_sampling_rates.png')
-
-        fw_text = driver.find_element(
-            AppiumBy.XPATH,
-            "//*[@text='Firmware Version']/following-sibling::android.widget.TextView[1]"
-        ).text
+        fw_text = read_values['fw_version']
         print(f"\n✅ Firmware Version: {fw_text}")
         assert fw_text, "Firmware version is empty"
 